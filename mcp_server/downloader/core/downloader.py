@@ -10,6 +10,7 @@ import aiofiles
 import httpx
 from loguru import logger
 
+from ...shared.progress import ProgressCallback, ProgressReporter
 from .config import get_settings
 
 
@@ -142,6 +143,7 @@ class Downloader:
         urls: list[str],
         save_path: Optional[Path] = None,
         max_concurrent: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> list[dict[str, str]]:
         """批量下载文件
 
@@ -149,6 +151,7 @@ class Downloader:
             urls: URL列表
             save_path: 保存目录
             max_concurrent: 最大并发数（默认使用配置值）
+            on_progress: 进度回调，每个文件完成（成功或失败）后上报一次
 
         Returns:
             下载结果列表
@@ -159,10 +162,13 @@ class Downloader:
         logger.info(f"开始批量下载 {len(urls)} 个文件，并发数: {max_concurrent}")
 
         semaphore = asyncio.Semaphore(max_concurrent)
+        progress = ProgressReporter(on_progress, total=len(urls))
 
         async def download_with_semaphore(url: str) -> dict[str, str]:
             async with semaphore:
-                return await self.download(url, save_path)
+                result = await self.download(url, save_path)
+            await progress.step(result)
+            return result
 
         tasks = [download_with_semaphore(url) for url in urls]
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -9,11 +9,13 @@ Downloader MCP Server - 文件下载器
 - 支持并发下载和重试机制
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from loguru import logger
 
+from ..shared.output import get_payload_stats, shape_output
+from ..shared.progress import context_progress
 from .core.config import get_settings
 from .tools.download_tools import (
     download_file,
@@ -40,6 +42,7 @@ async def download_file_tool(
     url: str,
     save_path: Optional[str] = None,
     filename: Optional[str] = None,
+    compact: bool = False,
 ) -> str:
     """下载单个文件
 
@@ -47,11 +50,13 @@ async def download_file_tool(
         url: 文件URL
         save_path: 保存目录（可选）
         filename: 保存的文件名（可选）
+        compact: 紧凑输出（不缩进）
 
     Returns:
         JSON格式：{success, url, filepath, filename, size, message}
     """
-    return await download_file(url, save_path, filename)
+    result = await download_file(url, save_path, filename)
+    return shape_output("download_file", result, compact=compact)
 
 
 @server.tool(name="downloader_download_files")
@@ -59,18 +64,28 @@ async def download_files_tool(
     urls: list[str],
     save_path: Optional[str] = None,
     max_concurrent: Optional[int] = None,
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+    ctx: Context = None,
 ) -> str:
     """批量下载文件（支持并发）
 
+    每个文件完成后发送一次进度通知，消息为该文件的下载结果 {url, success, filepath, message}。
+
     Args:
         urls: 文件URL列表
         save_path: 保存目录（可选）
         max_concurrent: 最大并发数（可选）
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "success,failed,results.filepath"
+        compact: 紧凑输出（不缩进）
+        truncate: 按字段名截断长字符串，如 {"message": 200}（"*" 为其余字段的上限）
 
     Returns:
         JSON格式：{total, success, failed, results[{url, success, filepath, message}]}
     """
-    return await download_files(urls, save_path, max_concurrent)
+    result = await download_files(urls, save_path, max_concurrent, context_progress(ctx))
+    return shape_output("download_files", result, fields, compact, truncate)
 
 
 @server.tool(name="downloader_download_images_from_html")
@@ -79,19 +94,29 @@ async def download_images_from_html_tool(
     base_url: Optional[str] = None,
     save_path: Optional[str] = None,
     max_concurrent: Optional[int] = None,
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+    ctx: Context = None,
 ) -> str:
-    """从HTML中提取并下载所有图片
+    """从HTML中提取并下载所有图片（每张图片完成后发送进度通知）
 
     Args:
         html_content: HTML内容
         base_url: 基础URL（处理相对路径，可选）
         save_path: 保存目录（可选）
         max_concurrent: 最大并发数（可选）
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "success,failed,results.filepath"
+        compact: 紧凑输出（不缩进）
+        truncate: 按字段名截断长字符串，如 {"message": 200}（"*" 为其余字段的上限）
 
     Returns:
         JSON格式：{total, success, failed, results[{url, success, filepath, message}]}
     """
-    return await download_images_from_html(html_content, base_url, save_path, max_concurrent)
+    result = await download_images_from_html(
+        html_content, base_url, save_path, max_concurrent, context_progress(ctx)
+    )
+    return shape_output("download_images_from_html", result, fields, compact, truncate)
 
 
 @server.tool(name="downloader_download_images_from_url")
@@ -99,18 +124,36 @@ async def download_images_from_url_tool(
     page_url: str,
     save_path: Optional[str] = None,
     max_concurrent: Optional[int] = None,
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+    ctx: Context = None,
 ) -> str:
-    """从网页URL中提取并下载所有图片
+    """从网页URL中提取并下载所有图片（每张图片完成后发送进度通知）
 
     Args:
         page_url: 网页URL
         save_path: 保存目录（可选）
         max_concurrent: 最大并发数（可选）
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "success,failed,results.filepath"
+        compact: 紧凑输出（不缩进）
+        truncate: 按字段名截断长字符串，如 {"message": 200}（"*" 为其余字段的上限）
 
     Returns:
         JSON格式：{total, success, failed, results[{url, success, filepath, message}]}
     """
-    return await download_images_from_url(page_url, save_path, max_concurrent)
+    result = await download_images_from_url(page_url, save_path, max_concurrent, context_progress(ctx))
+    return shape_output("download_images_from_url", result, fields, compact, truncate)
+
+
+@server.tool(name="downloader_stats")
+async def stats_tool() -> str:
+    """获取服务运行统计
+
+    Returns:
+        JSON格式，包含：payload（各工具的输出大小与序列化耗时）
+    """
+    return shape_output("stats", {"payload": get_payload_stats().get_stats()})
 
 
 if __name__ == "__main__":
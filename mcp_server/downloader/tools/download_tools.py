@@ -1,11 +1,11 @@
-"""下载工具函数"""
+"""下载工具函数（返回结果字典，由 main.py 在 FastMCP 边界统一序列化）"""
 
-import json
 from pathlib import Path
 from typing import Any, Optional
 
 from loguru import logger
 
+from ...shared.progress import ProgressCallback
 from ..core.config import get_settings
 from ..core.downloader import Downloader
 from ..utils.helpers import extract_image_urls, sanitize_filename
@@ -15,7 +15,7 @@ async def download_file(
     url: str,
     save_path: Optional[str] = None,
     filename: Optional[str] = None,
-) -> str:
+) -> dict:
     """下载单个文件
 
     Args:
@@ -24,32 +24,34 @@ async def download_file(
         filename: 保存的文件名（可选，默认从URL提取）
 
     Returns:
-        JSON格式的下载结果
+        下载结果字典
     """
     async with Downloader() as downloader:
         save_dir = Path(save_path) if save_path else None
         result = await downloader.download(url, save_dir, filename)
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
 
 async def download_files(
     urls: list[str],
     save_path: Optional[str] = None,
     max_concurrent: Optional[int] = None,
-) -> str:
+    on_progress: Optional[ProgressCallback] = None,
+) -> dict:
     """批量下载文件
 
     Args:
         urls: 文件URL列表
         save_path: 保存目录路径（可选）
         max_concurrent: 最大并发下载数（可选）
+        on_progress: 进度回调，每个文件完成后上报该文件的下载结果（可选）
 
     Returns:
-        JSON格式的批量下载结果
+        批量下载结果字典
     """
     async with Downloader() as downloader:
         save_dir = Path(save_path) if save_path else None
-        results = await downloader.download_batch(urls, save_dir, max_concurrent)
+        results = await downloader.download_batch(urls, save_dir, max_concurrent, on_progress)
 
         # 添加统计信息
         success_count = sum(1 for r in results if r.get("success"))
@@ -60,7 +62,7 @@ async def download_files(
             "results": results,
         }
 
-        return json.dumps(summary, ensure_ascii=False, indent=2)
+        return summary
 
 
 async def download_images_from_html(
@@ -68,7 +70,8 @@ async def download_images_from_html(
     base_url: Optional[str] = None,
     save_path: Optional[str] = None,
     max_concurrent: Optional[int] = None,
-) -> str:
+    on_progress: Optional[ProgressCallback] = None,
+) -> dict:
     """从HTML内容中提取并下载所有图片
 
     Args:
@@ -76,9 +79,10 @@ async def download_images_from_html(
         base_url: 基础URL（用于处理相对路径）
         save_path: 保存目录路径（可选）
         max_concurrent: 最大并发下载数（可选）
+        on_progress: 进度回调，每张图片完成后上报该图片的下载结果（可选）
 
     Returns:
-        JSON格式的下载结果
+        下载结果字典
     """
     logger.info("开始从HTML中提取图片URL")
 
@@ -86,24 +90,20 @@ async def download_images_from_html(
     image_urls = extract_image_urls(html_content, base_url)
 
     if not image_urls:
-        return json.dumps(
-            {
-                "total": 0,
-                "success": 0,
-                "failed": 0,
-                "message": "未找到图片URL",
-                "results": [],
-            },
-            ensure_ascii=False,
-            indent=2,
-        )
+        return {
+            "total": 0,
+            "success": 0,
+            "failed": 0,
+            "message": "未找到图片URL",
+            "results": [],
+        }
 
     logger.info(f"找到 {len(image_urls)} 个图片URL")
 
     # 批量下载
     async with Downloader() as downloader:
         save_dir = Path(save_path) if save_path else None
-        results = await downloader.download_batch(image_urls, save_dir, max_concurrent)
+        results = await downloader.download_batch(image_urls, save_dir, max_concurrent, on_progress)
 
         # 添加统计信息
         success_count = sum(1 for r in results if r.get("success"))
@@ -114,23 +114,25 @@ async def download_images_from_html(
             "results": results,
         }
 
-        return json.dumps(summary, ensure_ascii=False, indent=2)
+        return summary
 
 
 async def download_images_from_url(
     page_url: str,
     save_path: Optional[str] = None,
     max_concurrent: Optional[int] = None,
-) -> str:
+    on_progress: Optional[ProgressCallback] = None,
+) -> dict:
     """从网页URL中提取并下载所有图片
 
     Args:
         page_url: 网页URL
         save_path: 保存目录路径（可选）
         max_concurrent: 最大并发下载数（可选）
+        on_progress: 进度回调，每张图片完成后上报该图片的下载结果（可选）
 
     Returns:
-        JSON格式的下载结果
+        下载结果字典
     """
     import httpx
 
@@ -148,19 +150,15 @@ async def download_images_from_url(
 
             # 使用提取的URL作为base_url
             return await download_images_from_html(
-                html_content, page_url, save_path, max_concurrent
+                html_content, page_url, save_path, max_concurrent, on_progress
             )
 
         except Exception as e:
             logger.error(f"获取网页内容失败: {e}")
-            return json.dumps(
-                {
-                    "total": 0,
-                    "success": 0,
-                    "failed": 0,
-                    "error": str(e),
-                    "message": f"获取网页内容失败: {e}",
-                },
-                ensure_ascii=False,
-                indent=2,
-            )
+            return {
+                "total": 0,
+                "success": 0,
+                "failed": 0,
+                "error": str(e),
+                "message": f"获取网页内容失败: {e}",
+            }
@@ -4,11 +4,12 @@ News Storage MCP Server - 新闻存储管理器
 提供新闻数据的持久化存储和检索功能
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 from mcp.server.fastmcp import FastMCP
 from loguru import logger
 
+from ..shared.output import get_payload_stats, shape_output
 from .tools.storage_tools import (
     batch_update_event_name_tool,
     delete_news_tool,
@@ -77,7 +78,7 @@ async def save_news(
         ...     local_image_paths='["./report/科技/2026-01-29/资讯汇总与摘要/事件1/img1.jpg"]'
         ... )
     """
-    return await save_news_tool(
+    result = await save_news_tool(
         title=title,
         url=url,
         summary=summary,
@@ -92,6 +93,7 @@ async def save_news(
         local_image_paths=local_image_paths,
         tags=tags,
     )
+    return shape_output("save_news", result)
 
 
 @server.tool(name="news_storage_save_batch")
@@ -104,20 +106,29 @@ async def save_news_batch(news_list: str) -> str:
     Returns:
         JSON格式：{success, added, updated, failed, total}
     """
-    return await save_news_batch_tool(news_list=news_list)
+    return shape_output("save_news_batch", await save_news_batch_tool(news_list=news_list))
 
 
 @server.tool(name="news_storage_get_by_url")
-async def get_news_by_url(url: str) -> str:
+async def get_news_by_url(
+    url: str,
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+) -> str:
     """根据URL获取新闻
 
     Args:
         url: 新闻URL
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "data.title,data.content"
+        compact: 紧凑输出（不缩进）
+        truncate: 按字段名截断长字符串，如 {"html_content": 0, "content": 2000}（"*" 为其余字段的上限）
 
     Returns:
         JSON格式的新闻数据，不存在返回null
     """
-    return await get_news_by_url_tool(url=url)
+    result = await get_news_by_url_tool(url=url)
+    return shape_output("get_news_by_url", result, fields, compact, truncate)
 
 
 @server.tool(name="news_storage_search")
@@ -130,6 +141,9 @@ async def search_news(
     tags: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
 ) -> str:
     """搜索新闻（支持多词空格分隔，自动分词搜索所有字段）
 
@@ -142,11 +156,14 @@ async def search_news(
         tags: 标签JSON数组
         limit: 返回数量
         offset: 偏移量
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "count,results.title,results.url,results.summary"
+        compact: 紧凑输出（不缩进）
+        truncate: 按字段名截断长字符串，如 {"html_content": 0, "content": 500}（"*" 为其余字段的上限）
 
     Returns:
         JSON格式：{success, count, results, filters}
     """
-    return await search_news_tool(
+    result = await search_news_tool(
         search=search,
         source=source,
         event_name=event_name,
@@ -156,20 +173,31 @@ async def search_news(
         limit=limit,
         offset=offset,
     )
+    return shape_output("search_news", result, fields, compact, truncate)
 
 
 @server.tool(name="news_storage_get_recent")
-async def get_recent_news(limit: int = 100, offset: int = 0) -> str:
+async def get_recent_news(
+    limit: int = 100,
+    offset: int = 0,
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+) -> str:
     """获取最近添加的新闻（按添加时间倒序）
 
     Args:
         limit: 返回数量
         offset: 偏移量
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "count,results.title,results.url"
+        compact: 紧凑输出（不缩进）
+        truncate: 按字段名截断长字符串，如 {"html_content": 0, "content": 500}（"*" 为其余字段的上限）
 
     Returns:
         JSON格式的新闻列表
     """
-    return await get_recent_news_tool(limit=limit, offset=offset)
+    result = await get_recent_news_tool(limit=limit, offset=offset)
+    return shape_output("get_recent_news", result, fields, compact, truncate)
 
 
 @server.tool(name="news_storage_update_content")
@@ -184,9 +212,10 @@ async def update_news_content(url: str, content: str, html_content: str = "") ->
     Returns:
         JSON格式的操作结果
     """
-    return await update_news_content_tool(
+    result = await update_news_content_tool(
         url=url, content=content, html_content=html_content
     )
+    return shape_output("update_news_content", result)
 
 
 @server.tool(name="news_storage_delete")
@@ -199,7 +228,7 @@ async def delete_news(url: str) -> str:
     Returns:
         JSON格式的操作结果
     """
-    return await delete_news_tool(url=url)
+    return shape_output("delete_news", await delete_news_tool(url=url))
 
 
 @server.tool(name="news_storage_stats")
@@ -207,9 +236,11 @@ async def get_news_stats() -> str:
     """获取统计信息
 
     Returns:
-        JSON格式的统计数据
+        JSON格式的统计数据，另含 payload（各工具的输出大小与序列化耗时）
     """
-    return await get_news_stats_tool()
+    result = await get_news_stats_tool()
+    result["payload"] = get_payload_stats().get_stats()
+    return shape_output("get_news_stats", result)
 
 
 @server.tool(name="news_storage_update_event_name")
@@ -223,7 +254,7 @@ async def update_event_name(url: str, event_name: str) -> str:
     Returns:
         JSON格式的操作结果
     """
-    return await update_event_name_tool(url=url, event_name=event_name)
+    return shape_output("update_event_name", await update_event_name_tool(url=url, event_name=event_name))
 
 
 @server.tool(name="news_storage_batch_update_event_name")
@@ -237,7 +268,8 @@ async def batch_update_event_name(urls: str, event_name: str) -> str:
     Returns:
         JSON格式：{success, updated, failed, event_name}
     """
-    return await batch_update_event_name_tool(urls=urls, event_name=event_name)
+    result = await batch_update_event_name_tool(urls=urls, event_name=event_name)
+    return shape_output("batch_update_event_name", result)
 
 
 if __name__ == "__main__":
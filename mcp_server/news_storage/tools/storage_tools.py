@@ -1,5 +1,7 @@
 """
 新闻存储工具函数
+
+工具函数返回结果字典，由 main.py 在 FastMCP 边界统一序列化
 """
 
 import json
@@ -24,7 +26,7 @@ async def save_news_tool(
     image_urls: str = "[]",
     local_image_paths: str = "[]",
     tags: str = "[]",
-) -> str:
+) -> dict:
     """保存单条新闻 - 💾 自动去重（基于URL）
 
     功能：
@@ -50,7 +52,7 @@ async def save_news_tool(
         tags: 标签 JSON数组（可选）
 
     Returns:
-        JSON格式的操作结果，包含：
+        操作结果，包含：
         - success: 是否成功
         - action: "inserted" 或 "updated"
         - message: 结果消息
@@ -121,16 +123,14 @@ async def save_news_tool(
         }
 
         logger.info(f"✅ {message}: {title[:50]}")
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 保存新闻失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
 
 
-async def save_news_batch_tool(news_list: str) -> str:
+async def save_news_batch_tool(news_list: str) -> dict:
     """批量保存新闻 - 📦 高效批量导入
 
     功能：
@@ -152,7 +152,7 @@ async def save_news_batch_tool(news_list: str) -> str:
             ]
 
     Returns:
-        JSON格式的批量操作结果，包含：
+        批量操作结果，包含：
         - success: 是否成功
         - added: 新增数量
         - updated: 更新数量
@@ -202,16 +202,14 @@ async def save_news_batch_tool(news_list: str) -> str:
         }
 
         logger.info(f"✅ 批量保存完成: {result}")
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 批量保存失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
 
 
-async def get_news_by_url_tool(url: str) -> str:
+async def get_news_by_url_tool(url: str) -> dict:
     """根据URL获取新闻 - 🔍 精确查询
 
     功能：
@@ -222,7 +220,7 @@ async def get_news_by_url_tool(url: str) -> str:
         url: 新闻URL
 
     Returns:
-        JSON格式的新闻数据，不存在则返回null
+        新闻数据字典（不存在时 data 为 None）
 
     Examples:
         >>> get_news_by_url_tool("https://example.com/news/123")
@@ -246,13 +244,11 @@ async def get_news_by_url_tool(url: str) -> str:
             }
             logger.info(f"⚠️ 未找到新闻: {url[:50]}")
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 查询失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
 
 
 async def search_news_tool(
@@ -264,7 +260,7 @@ async def search_news_tool(
     tags: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
-) -> str:
+) -> dict:
     """搜索新闻 - 🔎 智能搜索，一个参数搞定所有
 
     【核心特性】
@@ -287,7 +283,7 @@ async def search_news_tool(
         offset: 偏移量（默认0，用于分页）
 
     Returns:
-        JSON格式的搜索结果，包含：
+        搜索结果，包含：
         - success: 是否成功
         - count: 结果数量
         - results: 新闻列表
@@ -360,16 +356,14 @@ async def search_news_tool(
         }
 
         logger.info(f"✅ 搜索完成: 找到 {len(results)} 条结果")
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 搜索失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
 
 
-async def get_recent_news_tool(limit: int = 100, offset: int = 0) -> str:
+async def get_recent_news_tool(limit: int = 100, offset: int = 0) -> dict:
     """获取最近添加的新闻 - 📰 最新资讯
 
     功能：
@@ -382,7 +376,7 @@ async def get_recent_news_tool(limit: int = 100, offset: int = 0) -> str:
         offset: 偏移量（默认0，用于分页）
 
     Returns:
-        JSON格式的新闻列表
+        新闻列表
 
     Examples:
         >>> # 获取最近100条新闻
@@ -401,18 +395,16 @@ async def get_recent_news_tool(limit: int = 100, offset: int = 0) -> str:
         }
 
         logger.info(f"✅ 获取最近新闻: {len(results)} 条")
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 获取失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
 
 
 async def update_news_content_tool(
     url: str, content: str, html_content: str = ""
-) -> str:
+) -> dict:
     """更新新闻内容 - ✏️ 补充完整内容
 
     功能：
@@ -425,7 +417,7 @@ async def update_news_content_tool(
         html_content: HTML内容（可选）
 
     Returns:
-        JSON格式的操作结果
+        操作结果
 
     Examples:
         >>> update_news_content_tool(
@@ -448,16 +440,14 @@ async def update_news_content_tool(
         else:
             logger.warning(f"⚠️ 更新失败: {url[:50]}")
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 更新失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
 
 
-async def delete_news_tool(url: str) -> str:
+async def delete_news_tool(url: str) -> dict:
     """删除新闻 - 🗑️ 从数据库删除
 
     功能：
@@ -468,7 +458,7 @@ async def delete_news_tool(url: str) -> str:
         url: 新闻URL
 
     Returns:
-        JSON格式的操作结果
+        操作结果
 
     Examples:
         >>> delete_news_tool("https://example.com/news/123")
@@ -487,16 +477,14 @@ async def delete_news_tool(url: str) -> str:
         else:
             logger.warning(f"⚠️ 删除失败: {url[:50]}")
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 删除失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
 
 
-async def get_news_stats_tool() -> str:
+async def get_news_stats_tool() -> dict:
     """获取统计信息 - 📊 数据概览
 
     功能：
@@ -504,7 +492,7 @@ async def get_news_stats_tool() -> str:
     - 总数、来源分布、近期新增等
 
     Returns:
-        JSON格式的统计数据
+        统计数据
 
     Examples:
         >>> get_news_stats_tool()
@@ -519,16 +507,14 @@ async def get_news_stats_tool() -> str:
         }
 
         logger.info(f"✅ 统计信息: 总数 {stats['total']}")
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 获取统计失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
 
 
-async def update_event_name_tool(url: str, event_name: str) -> str:
+async def update_event_name_tool(url: str, event_name: str) -> dict:
     """更新新闻的事件名称 - 🏷️ 聚合后归类
 
     功能：
@@ -541,7 +527,7 @@ async def update_event_name_tool(url: str, event_name: str) -> str:
         event_name: 事件名称
 
     Returns:
-        JSON格式的操作结果
+        操作结果
 
     Examples:
         >>> # 为新闻添加事件名称
@@ -566,16 +552,14 @@ async def update_event_name_tool(url: str, event_name: str) -> str:
         else:
             logger.warning(f"⚠️ 更新失败: {url[:50]}")
 
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 更新事件名称失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
 
 
-async def batch_update_event_name_tool(urls: str, event_name: str) -> str:
+async def batch_update_event_name_tool(urls: str, event_name: str) -> dict:
     """批量更新新闻的事件名称 - 📦 批量归类
 
     功能：
@@ -588,7 +572,7 @@ async def batch_update_event_name_tool(urls: str, event_name: str) -> str:
         event_name: 事件名称
 
     Returns:
-        JSON格式的批量操作结果，包含：
+        批量操作结果，包含：
         - success: 是否成功
         - updated: 更新数量
         - failed: 失败数量
@@ -606,11 +590,7 @@ async def batch_update_event_name_tool(urls: str, event_name: str) -> str:
         url_list = json.loads(urls) if urls else []
 
         if not url_list:
-            return json.dumps(
-                {"success": False, "error": "URL列表为空"},
-                ensure_ascii=False,
-                indent=2,
-            )
+            return {"success": False, "error": "URL列表为空"}
 
         stats = await db.batch_update_event_name(url_list, event_name)
 
@@ -623,10 +603,8 @@ async def batch_update_event_name_tool(urls: str, event_name: str) -> str:
         }
 
         logger.info(f"✅ 批量更新事件名称完成: {stats}")
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"❌ 批量更新事件名称失败: {e}")
-        return json.dumps(
-            {"success": False, "error": str(e)}, ensure_ascii=False, indent=2
-        )
+        return {"success": False, "error": str(e)}
@@ -0,0 +1,23 @@
+"""
+三个 MCP Server（web_browser、downloader、news_storage）共用的辅助模块
+
+- progress: MCP 进度通知（长时间运行的工具逐步上报部分结果）
+- output: 工具输出控制（字段投影、紧凑模式、按字段截断）与输出大小统计
+- serialization: JSON 序列化（优先使用 orjson），工具结果只在 FastMCP 边界序列化一次
+"""
+
+from .output import OutputOptions, PayloadStats, get_payload_stats, shape_output
+from .progress import ProgressCallback, ProgressReporter, context_progress
+from .serialization import HAS_ORJSON, dumps
+
+__all__ = [
+    "OutputOptions",
+    "PayloadStats",
+    "get_payload_stats",
+    "shape_output",
+    "ProgressCallback",
+    "ProgressReporter",
+    "context_progress",
+    "HAS_ORJSON",
+    "dumps",
+]
@@ -0,0 +1,173 @@
+"""工具输出控制 - 字段投影、紧凑模式和按字段截断
+
+工具默认返回完整对象的缩进 JSON：新闻搜索最多 100 条、每条带 content 和 html_content，
+文章抓取带全文和 status.checks 等诊断信息。这些动辄上百 KB 的结果序列化慢、经 stdio 传输慢，
+交给 LLM 时还占用大量上下文。所有读取类工具都支持三个输出参数：
+
+- fields: 只保留指定字段，逗号分隔，嵌套字段用点号（列表会逐项投影），
+  如 ``"total,results.title,results.url"``
+- compact: 不缩进，并去掉诊断数组（checks / issues / suggestions）
+- truncate: 按字段名截断长字符串 ``{"content": 2000, "html_content": 0}``，``"*"`` 为其余字段的默认上限
+
+工具函数返回结果对象，这里按参数处理后用 ``serialization.dumps`` 序列化，每次调用只序列化一次。
+处理时不修改原对象（结果可能同时被缓存或被合并的并发调用共享）。
+每次调用都会记录输出大小和序列化耗时，供统计工具查看。
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .serialization import dumps
+
+# compact 模式下去掉的诊断数组
+DIAGNOSTIC_KEYS = frozenset({"checks", "issues", "suggestions"})
+
+# 字段投影时始终保留的顶层字段（失败信息不能被投影掉）
+ALWAYS_KEEP = ("success", "error")
+
+# 截断后的标记，{} 为被截掉的字符数
+TRUNCATION_MARK = "...[已截断 {} 字符]"
+
+
+def _parse_fields(fields: str) -> Dict[str, dict]:
+    """字段列表转换为字段树 {"results": {"title": {}, "url": {}}}（空字典表示保留整个值）"""
+    tree: Dict[str, dict] = {}
+    for path in fields.split(","):
+        parts = [part for part in path.strip().split(".") if part]
+        if not parts:
+            continue
+        node = tree
+        for part in parts[:-1]:
+            if part in node and not node[part]:
+                break  # 已声明保留整个值
+            node = node.setdefault(part, {})
+        else:
+            # 整个值优先于子字段（"results" 与 "results.title" 同时出现时保留完整的 results）
+            node[parts[-1]] = {}
+    return tree
+
+
+def _project(value: Any, tree: Dict[str, dict]) -> Any:
+    """按字段树投影（列表逐项投影）"""
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: _project(value[key], sub) for key, sub in tree.items() if key in value}
+    return value
+
+
+@dataclass
+class OutputOptions:
+    """一次工具调用的输出参数"""
+    fields: Optional[str] = None
+    compact: bool = False
+    truncate: Optional[Dict[str, int]] = None
+
+    @property
+    def is_default(self) -> bool:
+        return not self.fields and not self.compact and not self.truncate
+
+    def apply(self, data: Any) -> Any:
+        """对结果执行投影、诊断字段剔除和截断（返回新对象，不修改原对象）"""
+        if self.fields:
+            tree = _parse_fields(self.fields)
+            if isinstance(data, dict):
+                projected = _project(data, tree)
+                for key in ALWAYS_KEEP:
+                    if key in data and key not in projected:
+                        projected[key] = data[key]
+                data = projected
+            else:
+                data = _project(data, tree)
+
+        truncated: set = set()
+        data = self._walk(data, None, truncated)
+        if truncated and isinstance(data, dict):
+            data["truncated_fields"] = sorted(truncated)
+        return data
+
+    def _walk(self, value: Any, key: Optional[str], truncated: set) -> Any:
+        if isinstance(value, dict):
+            return {
+                k: self._walk(v, k, truncated)
+                for k, v in value.items()
+                if not (self.compact and k in DIAGNOSTIC_KEYS)
+            }
+        if isinstance(value, list):
+            return [self._walk(item, key, truncated) for item in value]
+        if isinstance(value, str) and self.truncate:
+            limit = self.truncate.get(key, self.truncate.get("*"))
+            if limit is not None and len(value) > max(0, limit):
+                limit = max(0, limit)
+                truncated.add(key or "*")
+                return value[:limit] + TRUNCATION_MARK.format(len(value) - limit)
+        return value
+
+
+class PayloadStats:
+    """各工具的输出大小统计（字节，UTF-8）"""
+
+    def __init__(self):
+        self._tools: Dict[str, dict] = {}
+
+    def record(self, tool: str, output_bytes: int, serialize_ms: float, shaped: bool) -> None:
+        stats = self._tools.setdefault(
+            tool,
+            {"calls": 0, "shaped_calls": 0, "output_bytes": 0, "max_output_bytes": 0, "serialize_ms": 0.0},
+        )
+        stats["calls"] += 1
+        stats["shaped_calls"] += int(shaped)
+        stats["output_bytes"] += output_bytes
+        stats["max_output_bytes"] = max(stats["max_output_bytes"], output_bytes)
+        stats["serialize_ms"] += serialize_ms
+
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        result = {}
+        for tool, stats in sorted(self._tools.items()):
+            result[tool] = {
+                **stats,
+                "serialize_ms": round(stats["serialize_ms"], 2),
+                "avg_output_bytes": stats["output_bytes"] // stats["calls"],
+            }
+        return result
+
+
+# 全局统计实例（每个 MCP Server 进程一份）
+_payload_stats = PayloadStats()
+
+
+def get_payload_stats() -> PayloadStats:
+    """获取全局输出大小统计"""
+    return _payload_stats
+
+
+def shape_output(
+    tool: str,
+    data: Any,
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+) -> str:
+    """按输出参数处理工具结果并序列化（FastMCP 边界唯一的一次序列化），记录输出大小
+
+    Args:
+        tool: 工具名（统计用）
+        data: 工具函数返回的结果对象
+        fields: 保留的字段（逗号分隔，嵌套字段用点号）
+        compact: 紧凑输出（不缩进，去掉诊断数组）
+        truncate: 按字段名的最大字符数，"*" 为默认上限
+
+    Returns:
+        JSON 字符串
+    """
+    options = OutputOptions(fields=fields, compact=compact, truncate=truncate)
+    start = time.perf_counter()
+    shaped = not options.is_default
+    output = dumps(options.apply(data) if shaped else data, compact=compact)
+    serialize_ms = (time.perf_counter() - start) * 1000
+    _payload_stats.record(tool, len(output.encode("utf-8")), serialize_ms, shaped)
+    return output
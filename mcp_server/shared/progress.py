@@ -0,0 +1,77 @@
+"""MCP 进度通知 - 长时间运行的工具逐步上报部分结果
+
+降级搜索链、批量文章抓取和批量下载都要在全部完成后才返回，客户端看起来像卡住，
+还经常触发超时。工具函数接收一个可选的进度回调，每完成一步（一个引擎、一篇文章、
+一个文件）就上报一次进度，消息中附带该步的部分结果（紧凑 JSON），
+Agent 可以提前使用已返回的结果，或取消剩余的工作。
+
+工具函数只依赖 ``ProgressCallback`` 类型，不依赖 MCP；注册工具时用
+``context_progress(ctx)`` 把 FastMCP 的 Context 转换为回调。
+"""
+
+from typing import Any, Awaitable, Callable, Optional
+
+from loguru import logger
+
+from .serialization import dumps
+
+# 进度回调：(已完成量, 总量（未知时为 None）, 部分结果) -> None
+ProgressCallback = Callable[[float, Optional[float], Any], Awaitable[None]]
+
+# 单条进度消息的最大长度（字符），超出时截断
+MAX_MESSAGE_LENGTH = 4000
+
+
+def _to_message(payload: Any) -> str:
+    """部分结果转换为进度消息（字符串原样使用，其他值序列化为紧凑 JSON）"""
+    message = payload if isinstance(payload, str) else dumps(payload, compact=True)
+    if len(message) > MAX_MESSAGE_LENGTH:
+        message = message[: MAX_MESSAGE_LENGTH - 3] + "..."
+    return message
+
+
+def context_progress(ctx) -> Optional[ProgressCallback]:
+    """把 FastMCP 的 Context 转换为进度回调
+
+    Args:
+        ctx: FastMCP 注入的 Context（为 None 时返回 None）
+
+    Returns:
+        进度回调；客户端没有请求进度（没有 progressToken）时 Context 会忽略通知
+    """
+    if ctx is None:
+        return None
+
+    async def report(progress: float, total: Optional[float], payload: Any) -> None:
+        await ctx.report_progress(progress, total, _to_message(payload))
+
+    return report
+
+
+class ProgressReporter:
+    """累计进度并调用回调（回调为 None 时什么也不做，上报失败不影响工具本身）"""
+
+    def __init__(self, callback: Optional[ProgressCallback] = None, total: Optional[float] = None):
+        """
+        Args:
+            callback: 进度回调
+            total: 总量（未知时为 None）
+        """
+        self.callback = callback
+        self.total = total
+        self.progress = 0.0
+
+    async def step(self, payload: Any, advance: float = 1.0) -> None:
+        """完成一步并上报
+
+        Args:
+            payload: 该步的部分结果
+            advance: 进度增量
+        """
+        self.progress += advance
+        if self.callback is None:
+            return
+        try:
+            await self.callback(self.progress, self.total, payload)
+        except Exception as e:
+            logger.debug(f"进度通知发送失败: {e}")
@@ -0,0 +1,51 @@
+"""工具结果序列化 - 三个 MCP Server 共用的 JSON 编码器
+
+工具函数内部传递结果对象（dict / TypedDict / dataclass），只在 FastMCP 边界序列化一次。
+默认使用 orjson（项目依赖，比标准库快数倍，直接输出 UTF-8），未安装时退回标准库 json；
+两者输出的 JSON 等价（中文不转义，缩进 2 个空格或紧凑格式）。
+"""
+
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # 环境中缺少 orjson 时退回标准库
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def _default(obj: Any) -> Any:
+    """标准库 json 和 orjson 都无法直接编码的对象"""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"无法序列化的类型: {type(obj).__name__}")
+
+
+def dumps(obj: Any, compact: bool = False) -> str:
+    """序列化为 JSON 字符串
+
+    Args:
+        obj: 结果对象
+        compact: 为 True 时不缩进（紧凑格式），否则缩进 2 个空格
+
+    Returns:
+        JSON 字符串（中文不转义）
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+        except TypeError:
+            pass  # 超出 orjson 支持范围的值（如超过 64 位的整数），交给标准库
+    if compact:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default)
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=_default)
@@ -15,16 +15,34 @@ Web Browser MCP Server - 智能浏览器与搜索工具
 
 __version__ = "0.2.0"
 
-from .config.settings import Settings, get_settings
-from .core import RateLimiter, BrowserPool, get_browser_pool
-from .engines import BaseEngine, EngineFactory
-
-__all__ = [
-    "Settings",
-    "get_settings",
-    "RateLimiter",
-    "BrowserPool",
-    "get_browser_pool",
-    "BaseEngine",
-    "EngineFactory",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config.settings import Settings, get_settings
+    from .core import RateLimiter, BrowserPool, get_browser_pool
+    from .engines import BaseEngine, EngineFactory
+
+# 包级导出按需导入：正文提取 worker 以 ``-m mcp_server.web_browser.utils.extraction_worker``
+# 启动时会先执行本文件，这里不能导入浏览器池、HTTP 客户端、缓存和引擎等服务端模块
+_EXPORTS = {
+    "Settings": ".config.settings",
+    "get_settings": ".config.settings",
+    "RateLimiter": ".core",
+    "BrowserPool": ".core",
+    "get_browser_pool": ".core",
+    "BaseEngine": ".engines",
+    "EngineFactory": ".engines",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """首次访问包级导出时导入对应模块"""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
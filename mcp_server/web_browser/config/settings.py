@@ -1,7 +1,7 @@
 """集中配置管理 - 使用 Pydantic 进行配置验证"""
 
 from functools import lru_cache
-from typing import Optional, List
+from typing import Dict, Optional, List, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,7 +20,7 @@ class Settings(BaseSettings):
     # ========== 浏览器配置 ==========
     max_concurrent_browsers: int = Field(
         default=2,
-        description="最大并发浏览器数量",
+        description="最大并发浏览器数量（浏览器进程数，按需启动）",
         ge=1,
         le=10,
     )
@@ -32,20 +32,69 @@ class Settings(BaseSettings):
     )
     max_context_pool_size: int = Field(
         default=10,
-        description="最大上下文池大小",
+        description="最大上下文池大小（所有浏览器合计）",
         ge=1,
         le=50,
     )
+    max_pages_per_context: int = Field(
+        default=2,
+        description="每个上下文最大同时打开的页面数",
+        ge=1,
+        le=10,
+    )
+    page_max_uses: int = Field(
+        default=20,
+        description="页面最大复用次数（超过后关闭并重新创建）",
+        ge=1,
+    )
+    warm_pages_per_context: int = Field(
+        default=1,
+        description="新建上下文时预热的空白页面数",
+        ge=0,
+        le=10,
+    )
     context_max_idle_time: int = Field(
         default=300,
         description="上下文最大空闲时间（秒）",
         ge=60,
     )
+    resource_blocking_mode: Literal["native", "route"] = Field(
+        default="native",
+        description="资源拦截模式：native（规则下推到浏览器，零 Python 往返）| route（逐请求 Python 判断）",
+    )
+    native_type_fallback: bool = Field(
+        default=True,
+        description="native 模式下按资源类型兜底拦截无扩展名的图片/字体/媒体（每个被拦截请求经 CDP 进入 Python 一次）；关闭后只按扩展名在浏览器内拦截",
+    )
+    tracker_blocklist_file: Optional[str] = Field(
+        default=None,
+        description="额外的追踪/广告域名列表文件（每行一个域名，与内置列表合并）",
+    )
+    article_block_mode: Literal["default", "trackers", "first_party"] = Field(
+        default="trackers",
+        description="文章页默认拦截模式：default（仅资源类型）| trackers（加拦截追踪/广告域名）| first_party（只放行站点自身域名和常见 CDN）",
+    )
     headless: bool = Field(
         default=True,
         description="是否使用无头模式",
     )
 
+    # ========== 启动预热配置 ==========
+    warm_start: bool = Field(
+        default=True,
+        description="服务启动后在后台预热：启动浏览器并创建常用引擎的上下文、预热正文提取进程池",
+    )
+    warm_start_contexts: int = Field(
+        default=2,
+        description="启动时预先创建上下文的引擎数（按当前引擎排序取前几个，0 表示只启动浏览器）",
+        ge=0,
+        le=10,
+    )
+    warm_start_preconnect: bool = Field(
+        default=False,
+        description="启动时预连接已启用引擎的主机（DNS 解析、TCP/TLS 握手，连接留在 HTTP 连接池中复用）",
+    )
+
     # ========== 速率限制配置 ==========
     rate_limit_time_window: float = Field(
         default=1.0,
@@ -62,6 +111,232 @@ class Settings(BaseSettings):
         description="同一引擎每秒最大请求数",
         ge=1,
     )
+    rate_limit_burst: Optional[int] = Field(
+        default=None,
+        description="突发容量（空闲后可连续放行的请求数），为空时等于每个键的每秒最大请求数",
+        ge=1,
+    )
+    rate_limit_overrides: Dict[str, float] = Field(
+        default={},
+        description='按域名或引擎ID覆盖每个时间窗口的最大请求数，如 {"google": 0.5, "www.baidu.com": 1}',
+    )
+
+    # ========== HTTP 快速路径配置 ==========
+    http_fast_path_enabled: bool = Field(
+        default=True,
+        description="服务端渲染的引擎优先使用 HTTP 抓取，被拦截或结果为空时再升级到浏览器",
+    )
+    http_timeout: float = Field(
+        default=10.0,
+        description="HTTP 请求超时时间（秒）",
+        ge=1.0,
+        le=60.0,
+    )
+    http_max_body_bytes: int = Field(
+        default=5 * 1024 * 1024,
+        description="HTTP 快速路径读取的最大响应体（字节，解压后），超过时放弃并升级到浏览器",
+        ge=64 * 1024,
+        le=100 * 1024 * 1024,
+    )
+    http_max_connections: int = Field(
+        default=100,
+        description="HTTP 连接池最大连接数",
+        ge=1,
+        le=1000,
+    )
+
+    article_fetch_mode: Literal["auto", "http", "browser"] = Field(
+        default="auto",
+        description="文章抓取模式：auto（先 HTTP，质量不足再用浏览器）| http | browser",
+    )
+    article_http_min_quality: Literal["poor", "warning", "acceptable", "good"] = Field(
+        default="acceptable",
+        description="auto 模式下 HTTP 层提取结果的最低内容质量，低于该等级时升级到浏览器",
+    )
+
+    # ========== 批量文章抓取配置 ==========
+    batch_max_concurrency: int = Field(
+        default=4,
+        description="批量抓取文章的默认并发数",
+        ge=1,
+        le=32,
+    )
+    batch_max_concurrency_limit: int = Field(
+        default=8,
+        description="批量抓取时调用方可以指定的最大并发数",
+        ge=1,
+        le=32,
+    )
+    batch_per_domain_concurrency: int = Field(
+        default=1,
+        description="批量抓取时同一域名同时进行的请求数",
+        ge=1,
+        le=8,
+    )
+    batch_deadline: float = Field(
+        default=120.0,
+        description="批量抓取的默认截止时间（秒）",
+        ge=5.0,
+        le=600.0,
+    )
+    batch_max_urls: int = Field(
+        default=50,
+        description="单次批量抓取最多处理的URL数",
+        ge=1,
+        le=500,
+    )
+
+    # ========== 正文提取配置 ==========
+    extraction_workers: int = Field(
+        default=2,
+        description="正文提取 worker 进程数（0 表示不使用进程池，在线程中执行）",
+        ge=0,
+        le=32,
+    )
+    extraction_timeout: float = Field(
+        default=20.0,
+        description="单次正文/图片提取超时时间（秒，从 worker 开始执行时计时），超时后只终止该 worker",
+        ge=1.0,
+        le=120.0,
+    )
+    extraction_max_pending: int = Field(
+        default=16,
+        description="最多同时准入的提取任务数（含等待空闲 worker 的任务，超出时排队等待）",
+        ge=1,
+        le=256,
+    )
+    extraction_max_tasks_per_child: int = Field(
+        default=200,
+        description="每个 worker 处理多少个任务后重启（释放解析库的内存，0 表示不重启）",
+        ge=0,
+    )
+
+    # ========== 多引擎并发搜索配置 ==========
+    fanout_engines: int = Field(
+        default=3,
+        description="fanout 模式同时查询的引擎数",
+        ge=1,
+        le=10,
+    )
+    fanout_min_engines: int = Field(
+        default=2,
+        description="fanout 模式至少等待多少个引擎成功返回后才能提前结束（去重结果已足够时）",
+        ge=1,
+        le=10,
+    )
+    fanout_deadline: float = Field(
+        default=20.0,
+        description="fanout 模式的截止时间（秒），到期后取消仍未返回的引擎并合并已有结果",
+        ge=1.0,
+        le=120.0,
+    )
+    fanout_rrf_k: int = Field(
+        default=60,
+        description="倒数排名融合（RRF）的平滑常数",
+        ge=1,
+    )
+
+    # ========== 对冲请求配置 ==========
+    hedge_enabled: bool = Field(
+        default=True,
+        description="降级模式下主引擎超过历史耗时分位数仍未返回时，并行启动下一个引擎",
+    )
+    hedge_percentile: float = Field(
+        default=75.0,
+        description="触发对冲的耗时分位数（按引擎统计成功搜索的耗时）",
+        ge=50.0,
+        le=99.0,
+    )
+    hedge_min_samples: int = Field(
+        default=5,
+        description="引擎耗时样本少于该数量时使用默认对冲延迟",
+        ge=1,
+    )
+    hedge_default_delay: float = Field(
+        default=8.0,
+        description="默认对冲延迟（秒），样本不足时使用；按分位数计算的延迟不超过其 2 倍",
+        ge=0.5,
+        le=60.0,
+    )
+    hedge_min_delay: float = Field(
+        default=1.0,
+        description="最小对冲延迟（秒），避免快速引擎轻微抖动就触发对冲",
+        ge=0.1,
+    )
+    hedge_max_parallel: int = Field(
+        default=2,
+        description="降级模式下同时进行的引擎数上限（含主引擎）",
+        ge=2,
+        le=5,
+    )
+
+    # ========== 引擎状态共享配置 ==========
+    engine_registry_db_path: str = Field(
+        default="./data/engine_registry.db",
+        description="引擎禁用记录与健康统计的 SQLite 文件路径，同一主机上的所有服务进程共享（为空时只在进程内保存）",
+    )
+    engine_registry_refresh_interval: float = Field(
+        default=2.0,
+        description="从共享注册表刷新禁用记录和健康统计的间隔（秒）",
+        ge=0.0,
+        le=60.0,
+    )
+
+    # ========== 搜索结果缓存配置 ==========
+    search_cache_enabled: bool = Field(
+        default=True,
+        description="是否缓存搜索结果（相同引擎/关键词/类型/数量的重复查询直接返回缓存）",
+    )
+    search_cache_memory_size: int = Field(
+        default=256,
+        description="内存 LRU 缓存的最大条目数",
+        ge=1,
+        le=10000,
+    )
+    search_cache_db_path: str = Field(
+        default="./data/search_cache.db",
+        description="持久化缓存 SQLite 文件路径（为空时只使用内存缓存）",
+    )
+    search_cache_ttl_web: int = Field(
+        default=3600,
+        description="网页搜索结果缓存有效期（秒）",
+        ge=0,
+    )
+    search_cache_ttl_news: int = Field(
+        default=600,
+        description="新闻搜索结果缓存有效期（秒，新闻更新快，默认较短）",
+        ge=0,
+    )
+
+    # ========== 文章内容缓存配置 ==========
+    article_cache_enabled: bool = Field(
+        default=True,
+        description="是否缓存提取后的文章内容（按规范化 URL）",
+    )
+    article_cache_memory_size: int = Field(
+        default=128,
+        description="内存 LRU 中缓存的文章数",
+        ge=1,
+        le=10000,
+    )
+    article_cache_db_path: str = Field(
+        default="./data/article_cache.db",
+        description="文章缓存 SQLite 文件路径（为空时只使用内存缓存）",
+    )
+    article_cache_fresh_seconds: int = Field(
+        default=600,
+        description="缓存新鲜期（秒），期内直接返回，过期后用 ETag/Last-Modified 条件请求重新验证",
+        ge=0,
+    )
+    article_cache_max_age: int = Field(
+        default=86400,
+        description="缓存最长保留时间（秒），超过后无论是否可以重新验证都重新抓取",
+        ge=0,
+    )
+    article_cache_news_storage_db: str = Field(
+        default="./data/news_storage.db",
+        description="news_storage 数据库路径，缓存未命中时读取其中已保存的文章正文（为空时不读取）",
+    )
 
     # ========== 代理配置 ==========
     proxy_server: Optional[str] = Field(
@@ -113,6 +388,22 @@ class Settings(BaseSettings):
         description="启用的搜索引擎列表",
     )
 
+    engine_ranking: Literal["adaptive", "static"] = Field(
+        default="adaptive",
+        description="引擎排序方式：adaptive（按实时成功率和延迟打分，auto 模式用 Thompson 采样选择）| static（随机选择，按固定速度优先级降级）",
+    )
+    engine_ranking_decay: float = Field(
+        default=0.97,
+        description="自适应排序中旧观测的衰减系数（每次更新前乘以该系数，越小越快跟随引擎的最新表现）",
+        ge=0.5,
+        le=1.0,
+    )
+    engine_ranking_latency_offset: float = Field(
+        default=1.0,
+        description="自适应排序得分中加在延迟上的常数（秒），得分 = 成功概率 / (延迟 + 该常数)",
+        ge=0.0,
+    )
+
     default_num_results: int = Field(
         default=30,
         description="默认返回结果数量",
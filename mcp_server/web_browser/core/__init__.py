@@ -1,6 +1,38 @@
 """核心模块 - 浏览器池和速率限制器"""
 
+# 最先导入：启动统计从这里开始计时
+from .startup import StartupStats, get_startup_stats
 from .rate_limiter import RateLimiter
 from .browser_pool import BrowserPool, get_browser_pool, close_global_browser_pool
+from .readiness import ReadinessCondition, get_readiness_stats
+from .http_client import HttpClient, get_http_client, close_global_http_client
+from .extraction_pool import ExtractionPool, get_extraction_pool, close_global_extraction_pool
+from .search_cache import SearchCache, get_search_cache, close_global_search_cache
+from .article_cache import ArticleCache, get_article_cache, close_global_article_cache
+from .engine_registry import EngineRegistry, get_engine_registry, close_global_engine_registry
 
-__all__ = ["RateLimiter", "BrowserPool", "get_browser_pool", "close_global_browser_pool"]
+__all__ = [
+    "StartupStats",
+    "get_startup_stats",
+    "RateLimiter",
+    "BrowserPool",
+    "get_browser_pool",
+    "close_global_browser_pool",
+    "ReadinessCondition",
+    "get_readiness_stats",
+    "HttpClient",
+    "get_http_client",
+    "close_global_http_client",
+    "ExtractionPool",
+    "get_extraction_pool",
+    "close_global_extraction_pool",
+    "SearchCache",
+    "get_search_cache",
+    "close_global_search_cache",
+    "ArticleCache",
+    "get_article_cache",
+    "close_global_article_cache",
+    "EngineRegistry",
+    "get_engine_registry",
+    "close_global_engine_registry",
+]
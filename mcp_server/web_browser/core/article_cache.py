@@ -0,0 +1,338 @@
+"""文章内容缓存 - 按规范化 URL 缓存提取结果，过期后条件请求重新验证
+
+同一篇热门文章会被多个 Agent 反复抓取，每次都要重新下载、渲染和提取（3-10 秒）。本模块：
+
+- 按规范化 URL 缓存提取后的标题、正文、图片以及响应的 ETag / Last-Modified
+- 新鲜期内直接返回（内存层为 LRU，持久层为 SQLite）
+- 新鲜期过后，有验证器的条目用 If-None-Match / If-Modified-Since 条件请求重新验证，
+  304 时续期并返回缓存；没有验证器或超过最长保留时间的条目重新抓取
+- 未命中时可以读取 news_storage 中已保存的文章正文（只读）
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import aiosqlite
+from loguru import logger
+
+from ..config.settings import get_settings, Settings
+
+
+@dataclass
+class ArticleEntry:
+    """文章缓存条目"""
+    url: str  # 规范化 URL
+    result: dict  # 文章结果（与 fetch_article_content 返回结构一致）
+    include_images: bool  # 抓取时是否提取了图片
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    created_at: float = 0.0  # 首次抓取时间
+    validated_at: float = 0.0  # 最近一次抓取或重新验证的时间
+    source: str = "fetch"  # fetch | news_storage
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def satisfies(self, include_images: bool) -> bool:
+        """缓存条目能否满足请求（需要图片时条目必须包含图片提取结果）"""
+        return self.include_images or not include_images
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """条件请求头"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ArticleCacheStats:
+    """文章缓存统计"""
+
+    def __init__(self):
+        self.fresh_hits = 0  # 新鲜期内命中
+        self.revalidated = 0  # 条件请求返回 304
+        self.changed = 0  # 条件请求返回新内容
+        self.storage_hits = 0  # 从 news_storage 读取
+        self.misses = 0
+        self.bypassed = 0
+        self.stores = 0
+        self.evictions = 0
+        self.disk_errors = 0
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        hits = self.fresh_hits + self.revalidated + self.storage_hits
+        lookups = hits + self.changed + self.misses
+        return {
+            "fresh_hits": self.fresh_hits,
+            "revalidated": self.revalidated,
+            "changed": self.changed,
+            "storage_hits": self.storage_hits,
+            "misses": self.misses,
+            "hit_rate": f"{(hits / lookups * 100) if lookups else 0:.1f}%",
+            "bypassed": self.bypassed,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "disk_errors": self.disk_errors,
+        }
+
+
+class ArticleCache:
+    """文章内容缓存（全局单例）"""
+
+    def __init__(self, settings: Settings):
+        """
+        Args:
+            settings: 配置对象
+        """
+        self.settings = settings
+        self.enabled = settings.article_cache_enabled
+        self._memory: "OrderedDict[str, ArticleEntry]" = OrderedDict()
+        self._max_memory = settings.article_cache_memory_size
+        self._db_path = Path(settings.article_cache_db_path) if settings.article_cache_db_path else None
+        self._storage_path = (
+            Path(settings.article_cache_news_storage_db) if settings.article_cache_news_storage_db else None
+        )
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._storage_conn: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
+        self.stats = ArticleCacheStats()
+
+    def is_fresh(self, entry: ArticleEntry) -> bool:
+        """条目是否仍在新鲜期内"""
+        return time.time() - entry.validated_at < self.settings.article_cache_fresh_seconds
+
+    def is_expired(self, entry: ArticleEntry) -> bool:
+        """条目是否超过最长保留时间"""
+        return time.time() - entry.created_at >= self.settings.article_cache_max_age
+
+    async def _get_conn(self) -> Optional[aiosqlite.Connection]:
+        """获取（或创建）持久层连接，未配置路径时返回 None"""
+        if self._db_path is None:
+            return None
+        if self._conn is None:
+            async with self._lock:
+                if self._conn is None:
+                    self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = await aiosqlite.connect(self._db_path, timeout=30)
+                    await conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS article_cache (
+                            url TEXT PRIMARY KEY,
+                            entry TEXT NOT NULL,
+                            created_at REAL NOT NULL
+                        )
+                    """
+                    )
+                    await conn.execute(
+                        "DELETE FROM article_cache WHERE created_at <= ?",
+                        (time.time() - self.settings.article_cache_max_age,),
+                    )
+                    await conn.commit()
+                    self._conn = conn
+                    logger.info(f"✅ 文章缓存持久层初始化完成: {self._db_path}")
+        return self._conn
+
+    def _remember(self, entry: ArticleEntry) -> None:
+        """写入内存层（LRU 淘汰）"""
+        self._memory[entry.url] = entry
+        self._memory.move_to_end(entry.url)
+        while len(self._memory) > self._max_memory:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def _persist(self, entry: ArticleEntry) -> None:
+        """写入持久层"""
+        try:
+            conn = await self._get_conn()
+            if conn is not None:
+                await conn.execute(
+                    "INSERT OR REPLACE INTO article_cache (url, entry, created_at) VALUES (?, ?, ?)",
+                    (entry.url, json.dumps(asdict(entry), ensure_ascii=False), entry.created_at),
+                )
+                await conn.commit()
+        except Exception as e:
+            self.stats.disk_errors += 1
+            logger.warning(f"⚠️ 写入文章缓存失败: {e}")
+
+    async def get(self, url: str) -> Optional[ArticleEntry]:
+        """查找缓存条目（不判断新鲜度，超过最长保留时间的条目视为未命中）
+
+        Args:
+            url: 规范化 URL
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._memory.get(url)
+        if entry is None:
+            try:
+                conn = await self._get_conn()
+                if conn is not None:
+                    async with conn.execute(
+                        "SELECT entry FROM article_cache WHERE url = ?", (url,)
+                    ) as cursor:
+                        row = await cursor.fetchone()
+                    if row is not None:
+                        entry = ArticleEntry(**json.loads(row[0]))
+            except Exception as e:
+                self.stats.disk_errors += 1
+                logger.warning(f"⚠️ 读取文章缓存失败: {e}")
+
+        if entry is None or self.is_expired(entry):
+            self._memory.pop(url, None)
+            return None
+        self._remember(entry)
+        return entry
+
+    async def put(
+        self,
+        url: str,
+        result: dict,
+        include_images: bool,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        source: str = "fetch",
+    ) -> ArticleEntry:
+        """写入缓存（两级同时写入）"""
+        now = time.time()
+        entry = ArticleEntry(
+            url=url,
+            result=result,
+            include_images=include_images,
+            etag=etag,
+            last_modified=last_modified,
+            created_at=now,
+            validated_at=now,
+            source=source,
+        )
+        if self.enabled:
+            self._remember(entry)
+            self.stats.stores += 1
+            await self._persist(entry)
+        return entry
+
+    async def touch(self, entry: ArticleEntry) -> None:
+        """重新验证通过（304）后续期"""
+        entry.validated_at = time.time()
+        self._remember(entry)
+        await self._persist(entry)
+
+    def record(self, outcome: str) -> None:
+        """记录一次查找结果（fresh_hits | revalidated | changed | storage_hits | misses | bypassed）"""
+        setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+
+    async def _get_storage_conn(self) -> Optional[aiosqlite.Connection]:
+        """获取 news_storage 数据库的只读连接（文件不存在时返回 None）"""
+        if self._storage_path is None or not self._storage_path.exists():
+            return None
+        if self._storage_conn is None:
+            async with self._lock:
+                if self._storage_conn is None:
+                    self._storage_conn = await aiosqlite.connect(
+                        f"file:{self._storage_path.resolve()}?mode=ro", uri=True, timeout=30
+                    )
+        return self._storage_conn
+
+    async def read_through(self, url: str, canonical_url: str) -> Optional[dict]:
+        """从 news_storage 读取已保存的文章（只读，正文为空时返回 None）
+
+        Args:
+            url: 原始 URL（news_storage 按原始 URL 保存）
+            canonical_url: 规范化 URL
+
+        Returns:
+            {title, content, image_urls, author, publish_time}；未保存或没有正文时返回 None
+        """
+        if not self.enabled:
+            return None
+        try:
+            conn = await self._get_storage_conn()
+            if conn is None:
+                return None
+            async with conn.execute(
+                """
+                SELECT title, content, image_urls, author, publish_time FROM news
+                WHERE url IN (?, ?) AND content IS NOT NULL AND content != ''
+                ORDER BY updated_at DESC LIMIT 1
+                """,
+                (url, canonical_url),
+            ) as cursor:
+                row = await cursor.fetchone()
+        except Exception as e:
+            logger.debug(f"读取 news_storage 失败: {e}")
+            return None
+
+        if row is None:
+            return None
+        try:
+            image_urls = json.loads(row[2] or "[]")
+        except ValueError:
+            image_urls = []
+        return {
+            "title": row[0] or "",
+            "content": row[1],
+            "image_urls": image_urls,
+            "author": row[3] or "",
+            "publish_time": row[4] or "",
+        }
+
+    async def close(self) -> None:
+        """关闭数据库连接"""
+        for conn in (self._conn, self._storage_conn):
+            if conn is not None:
+                await conn.close()
+        self._conn = None
+        self._storage_conn = None
+
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        return {
+            "enabled": self.enabled,
+            "memory_entries": len(self._memory),
+            "max_memory_entries": self._max_memory,
+            "db_path": str(self._db_path) if self._db_path else None,
+            "fresh_seconds": self.settings.article_cache_fresh_seconds,
+            "max_age": self.settings.article_cache_max_age,
+            **self.stats.to_dict(),
+        }
+
+
+# 全局缓存实例
+_global_article_cache: Optional[ArticleCache] = None
+
+
+def get_article_cache(settings: Settings = None) -> ArticleCache:
+    """获取全局文章缓存实例（单例）
+
+    Args:
+        settings: 配置对象（首次创建时需要）
+
+    Returns:
+        ArticleCache: 缓存实例
+    """
+    global _global_article_cache
+
+    if _global_article_cache is None:
+        if settings is None:
+            settings = get_settings()
+        _global_article_cache = ArticleCache(settings)
+
+    return _global_article_cache
+
+
+async def close_global_article_cache() -> None:
+    """关闭全局文章缓存"""
+    global _global_article_cache
+
+    if _global_article_cache:
+        await _global_article_cache.close()
+        _global_article_cache = None
@@ -0,0 +1,130 @@
+"""批量抓取调度器 - 按域名分组、交错调度的并发抓取
+
+Agent 逐篇调用文章抓取工具时，每篇都要多一次 LLM 往返。批量抓取时如果按输入顺序并发，
+同一站点的连续 URL 会集中打到一个域名上（既不礼貌，也会被限流卡住），其他站点却在空等。
+
+本模块把 URL 按域名分组后轮流交错排队：
+- 全局并发不超过 max_concurrency，同一域名同时进行的请求不超过 per_domain
+- 某个域名已达上限时跳过它，先启动其他域名的 URL（域名级别的速率限制仍由 RateLimiter 负责）
+- 截止时间到达时取消仍在进行的任务，未启动的 URL 标记为 skipped
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+from urllib.parse import urlparse
+
+
+@dataclass
+class BatchItem:
+    """一个 URL 的调度结果"""
+    url: str
+    domain: str
+    status: str = "pending"  # ok | error | timeout | skipped
+    queued_ms: float = 0.0  # 从批次开始到启动的时间
+    elapsed_ms: float = 0.0  # 执行耗时
+    result: Any = None
+    error: str = ""
+
+
+def interleave_by_domain(urls: List[str]) -> "OrderedDict[str, Deque[str]]":
+    """按域名分组（保持域名首次出现的顺序和组内顺序）"""
+    groups: "OrderedDict[str, Deque[str]]" = OrderedDict()
+    for url in urls:
+        groups.setdefault(urlparse(url).netloc.lower(), deque()).append(url)
+    return groups
+
+
+class DomainScheduler:
+    """按域名交错调度的并发执行器"""
+
+    def __init__(self, max_concurrency: int = 4, per_domain: int = 1):
+        """
+        Args:
+            max_concurrency: 全局最大并发数
+            per_domain: 同一域名最大并发数
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_domain = max(1, per_domain)
+
+    async def run(
+        self,
+        urls: List[str],
+        fn: Callable[[str], Awaitable[Any]],
+        deadline: Optional[float] = None,
+        on_done: Optional[Callable[[BatchItem], Awaitable[None]]] = None,
+    ) -> Dict[str, BatchItem]:
+        """执行批次
+
+        Args:
+            urls: URL 列表（应已去重）
+            fn: 对单个 URL 执行的协程函数
+            deadline: 截止时间（秒，从现在起），为 None 或 0 时不限制
+            on_done: 每个 URL 完成（成功或出错）后调用，用于上报进度
+
+        Returns:
+            {url: BatchItem}，顺序与输入一致
+        """
+        start = time.perf_counter()
+        end = start + deadline if deadline else None
+        groups = interleave_by_domain(urls)
+        items = {url: BatchItem(url=url, domain=urlparse(url).netloc.lower()) for url in urls}
+        in_flight: Dict[str, int] = {}
+        running: Dict[asyncio.Task, BatchItem] = {}
+
+        def next_url() -> Optional[str]:
+            """轮流从各域名取下一个 URL（跳过已达并发上限的域名）"""
+            for domain in list(groups):
+                if in_flight.get(domain, 0) >= self.per_domain:
+                    continue
+                queue = groups.pop(domain)
+                url = queue.popleft()
+                if queue:
+                    groups[domain] = queue  # 移到队尾，实现域名交错
+                return url
+            return None
+
+        try:
+            while groups or running:
+                while len(running) < self.max_concurrency:
+                    url = next_url()
+                    if url is None:
+                        break
+                    item = items[url]
+                    item.queued_ms = (time.perf_counter() - start) * 1000
+                    in_flight[item.domain] = in_flight.get(item.domain, 0) + 1
+                    running[asyncio.ensure_future(fn(url))] = item
+
+                timeout = None
+                if end is not None:
+                    timeout = end - time.perf_counter()
+                    if timeout <= 0:
+                        break
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item = running.pop(task)
+                    in_flight[item.domain] -= 1
+                    item.elapsed_ms = (time.perf_counter() - start) * 1000 - item.queued_ms
+                    try:
+                        item.result = task.result()
+                        item.status = "ok"
+                    except Exception as e:
+                        item.status = "error"
+                        item.error = str(e)
+                    if on_done is not None:
+                        await on_done(item)
+        finally:
+            # 截止时间到达（或批次被取消）：取消进行中的任务，并等待其退出（释放页面和连接）
+            for task, item in running.items():
+                task.cancel()
+                item.status = "timeout"
+                item.elapsed_ms = (time.perf_counter() - start) * 1000 - item.queued_ms
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for item in items.values():
+                if item.status == "pending":
+                    item.status = "skipped"
+
+        return items
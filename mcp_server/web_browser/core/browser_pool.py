@@ -1,4 +1,14 @@
-"""浏览器池管理器 - 支持上下文复用和代理"""
+"""浏览器池管理器 - 支持多浏览器分片、上下文复用和代理
+
+层级结构：
+    Browser（N 个进程，按需启动）
+      └── BrowserContext（每个浏览器最多 max_contexts_per_browser 个，全局最多 max_context_pool_size 个）
+            └── Page（每个上下文最多同时 max_pages_per_context 个）
+
+分配策略：优先复用负载最低且未满的上下文；需要新建上下文时，选择上下文最少的浏览器（最小负载分发）。
+"""
+
+from __future__ import annotations
 
 import asyncio
 import json
@@ -6,22 +16,77 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, List, Optional
 
 from loguru import logger
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 from ..config.settings import get_settings, Settings
+from .page_inspector import get_inspection_stats
+from .resource_blocker import (
+    DEFAULT_RESOURCE_TYPES,
+    TRACKER,
+    BlockPolicy,
+    PageBlockState,
+    ResourceBlocker,
+    get_blocking_stats,
+)
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
+
+DEFAULT_VIEWPORT = {"width": 1920, "height": 1080}
+DEFAULT_ENGINE_KEY = "default"
+DEFAULT_BLOCK_LIST = [*DEFAULT_RESOURCE_TYPES, TRACKER]  # 未指定引擎时的默认拦截策略
+
+
+@dataclass(frozen=True)
+class ContextKey:
+    """Context 池的键：引擎 + 指纹配置
+
+    同一引擎的资源拦截策略相同，同一指纹的 User-Agent/视口/Cookies 一致，
+    只有两者都匹配时才复用 Context。
+    """
+    engine_id: str
+    user_agent: str
+    viewport: tuple
+
+
+@dataclass
+class PageInfo:
+    """预热页面信息"""
+    page: Page
+    created_at: datetime
+    uses: int = 0
+    blocking: PageBlockState = field(default_factory=PageBlockState)  # 页面级拦截状态（重置后保留）
 
 
 @dataclass
 class ContextInfo:
     """上下文信息"""
     context: BrowserContext
+    key: ContextKey
+    browser_index: int
     created_at: datetime
     last_used: datetime
-    page_count: int
+    page_count: int  # 累计创建的页面数
+    active_pages: int = 0  # 当前正在使用的页面数
     cookies_saved: bool = False
+    idle_pages: List[PageInfo] = field(default_factory=list)  # 已重置、可直接复用的页面
+    blocker: Optional[ResourceBlocker] = None  # 资源拦截器
+
+
+@dataclass
+class BrowserInfo:
+    """浏览器进程信息"""
+    browser: Browser
+    index: int
+    contexts: List[ContextInfo] = field(default_factory=list)
+
+    @property
+    def active_pages(self) -> int:
+        """当前浏览器上正在使用的页面数"""
+        return sum(ctx_info.active_pages for ctx_info in self.contexts)
 
 
 class BrowserPool:
@@ -50,43 +115,129 @@ class BrowserPool:
 
         # Playwright 实例
         self._playwright = None
-        self._browser: Optional[Browser] = None
 
-        # 并发控制
-        self._semaphore = asyncio.Semaphore(settings.max_concurrent_browsers)
+        # 浏览器分片（槽位按需启动，None 表示尚未启动）
+        self._browsers: List[Optional[BrowserInfo]] = [None] * settings.max_concurrent_browsers
+        self._browser_locks = [asyncio.Lock() for _ in self._browsers]  # 每个槽位独立启动，互不阻塞
+        self._pending_contexts = [0] * len(self._browsers)  # 已预留、正在创建的 Context 数（按槽位）
+
+        # Context 容量：受每浏览器上限和全局池大小共同约束
+        self._max_contexts = min(
+            settings.max_concurrent_browsers * settings.max_contexts_per_browser,
+            settings.max_context_pool_size,
+        )
+
+        # 并发控制（页面级，总容量 = 上下文容量 × 每上下文页面数）
+        self._page_capacity = self._max_contexts * settings.max_pages_per_context
+        self._semaphore = asyncio.Semaphore(self._page_capacity)
 
         # Context 池
         self._context_pool: List[ContextInfo] = []
         self._context_lock = asyncio.Lock()
+        self._context_available = asyncio.Condition(self._context_lock)
+
+        # 后台任务（页面预热等），保留引用避免被垃圾回收
+        self._background_tasks: set = set()
 
         # 统计信息
         self._total_requests = 0
         self._active_requests = 0
         self._context_reuse_count = 0
         self._context_create_count = 0
+        self._context_evict_count = 0
+        self._page_create_count = 0
+        self._page_reuse_count = 0
+        self._page_recycle_count = 0
 
         self._initialized = True
         logger.info(
             f"🔧 浏览器池初始化: "
             f"max_browsers={settings.max_concurrent_browsers}, "
             f"max_contexts={settings.max_contexts_per_browser}, "
-            f"context_pool_size={settings.max_context_pool_size}"
+            f"context_pool_size={settings.max_context_pool_size}, "
+            f"max_pages_per_context={settings.max_pages_per_context}, "
+            f"page_capacity={self._page_capacity}"
         )
 
-    async def _ensure_browser(self) -> Browser:
-        """确保浏览器已启动"""
-        if self._browser is None:
+    async def _ensure_playwright(self):
+        """确保 Playwright 已启动（首次使用时才导入 playwright，缩短服务启动时间）"""
+        if self._playwright is None:
             async with self._lock:
-                if self._browser is None:
-                    logger.info("🚀 启动全局浏览器实例...")
+                if self._playwright is None:
+                    from playwright.async_api import async_playwright
+
                     self._playwright = await async_playwright().start()
+        return self._playwright
+
+    async def _ensure_browser(self, index: int) -> BrowserInfo:
+        """确保指定槽位的浏览器已启动
+
+        Args:
+            index: 浏览器槽位索引
+
+        Returns:
+            BrowserInfo: 浏览器进程信息
+        """
+        browser_info = self._browsers[index]
+        if browser_info is not None and browser_info.browser.is_connected():
+            return browser_info
+
+        playwright = await self._ensure_playwright()
+        async with self._browser_locks[index]:
+            browser_info = self._browsers[index]
+            if browser_info is None or not browser_info.browser.is_connected():
+                if browser_info is not None:
+                    # 浏览器进程已断开，丢弃其上的所有 Context
+                    logger.warning(f"⚠️ 浏览器 #{index} 已断开，重新启动")
+                    for ctx_info in browser_info.contexts:
+                        if ctx_info in self._context_pool:
+                            self._context_pool.remove(ctx_info)
+
+                logger.info(f"🚀 启动浏览器实例 #{index}...")
+                launch_args = self._get_launch_args()
+                browser = await playwright.chromium.launch(**launch_args)
+                browser_info = BrowserInfo(browser=browser, index=index)
+                self._browsers[index] = browser_info
+                logger.info(
+                    f"✅ 浏览器实例 #{index} 已启动 "
+                    f"[{self._launched_browser_count()}/{len(self._browsers)}]"
+                )
+
+        return browser_info
+
+    def _is_browser_connected(self, index: int) -> bool:
+        """检查指定槽位的浏览器是否仍然可用"""
+        browser_info = self._browsers[index]
+        return browser_info is not None and browser_info.browser.is_connected()
+
+    def _launched_browser_count(self) -> int:
+        """已启动的浏览器数量"""
+        return sum(1 for b in self._browsers if b is not None)
 
-                    launch_args = self._get_launch_args()
+    def _select_browser_index(self) -> Optional[int]:
+        """选择用于创建新 Context 的浏览器槽位（最小负载分发）
 
-                    self._browser = await self._playwright.chromium.launch(**launch_args)
-                    logger.info("✅ 全局浏览器实例已启动")
+        优先选择 Context 数最少的浏览器，其次选择活跃页面最少的浏览器；
+        未启动的槽位视为负载为 0，因此新 Context 会自然分散到多个浏览器进程。
+        正在创建（已预留）的 Context 计入负载。
 
-        return self._browser
+        Returns:
+            槽位索引；所有浏览器均已达到 Context 上限时返回 None
+        """
+        best_index = None
+        best_load = None
+        for index, browser_info in enumerate(self._browsers):
+            contexts = self._pending_contexts[index]
+            active_pages = 0
+            if browser_info is not None:
+                contexts += len(browser_info.contexts)
+                active_pages = browser_info.active_pages
+            if contexts >= self.settings.max_contexts_per_browser:
+                continue
+            load = (contexts, active_pages)
+            if best_load is None or load < best_load:
+                best_index, best_load = index, load
+        return best_index
 
     def _get_launch_args(self) -> dict:
         """获取浏览器启动参数"""
@@ -115,53 +266,274 @@ class BrowserPool:
 
         return args
 
-    async def _get_or_create_context(self, user_agent: str, viewport: dict = None, engine=None) -> BrowserContext:
-        """从池中获取或创建 BrowserContext"""
-        async with self._context_lock:
+    @staticmethod
+    def _make_context_key(user_agent: str, viewport: Optional[dict], engine) -> ContextKey:
+        """构建 Context 池的键（引擎 + 指纹配置）"""
+        viewport = viewport or DEFAULT_VIEWPORT
+        return ContextKey(
+            engine_id=engine.engine_id if engine else DEFAULT_ENGINE_KEY,
+            user_agent=user_agent,
+            viewport=(viewport["width"], viewport["height"]),
+        )
+
+    def _find_reusable_context(self, engine_id: str, key: Optional[ContextKey]) -> Optional[ContextInfo]:
+        """查找可复用的 Context
+
+        Args:
+            engine_id: 引擎键（决定资源拦截策略）
+            key: 完整的池键；为 None 时表示调用方未指定指纹，可复用该引擎下任意指纹的 Context
+
+        Returns:
+            负载最低且未满的同键 Context，没有则返回 None
+        """
+        max_pages = self.settings.max_pages_per_context
+        candidates = [
+            c for c in self._context_pool
+            if c.active_pages < max_pages
+            and (c.key == key if key is not None else c.key.engine_id == engine_id)
+            and self._is_browser_connected(c.browser_index)
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda c: (c.active_pages, -c.last_used.timestamp()))
+
+    async def _evict_lru_context(self) -> bool:
+        """按 LRU 淘汰一个空闲 Context（用于在全局上限内给新键腾出位置）
+
+        Returns:
+            是否成功淘汰
+        """
+        idle = [c for c in self._context_pool if c.active_pages == 0]
+        if not idle:
+            return False
+        victim = min(idle, key=lambda c: c.last_used)
+        await self._close_context(victim)
+        self._context_evict_count += 1
+        logger.debug(
+            f"♻️ LRU 淘汰 BrowserContext [{victim.key.engine_id}, 浏览器#{victim.browser_index}]"
+        )
+        return True
+
+    async def _acquire_context(self, user_agent: Optional[str], viewport: dict = None, engine=None) -> ContextInfo:
+        """从池中获取或创建 BrowserContext，并占用一个页面槽位
+
+        Context 按（引擎, 指纹配置）分组复用，保证资源拦截策略、User-Agent
+        与 Cookies 始终与发起请求的引擎一致。调用方必须已持有页面信号量。
+
+        需要新建时只在锁内预留槽位，浏览器启动、Context 创建和 Cookies 加载都在锁外进行，
+        不会阻塞其他分片或引擎的请求。
+
+        Args:
+            user_agent: User-Agent；为 None 时优先复用该引擎已有的任意指纹 Context，
+                需要新建时再随机选择
+            viewport: 视口大小
+            engine: 搜索引擎实例
+        """
+        engine_id = engine.engine_id if engine else DEFAULT_ENGINE_KEY
+        requested_key = (
+            self._make_context_key(user_agent, viewport, engine) if user_agent else None
+        )
+        max_pages = self.settings.max_pages_per_context
+
+        async with self._context_available:
             # 清理过期的 Context
             await self._cleanup_idle_contexts()
 
-            # 检查池中是否有空闲 Context（不考虑引擎差异，因为主要影响的是资源拦截）
-            for ctx_info in self._context_pool:
-                ctx = ctx_info.context
-                if len(ctx.pages) == 0:
+            while True:
+                # 1. 复用同键、负载最低且未满的 Context
+                ctx_info = self._find_reusable_context(engine_id, requested_key)
+                if ctx_info is not None:
+                    ctx_info.active_pages += 1
                     ctx_info.last_used = datetime.now()
                     self._context_reuse_count += 1
                     logger.debug(
-                        f"♻️ 复用空闲 BrowserContext "
-                        f"[池大小={len(self._context_pool)}]"
+                        f"♻️ 复用 BrowserContext [{engine_id}, 浏览器#{ctx_info.browser_index}, "
+                        f"页面={ctx_info.active_pages}/{max_pages}, 池大小={len(self._context_pool)}]"
                     )
-                    return ctx
+                    return ctx_info
 
-            # 创建新的 Context
-            browser = await self._ensure_browser()
-            context = await self._create_context(browser, user_agent, viewport, engine)
+                # 2. 有空位则直接创建；否则按 LRU 淘汰其他键的空闲 Context
+                index = self._select_browser_index()
+                reserved = len(self._context_pool) + sum(self._pending_contexts)
+                if index is not None and reserved < self._max_contexts:
+                    break
+                if await self._evict_lru_context():
+                    continue
+
+                # 3. 所有 Context 均被其他键占用，等待有页面归还
+                logger.debug(f"⏳ 等待可用 BrowserContext [{engine_id}]")
+                await self._context_available.wait()
+
+            # 预留槽位后释放锁
+            self._pending_contexts[index] += 1
+
+        if requested_key is None:
+            from ..utils.helpers import get_random_user_agent
+            user_agent = get_random_user_agent()
+        key = requested_key or self._make_context_key(user_agent, viewport, engine)
 
-            # 添加到池中
+        context = None
+        try:
+            browser_info = await self._ensure_browser(index)
+            context, blocker = await self._create_context(browser_info.browser, user_agent, viewport, engine)
+            await self._load_cookies(context)
+        except BaseException:
+            async with self._context_available:
+                self._pending_contexts[index] -= 1
+                self._context_available.notify_all()
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug(f"关闭 Context 失败: {e}")
+            raise
+
+        async with self._context_available:
+            self._pending_contexts[index] -= 1
             ctx_info = ContextInfo(
                 context=context,
+                key=key,
+                browser_index=index,
                 created_at=datetime.now(),
                 last_used=datetime.now(),
                 page_count=0,
+                active_pages=1,
                 cookies_saved=False,
+                blocker=blocker,
             )
+            browser_info.contexts.append(ctx_info)
             self._context_pool.append(ctx_info)
             self._context_create_count += 1
 
-            logger.info(
-                f"🆕 创建新 BrowserContext "
-                f"[池大小={len(self._context_pool)}/{self.settings.max_context_pool_size}]"
-            )
+        logger.info(
+            f"🆕 创建新 BrowserContext [{engine_id}, 浏览器#{index}, "
+            f"池大小={len(self._context_pool)}/{self._max_contexts}]"
+        )
 
-            # 加载 Cookies
-            await self._load_cookies(context)
+        # 后台预热空白页面（当前请求占用的页面不计入）
+        warm_count = min(self.settings.warm_pages_per_context, max_pages - 1)
+        if warm_count > 0:
+            task = asyncio.create_task(self._prewarm_pages(ctx_info, warm_count))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        return ctx_info
 
-            return context
+    async def warm_up(self, engines: list) -> int:
+        """启动第一个浏览器，并为指定引擎预先创建 Context（含预热页面）
 
-    async def _create_context(self, browser: Browser, user_agent: str, viewport: dict = None, engine=None) -> BrowserContext:
-        """创建新的浏览器上下文"""
+        用于服务启动后的后台预热；与请求并发时共享同一次浏览器启动，不会重复启动。
+
+        Args:
+            engines: 要创建 Context 的引擎实例（按优先级排列）
+
+        Returns:
+            新建的 Context 数（已存在的不重复创建）
+        """
+        await self._ensure_browser(0)
+        created = 0
+        for engine in engines:
+            before = self._context_create_count
+            async with self._semaphore:
+                ctx_info = await self._acquire_context(None, None, engine)
+                await self._release_context(ctx_info)
+            created += self._context_create_count - before
+        return created
+
+    async def _prewarm_pages(self, ctx_info: ContextInfo, count: int) -> None:
+        """为 Context 预先创建空白页面，放入空闲页面池"""
+        for _ in range(count):
+            if ctx_info not in self._context_pool:
+                return
+            try:
+                page_info = await self._new_page(ctx_info)
+                if ctx_info.blocker:
+                    # 提前建立 CDP 会话并下发默认规则，取出页面时无需再等待
+                    await ctx_info.blocker.prepare(page_info.page, page_info.blocking)
+            except Exception as e:
+                logger.debug(f"预热页面失败: {e}")
+                return
+            page_info.uses = 0
+            ctx_info.idle_pages.append(page_info)
+        logger.debug(f"🔥 预热 {count} 个页面 [{ctx_info.key.engine_id}]")
+
+    async def _checkout_page(self, ctx_info: ContextInfo) -> PageInfo:
+        """从 Context 的空闲页面池取出页面，没有则新建"""
+        while ctx_info.idle_pages:
+            page_info = ctx_info.idle_pages.pop()
+            if not page_info.page.is_closed():
+                self._page_reuse_count += 1
+                page_info.uses += 1
+                return page_info
+
+        return await self._new_page(ctx_info)
+
+    async def _new_page(self, ctx_info: ContextInfo) -> PageInfo:
+        """在 Context 中新建页面（拦截规则在取出页面时下发）"""
+        page = await ctx_info.context.new_page()
+        ctx_info.page_count += 1
+        self._page_create_count += 1
+        return PageInfo(page=page, created_at=datetime.now(), uses=1)
+
+    async def _checkin_page(self, ctx_info: ContextInfo, page_info: PageInfo) -> None:
+        """归还页面：重置后放回空闲池；达到复用上限或重置失败则关闭"""
+        page = page_info.page
+        reusable = (
+            ctx_info in self._context_pool
+            and page_info.uses < self.settings.page_max_uses
+            and len(ctx_info.idle_pages) < self.settings.max_pages_per_context
+            and await self._reset_page(page)
+        )
+        if reusable:
+            ctx_info.idle_pages.append(page_info)
+            return
+
+        if page_info.uses >= self.settings.page_max_uses:
+            self._page_recycle_count += 1
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"关闭页面失败: {e}")
+
+    @staticmethod
+    async def _reset_page(page: Page) -> bool:
+        """重置页面状态：导航到 about:blank、移除路由
+
+        事件监听不在这里清理（Playwright 没有公开的批量移除接口），
+        由注册者在归还页面前用 ``page.remove_listener`` 移除，见 ``get_page``。
+
+        Returns:
+            是否重置成功（失败的页面不再复用）
+        """
+        if page.is_closed():
+            return False
+        try:
+            await page.goto("about:blank")
+            try:
+                await page.unroute_all(behavior="ignoreErrors")
+            except AttributeError:
+                # 旧版本 Playwright 没有 unroute_all
+                pass
+            return True
+        except Exception as e:
+            logger.debug(f"重置页面失败: {e}")
+            return False
+
+    async def _release_context(self, ctx_info: ContextInfo) -> None:
+        """归还页面槽位，并唤醒等待 Context 的请求"""
+        async with self._context_available:
+            ctx_info.active_pages -= 1
+            ctx_info.last_used = datetime.now()
+            self._context_available.notify_all()
+
+    async def _create_context(self, browser: Browser, user_agent: str, viewport: dict = None, engine=None):
+        """创建新的浏览器上下文
+
+        Returns:
+            (BrowserContext, ResourceBlocker)
+        """
         context_options = {
-            "viewport": viewport or {"width": 1920, "height": 1080},
+            "viewport": viewport or DEFAULT_VIEWPORT,
             "user_agent": user_agent,
             "locale": "zh-CN",
             "timezone_id": "Asia/Shanghai",
@@ -174,13 +546,14 @@ class BrowserPool:
 
         context = await browser.new_context(**context_options)
 
-        # 设置资源拦截（使用引擎的策略）
-        if engine:
-            block_list = engine.get_resource_block_list()
-            await context.route("**/*", lambda route: self._block_resources_with_list(route, block_list))
-        else:
-            # 默认策略
-            await context.route("**/*", self._block_resources)
+        # 设置资源拦截（使用引擎的策略，静态规则下推到浏览器内执行）
+        policy = engine.get_block_policy() if engine else BlockPolicy.from_block_list(DEFAULT_BLOCK_LIST)
+        blocker = ResourceBlocker(
+            policy,
+            mode=self.settings.resource_blocking_mode,
+            type_fallback=self.settings.native_type_fallback,
+        )
+        await blocker.install(context)
 
         # 设置额外请求头
         await context.set_extra_http_headers({
@@ -194,40 +567,7 @@ class BrowserPool:
         # 添加反检测脚本
         await context.add_init_script(self._get_anti_detection_script())
 
-        return context
-
-    @staticmethod
-    async def _block_resources(route):
-        """拦截并阻止不必要的资源加载（默认策略）
-
-        只拦截明显非必要的资源，保留页面正常显示所需的核心资源
-        """
-        resource_type = route.request.resource_type
-        url = route.request.url.lower()
-
-        # 只拦截图片、字体、媒体文件等重型资源
-        # 保留样式表(stylesheet)、脚本(script)、文档(document)等核心资源
-        if resource_type in ["image", "font", "media"] or "icon" in url or "favicon" in url:
-            await route.abort()
-        else:
-            await route.continue_()
-
-    @staticmethod
-    async def _block_resources_with_list(route, block_list: list):
-        """根据给定的列表拦截资源
-
-        Args:
-            route: Playwright route 对象
-            block_list: 需要拦截的资源类型列表，如 ["image", "font", "media"]
-        """
-        resource_type = route.request.resource_type
-        url = route.request.url.lower()
-
-        # 拦截指定类型的资源和图标
-        if resource_type in block_list or "icon" in url or "favicon" in url:
-            await route.abort()
-        else:
-            await route.continue_()
+        return context, blocker
 
     @staticmethod
     def _get_anti_detection_script() -> str:
@@ -251,23 +591,33 @@ class BrowserPool:
     async def _cleanup_idle_contexts(self) -> None:
         """清理空闲过期的 Context"""
         now = datetime.now()
-        to_remove = []
 
-        for ctx_info in self._context_pool:
+        for ctx_info in list(self._context_pool):
             idle_time = (now - ctx_info.last_used).total_seconds()
-            if idle_time > self.settings.context_max_idle_time and len(ctx_info.context.pages) == 0:
-                to_remove.append(ctx_info)
-
-        for ctx_info in to_remove:
-            try:
-                await ctx_info.context.close()
-                self._context_pool.remove(ctx_info)
+            if idle_time > self.settings.context_max_idle_time and ctx_info.active_pages == 0:
+                await self._close_context(ctx_info)
                 logger.debug(f"🧹 清理空闲 BrowserContext [空闲={idle_time:.0f}秒]")
-            except Exception as e:
-                logger.debug(f"清理 Context 失败: {e}")
+
+    async def _close_context(self, ctx_info: ContextInfo) -> None:
+        """关闭 Context 并从池中移除"""
+        if ctx_info in self._context_pool:
+            self._context_pool.remove(ctx_info)
+        browser_info = self._browsers[ctx_info.browser_index]
+        if browser_info is not None and ctx_info in browser_info.contexts:
+            browser_info.contexts.remove(ctx_info)
+        try:
+            await ctx_info.context.close()
+        except Exception as e:
+            logger.debug(f"清理 Context 失败: {e}")
 
     @asynccontextmanager
-    async def get_page(self, user_agent: str = None, viewport: dict = None, engine=None):
+    async def get_page(
+        self,
+        user_agent: str = None,
+        viewport: dict = None,
+        engine=None,
+        block_policy: Optional[BlockPolicy] = None,
+    ):
         """获取一个浏览器页面（上下文管理器）
 
         用法:
@@ -276,35 +626,47 @@ class BrowserPool:
                 content = await page.content()
 
         Args:
-            user_agent: User-Agent 字符串
+            user_agent: User-Agent 字符串（为 None 时复用该引擎已有指纹，新建 Context 时随机选择）
             viewport: 视口大小
-            engine: 搜索引擎实例（用于定制资源拦截策略）
+            engine: 搜索引擎实例（用于定制资源拦截策略和 Context 分组）
+            block_policy: 本次请求的拦截策略（按页面下发，不影响 Context 分组）；
+                为 None 时使用引擎（或默认）策略
 
         Yields:
             Page: Playwright Page 对象
-        """
-        if user_agent is None:
-            from ..utils.helpers import get_random_user_agent
-            user_agent = get_random_user_agent()
 
+        Note:
+            页面归还后会被复用：调用方通过 ``page.on`` 注册的事件监听必须在退出前用
+            ``page.remove_listener`` 移除（或改用 ``page.once`` / ``page.expect_*``）。
+        """
         async with self._semaphore:
             self._total_requests += 1
             self._active_requests += 1
 
             logger.debug(
-                f"🔍 获取页面 [活跃: {self._active_requests}/{self.settings.max_concurrent_browsers}]"
+                f"🔍 获取页面 [活跃: {self._active_requests}/{self._page_capacity}]"
             )
 
-            context = await self._get_or_create_context(user_agent, viewport, engine)
-            page = await context.new_page()
-
+            ctx_info = None
+            page_info = None
             try:
-                yield page
+                ctx_info = await self._acquire_context(user_agent, viewport, engine)
+                page_info = await self._checkout_page(ctx_info)
+                if ctx_info.blocker:
+                    await ctx_info.blocker.apply_to_page(page_info.page, page_info.blocking, block_policy)
+                yield page_info.page
             finally:
-                await page.close()
+                if page_info is not None:
+                    if ctx_info.blocker:
+                        policy = block_policy or ctx_info.blocker.policy
+                        label = f"{'serp' if engine else 'page'}:{policy.mode}"
+                        await ctx_info.blocker.record_load(page_info.page, page_info.blocking, label)
+                    await self._checkin_page(ctx_info, page_info)
+                if ctx_info is not None:
+                    await self._release_context(ctx_info)
                 self._active_requests -= 1
                 logger.debug(
-                    f"✅ 释放页面 [活跃: {self._active_requests}/{self.settings.max_concurrent_browsers}]"
+                    f"✅ 释放页面 [活跃: {self._active_requests}/{self._page_capacity}]"
                 )
 
     async def _load_cookies(self, context: BrowserContext) -> None:
@@ -335,35 +697,56 @@ class BrowserPool:
             logger.error(f"保存Cookies失败: {e}")
 
     async def close(self) -> None:
-        """关闭浏览器池（释放所有资源）"""
-        async with self._lock:
+        """关闭浏览器池（释放所有资源）
+
+        先取消并等待后台任务（页面预热），再关闭 Context 和浏览器；
+        加锁顺序与获取页面时一致（先 Context 锁，后浏览器锁），避免死锁。
+        """
+        if self._background_tasks:
+            tasks = list(self._background_tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        async with self._context_lock:
             # 关闭所有 Context
-            async with self._context_lock:
-                if self._context_pool:
-                    logger.info(f"🔒 关闭 {len(self._context_pool)} 个 BrowserContext...")
-                    for ctx_info in self._context_pool:
-                        try:
-                            await ctx_info.context.close()
-                        except Exception as e:
-                            logger.debug(f"关闭 Context 失败: {e}")
-                    self._context_pool.clear()
-
-            # 关闭浏览器
-            if self._browser:
-                logger.info("🔒 关闭浏览器...")
-                await self._browser.close()
-                self._browser = None
-
-            if self._playwright:
-                await self._playwright.stop()
-                self._playwright = None
-
-            logger.info(
-                f"✅ 浏览器池已关闭 "
-                f"[总请求数: {self._total_requests}, "
-                f"Context创建: {self._context_create_count}, "
-                f"Context复用: {self._context_reuse_count}]"
-            )
+            if self._context_pool:
+                logger.info(f"🔒 关闭 {len(self._context_pool)} 个 BrowserContext...")
+                for ctx_info in self._context_pool:
+                    try:
+                        await ctx_info.context.close()
+                    except Exception as e:
+                        logger.debug(f"关闭 Context 失败: {e}")
+                self._context_pool.clear()
+
+            # 关闭浏览器（逐个槽位加锁，等待正在进行的启动完成）
+            launched = [b for b in self._browsers if b is not None]
+            if launched:
+                logger.info(f"🔒 关闭 {len(launched)} 个浏览器...")
+            for index, lock in enumerate(self._browser_locks):
+                async with lock:
+                    browser_info = self._browsers[index]
+                    if browser_info is None:
+                        continue
+                    try:
+                        await browser_info.browser.close()
+                    except Exception as e:
+                        logger.debug(f"关闭浏览器失败: {e}")
+                    self._browsers[index] = None
+
+            async with self._lock:
+                if self._playwright:
+                    await self._playwright.stop()
+                    self._playwright = None
+
+        logger.info(
+            f"✅ 浏览器池已关闭 "
+            f"[总请求数: {self._total_requests}, "
+            f"Context创建: {self._context_create_count}, "
+            f"Context复用: {self._context_reuse_count}, "
+            f"Context淘汰: {self._context_evict_count}, "
+            f"页面复用: {self._page_reuse_count}]"
+        )
 
     def get_stats(self) -> dict:
         """获取统计信息"""
@@ -374,12 +757,48 @@ class BrowserPool:
             else 0
         )
 
+        total_page_ops = self._page_create_count + self._page_reuse_count
+        page_reuse_rate = (
+            (self._page_reuse_count / total_page_ops * 100)
+            if total_page_ops > 0
+            else 0
+        )
+
+        contexts_by_engine: dict = {}
+        for ctx_info in self._context_pool:
+            engine_id = ctx_info.key.engine_id
+            contexts_by_engine[engine_id] = contexts_by_engine.get(engine_id, 0) + 1
+
         return {
             "total_requests": self._total_requests,
             "active_requests": self._active_requests,
-            "max_concurrent": self.settings.max_concurrent_browsers,
-            "browser_alive": self._browser is not None,
+            "max_concurrent": self._page_capacity,
+            "browser_alive": self._launched_browser_count() > 0,
+            "browsers_launched": self._launched_browser_count(),
+            "max_browsers": len(self._browsers),
+            "browser_loads": [
+                {
+                    "index": b.index,
+                    "contexts": len(b.contexts),
+                    "active_pages": b.active_pages,
+                }
+                for b in self._browsers
+                if b is not None
+            ],
             "context_pool_size": len(self._context_pool),
+            "max_context_pool_size": self._max_contexts,
+            "contexts_by_engine": contexts_by_engine,
+            "context_evict_count": self._context_evict_count,
+            "idle_pages": sum(len(c.idle_pages) for c in self._context_pool),
+            "page_create_count": self._page_create_count,
+            "page_reuse_count": self._page_reuse_count,
+            "page_recycle_count": self._page_recycle_count,
+            "page_reuse_rate": f"{page_reuse_rate:.1f}%",
+            "resource_blocking": {
+                "mode": self.settings.resource_blocking_mode,
+                **get_blocking_stats().to_dict(),
+            },
+            "page_inspection": get_inspection_stats().to_dict(),
             "context_create_count": self._context_create_count,
             "context_reuse_count": self._context_reuse_count,
             "context_reuse_rate": f"{reuse_rate:.1f}%",
@@ -0,0 +1,364 @@
+"""引擎健康状态注册表 - 同一主机上所有 MCP 进程共享的禁用记录和健康统计
+
+每个子 Agent 会话都会启动自己的 web_browser 进程。禁用记录只保存在进程内存时，
+新进程会立即访问其他进程刚被拦截的引擎，禁用次数也会随重启丢失。本模块把以下状态
+保存在 SQLite 中（WAL 模式，多进程并发读写）：
+
+- 禁用窗口（解禁时间）和递增禁用次数（解禁后保留，长时间未再被禁用才重新计数）
+- 自适应排序使用的引擎健康统计
+
+引擎工厂的接口是同步的，这里使用标准库 sqlite3 的短事务；读取走定期刷新的内存快照，
+只有写入（禁用、记录结果）才访问数据库。每次搜索后的健康统计更新先作用于内存快照，
+再合并到后台线程中批量写入，不会因其他进程持有写锁而阻塞事件循环；禁用很少发生，
+仍同步写入。数据库不可用时退化为进程内状态。
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from ..config.settings import get_settings, Settings
+
+
+class EngineRegistry:
+    """引擎禁用记录与健康统计（全局单例）"""
+
+    def __init__(self, db_path: Optional[str] = None, refresh_interval: float = 2.0, flush_delay: float = 1.0):
+        """
+        Args:
+            db_path: SQLite 文件路径（为空时只在进程内保存）
+            refresh_interval: 内存快照的刷新间隔（秒）
+            flush_delay: 健康统计批量写入的合并窗口（秒）
+        """
+        self._db_path = Path(db_path) if db_path else None
+        self.refresh_interval = refresh_interval
+        self.flush_delay = flush_delay
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # 内存快照 {engine_id: {...}}
+        self._bans: Dict[str, dict] = {}
+        self._health: Dict[str, dict] = {}
+        self._refreshed_at = 0.0
+        # 尚未写入数据库的健康统计更新 {engine_id: [update, ...]}
+        self._pending_health: Dict[str, List[Callable[[Optional[dict]], dict]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.db_errors = 0
+
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        """获取（或创建）数据库连接，未配置路径或连接失败时返回 None"""
+        if self._db_path is None:
+            return None
+        if self._conn is None:
+            try:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self._db_path, timeout=1.0, isolation_level=None, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS engine_bans (
+                        engine_id TEXT PRIMARY KEY,
+                        unban_time REAL NOT NULL,
+                        ban_count INTEGER NOT NULL,
+                        reason TEXT,
+                        banned_at REAL NOT NULL
+                    )
+                """
+                )
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS engine_health (
+                        engine_id TEXT PRIMARY KEY,
+                        state TEXT NOT NULL,
+                        updated_at REAL NOT NULL
+                    )
+                """
+                )
+                self._conn = conn
+                logger.info(f"✅ 引擎状态注册表初始化完成: {self._db_path}")
+            except sqlite3.Error as e:
+                self.db_errors += 1
+                logger.warning(f"⚠️ 引擎状态注册表不可用，使用进程内状态: {e}")
+                self._db_path = None
+                return None
+        return self._conn
+
+    def _refresh(self, force: bool = False) -> None:
+        """从数据库刷新内存快照"""
+        if not force and time.time() - self._refreshed_at < self.refresh_interval:
+            return
+        self._refreshed_at = time.time()
+        conn = self._get_conn()
+        if conn is None:
+            return
+        # 后台线程正在写入时跳过本次刷新（沿用当前快照），不在事件循环中等待写锁
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            bans = conn.execute(
+                "SELECT engine_id, unban_time, ban_count, reason, banned_at FROM engine_bans"
+            ).fetchall()
+            health = conn.execute("SELECT engine_id, state FROM engine_health").fetchall()
+        except sqlite3.Error as e:
+            self.db_errors += 1
+            logger.warning(f"⚠️ 读取引擎状态失败: {e}")
+            return
+        finally:
+            self._lock.release()
+        self._bans = {
+            row[0]: {"unban_time": row[1], "ban_count": row[2], "reason": row[3], "banned_at": row[4]}
+            for row in bans
+        }
+        self._health = {row[0]: json.loads(row[1]) for row in health}
+        self._apply_pending(self._health)
+
+    def _transaction(self, fn: Callable[[sqlite3.Connection], object]) -> Tuple[bool, object]:
+        """在写事务中执行 fn（BEGIN IMMEDIATE，跨进程串行）
+
+        Returns:
+            (是否在数据库中执行, fn 的返回值)
+        """
+        conn = self._get_conn()
+        if conn is None:
+            return False, None
+        try:
+            with self._lock:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    value = fn(conn)
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            return True, value
+        except sqlite3.Error as e:
+            self.db_errors += 1
+            logger.warning(f"⚠️ 写入引擎状态失败，本次只更新进程内状态: {e}")
+            return False, None
+
+    # ========== 禁用记录 ==========
+
+    def get_ban(self, engine_id: str) -> Optional[dict]:
+        """获取引擎的禁用记录（含已过期的记录，用于递增计数）"""
+        self._refresh()
+        return self._bans.get(engine_id)
+
+    def is_banned(self, engine_id: str) -> bool:
+        """引擎当前是否处于禁用窗口内"""
+        ban = self.get_ban(engine_id)
+        return ban is not None and time.time() < ban["unban_time"]
+
+    def active_bans(self) -> Dict[str, dict]:
+        """当前处于禁用窗口内的引擎"""
+        self._refresh()
+        now = time.time()
+        return {engine_id: ban for engine_id, ban in self._bans.items() if now < ban["unban_time"]}
+
+    def ban(
+        self,
+        engine_id: str,
+        reason: str,
+        duration_for: Callable[[int], float],
+        reset_after: float,
+    ) -> dict:
+        """禁用引擎（读取当前次数并递增在同一事务中完成，多个进程同时禁用时计数不会丢失）
+
+        Args:
+            engine_id: 引擎ID
+            reason: 禁用原因
+            duration_for: 根据禁用次数计算禁用时长（秒）
+            reset_after: 距上次解禁超过该时间（秒）后重新从第 1 次计数
+
+        Returns:
+            新的禁用记录 {unban_time, ban_count, reason, banned_at}
+        """
+
+        def next_ban(previous: Optional[dict]) -> dict:
+            now = time.time()
+            if previous is not None and now < previous["unban_time"]:
+                # 其他进程已经禁用且仍在窗口内，不重复递增
+                return previous
+            ban_count = 1
+            if previous is not None and now - previous["unban_time"] < reset_after:
+                ban_count = previous["ban_count"] + 1
+            return {
+                "unban_time": now + duration_for(ban_count),
+                "ban_count": ban_count,
+                "reason": reason,
+                "banned_at": now,
+            }
+
+        def write(conn: sqlite3.Connection) -> dict:
+            row = conn.execute(
+                "SELECT unban_time, ban_count, reason, banned_at FROM engine_bans WHERE engine_id = ?",
+                (engine_id,),
+            ).fetchone()
+            previous = (
+                {"unban_time": row[0], "ban_count": row[1], "reason": row[2], "banned_at": row[3]}
+                if row is not None
+                else None
+            )
+            ban = next_ban(previous)
+            if ban is not previous:
+                conn.execute(
+                    "INSERT OR REPLACE INTO engine_bans (engine_id, unban_time, ban_count, reason, banned_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (engine_id, ban["unban_time"], ban["ban_count"], ban["reason"], ban["banned_at"]),
+                )
+            return ban
+
+        stored, ban = self._transaction(write)
+        if not stored:
+            ban = next_ban(self._bans.get(engine_id))
+        self._bans[engine_id] = ban
+        return ban
+
+    # ========== 健康统计 ==========
+
+    def health_snapshot(self) -> Dict[str, dict]:
+        """各引擎的健康统计快照"""
+        self._refresh()
+        return self._health
+
+    def update_health(self, engine_id: str, update: Callable[[Optional[dict]], dict]) -> dict:
+        """更新引擎健康统计：立即作用于内存快照，数据库写入合并后在后台线程执行
+
+        Args:
+            engine_id: 引擎ID
+            update: 接收当前状态（没有时为 None），返回新状态；写入数据库时会在
+                最新的数据库状态上再执行一次，多个进程的更新不会互相覆盖
+
+        Returns:
+            新状态（内存快照）
+        """
+        state = update(self._health.get(engine_id))
+        self._health[engine_id] = state
+        if self._db_path is None:
+            return state
+
+        self._pending_health.setdefault(engine_id, []).append(update)
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._flush_health()  # 没有事件循环（脚本中调用）：同步写入
+            else:
+                self._flush_task = loop.create_task(self._flush_health_later())
+        return state
+
+    def _apply_pending(self, health: Dict[str, dict]) -> None:
+        """在数据库状态上叠加尚未写入的更新（避免刷新快照时丢失本进程的最新结果）"""
+        for engine_id, updates in self._pending_health.items():
+            state = health.get(engine_id)
+            for update in updates:
+                state = update(state)
+            health[engine_id] = state
+
+    async def _flush_health_later(self) -> None:
+        """等待合并窗口后，在后台线程中批量写入健康统计"""
+        while self._pending_health:
+            await asyncio.sleep(self.flush_delay)
+            pending, self._pending_health = self._pending_health, {}
+            stored, states = await asyncio.to_thread(self._write_health, pending)
+            if stored:
+                self._health.update(states)
+                self._apply_pending(self._health)
+
+    def _flush_health(self) -> None:
+        """同步写入所有待写入的健康统计"""
+        pending, self._pending_health = self._pending_health, {}
+        if pending:
+            self._write_health(pending)
+
+    def _write_health(self, pending: Dict[str, List[Callable[[Optional[dict]], dict]]]) -> Tuple[bool, object]:
+        """在一个写事务中依次执行各引擎的更新
+
+        Returns:
+            (是否在数据库中执行, {engine_id: 新状态})
+        """
+
+        def write(conn: sqlite3.Connection) -> Dict[str, dict]:
+            states = {}
+            now = time.time()
+            for engine_id, updates in pending.items():
+                row = conn.execute("SELECT state FROM engine_health WHERE engine_id = ?", (engine_id,)).fetchone()
+                state = json.loads(row[0]) if row is not None else None
+                for update in updates:
+                    state = update(state)
+                conn.execute(
+                    "INSERT OR REPLACE INTO engine_health (engine_id, state, updated_at) VALUES (?, ?, ?)",
+                    (engine_id, json.dumps(state), now),
+                )
+                states[engine_id] = state
+            return states
+
+        return self._transaction(write)
+
+    def close(self) -> None:
+        """写入剩余的健康统计并关闭数据库连接"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._flush_health()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        self._refresh()
+        now = time.time()
+        return {
+            "db_path": str(self._db_path) if self._db_path else None,
+            "shared": self._db_path is not None,
+            "db_errors": self.db_errors,
+            "bans": {
+                engine_id: {
+                    "ban_count": ban["ban_count"],
+                    "reason": ban["reason"],
+                    "remaining_s": round(max(0.0, ban["unban_time"] - now), 1),
+                }
+                for engine_id, ban in self._bans.items()
+            },
+        }
+
+
+# 全局注册表实例
+_global_engine_registry: Optional[EngineRegistry] = None
+
+
+def get_engine_registry(settings: Settings = None) -> EngineRegistry:
+    """获取全局引擎状态注册表（单例）
+
+    Args:
+        settings: 配置对象（首次创建时需要）
+
+    Returns:
+        EngineRegistry: 注册表实例
+    """
+    global _global_engine_registry
+
+    if _global_engine_registry is None:
+        if settings is None:
+            settings = get_settings()
+        _global_engine_registry = EngineRegistry(
+            settings.engine_registry_db_path,
+            refresh_interval=settings.engine_registry_refresh_interval,
+        )
+
+    return _global_engine_registry
+
+
+def close_global_engine_registry() -> None:
+    """关闭全局引擎状态注册表"""
+    global _global_engine_registry
+
+    if _global_engine_registry:
+        _global_engine_registry.close()
+        _global_engine_registry = None
@@ -0,0 +1,339 @@
+"""正文提取进程池 - 把 CPU 密集的 HTML 解析移出事件循环
+
+trafilatura 和 lxml 解析都是同步的，直接在工具协程里调用会阻塞事件循环，
+拖慢同一进程内所有在途的搜索、限速计时器和页面操作。本模块：
+
+- 维护固定数量的独立 worker 子进程（``python -m ...utils.extraction_worker``），
+  通过管道收发任务；子进程不会重新导入服务主模块，启动时预加载依赖
+- 通过准入信号量限制排队任务数，超出时调用方异步等待（背压）
+- 任务分配到空闲 worker 后才开始计时；超时只终止执行该任务的 worker，
+  其他 worker 上的任务不受影响，下次需要时补充新 worker
+- 记录排队深度、排队等待和执行耗时
+"""
+
+import asyncio
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from ..config.settings import get_settings, Settings
+from ..utils.extraction_worker import HEADER, encode_frame
+from .metrics import LatencyWindow
+
+_WORKER_MODULE = "mcp_server.web_browser.utils.extraction_worker"
+_PACKAGE_ROOT = Path(__file__).resolve().parents[3]  # mcp_server 包所在目录
+_WORKER_START_TIMEOUT = 60.0  # worker 启动（含依赖预加载）超时（秒）
+
+
+class ExtractionStats:
+    """进程池统计"""
+
+    def __init__(self):
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.recycles = 0  # 因超时、崩溃或取消而终止的 worker 数
+        self.spawned = 0  # 启动的 worker 数（含补充和达到任务上限后的重启）
+        self.max_queue_depth = 0
+        self.wait_ms = LatencyWindow()  # 提交到 worker 开始执行的等待时间
+        self.run_ms = LatencyWindow()  # worker 内执行时间
+        self.stage_ms: Dict[str, LatencyWindow] = {}  # 提取流水线各阶段耗时
+
+
+class WorkerError(Exception):
+    """worker 进程异常退出或协议错误"""
+
+
+class _Worker:
+    """一个正文提取 worker 子进程"""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+        self.tasks = 0
+
+    @classmethod
+    async def spawn(cls) -> "_Worker":
+        """启动 worker 并等待其完成依赖预加载"""
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_PACKAGE_ROOT), env.get("PYTHONPATH")]))
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", _WORKER_MODULE,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        worker = cls(process)
+        try:
+            await asyncio.wait_for(worker._read_frame(), _WORKER_START_TIMEOUT)
+        except BaseException:
+            worker.kill()
+            raise
+        return worker
+
+    async def _read_frame(self) -> bytes:
+        try:
+            header = await self.process.stdout.readexactly(HEADER.size)
+            (size,) = HEADER.unpack(header)
+            return await self.process.stdout.readexactly(size)
+        except asyncio.IncompleteReadError as e:
+            raise WorkerError("worker 进程已退出") from e
+
+    async def call(self, fn: Callable, args: tuple) -> tuple:
+        """发送任务并等待结果
+
+        Returns:
+            (开始时间戳, 结果, 执行耗时秒)
+
+        Raises:
+            WorkerError: worker 进程退出
+            RuntimeError: 任务在 worker 内抛出异常
+        """
+        self.tasks += 1
+        try:
+            self.process.stdin.write(encode_frame((fn, args)))
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise WorkerError(f"worker 进程已退出: {e}") from e
+        ok, payload = pickle.loads(await self._read_frame())
+        if not ok:
+            raise RuntimeError(payload)
+        return payload
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    def close(self) -> None:
+        """正常关闭：关闭 stdin，worker 读到 EOF 后退出"""
+        if self.alive and self.process.stdin is not None:
+            self.process.stdin.close()
+
+    def kill(self) -> None:
+        """立即终止 worker（用于取消超时任务）"""
+        if self.alive:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+
+
+class ExtractionPool:
+    """正文提取进程池（全局单例）"""
+
+    def __init__(self, settings: Settings):
+        """
+        Args:
+            settings: 配置对象
+        """
+        self.settings = settings
+        self._workers = settings.extraction_workers
+        self._admission = asyncio.Semaphore(settings.extraction_max_pending)
+        self._slots = asyncio.Semaphore(max(self._workers, 1))  # 同时执行的任务数 = worker 数
+        self._idle: List[_Worker] = []  # 空闲的 worker
+        self._live: set = set()  # 所有存活的 worker（含执行中的）
+        self._in_flight = 0  # 已准入、尚未返回的任务数
+        self._waiting = 0  # 等待准入的任务数
+        self.stats = ExtractionStats()
+
+    async def _checkout_worker(self) -> _Worker:
+        """取出一个空闲 worker，没有则启动新的（调用方已持有执行槽位）"""
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive:
+                return worker
+            self._live.discard(worker)
+        worker = await _Worker.spawn()
+        self._live.add(worker)
+        self.stats.spawned += 1
+        if self.stats.spawned == 1:
+            logger.info(f"🔧 正文提取进程池启动: workers={self._workers}")
+        return worker
+
+    def _checkin_worker(self, worker: _Worker) -> None:
+        """归还 worker；达到任务上限时关闭（释放解析库的内存），下次需要时重启"""
+        max_tasks = self.settings.extraction_max_tasks_per_child
+        if worker.alive and not (max_tasks and worker.tasks >= max_tasks):
+            self._idle.append(worker)
+            return
+        self._live.discard(worker)
+        worker.close()
+
+    def _discard_worker(self, worker: _Worker) -> None:
+        """终止并丢弃 worker（超时、崩溃或调用方取消）"""
+        self._live.discard(worker)
+        worker.kill()
+        self.stats.recycles += 1
+
+    async def start(self) -> None:
+        """预热进程池：并发启动所有 worker 并完成依赖预加载"""
+        if self._workers <= 0:
+            return
+        start = time.perf_counter()
+
+        async def _spawn_one() -> None:
+            async with self._slots:
+                self._checkin_worker(await self._checkout_worker())
+
+        results = await asyncio.gather(*(_spawn_one() for _ in range(self._workers)), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise errors[0]
+        logger.info(f"🔥 正文提取进程池预热完成 [{(time.perf_counter() - start) * 1000:.0f}ms]")
+
+    @property
+    def queue_depth(self) -> int:
+        """排队深度：等待准入的任务 + 已准入但没有空闲 worker 的任务"""
+        return self._waiting + max(0, self._in_flight - self._workers)
+
+    async def run(
+        self,
+        fn: Callable,
+        *args,
+        default: Any = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """在 worker 进程中执行函数
+
+        Args:
+            fn: 模块级函数（需可被 pickle）
+            *args: 函数参数（需可被 pickle）
+            default: 超时或失败时的返回值
+            timeout: 执行超时时间（秒，从 worker 开始执行时计时），默认使用 extraction_timeout
+
+        Returns:
+            函数返回值；超时或 worker 异常时返回 default
+        """
+        timeout = timeout or self.settings.extraction_timeout
+        self.stats.submitted += 1
+
+        if self._workers <= 0:
+            # 未启用进程池：在线程中执行，至少不阻塞事件循环
+            try:
+                result = await asyncio.wait_for(asyncio.to_thread(fn, *args), timeout)
+            except asyncio.TimeoutError:
+                self.stats.timeouts += 1
+                logger.warning(f"   ⏱️ 正文提取超时（{timeout}s）: {fn.__name__}")
+                return default
+            self.stats.completed += 1
+            return result
+
+        self._waiting += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.queue_depth)
+        async with self._admission:
+            self._waiting -= 1
+            self._in_flight += 1
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.queue_depth)
+            submitted_at = time.time()
+            try:
+                async with self._slots:
+                    try:
+                        worker = await self._checkout_worker()
+                    except Exception as e:
+                        self.stats.failed += 1
+                        logger.warning(f"   ⚠️ 正文提取 worker 启动失败: {e}")
+                        return default
+                    try:
+                        started_at, result, run_seconds = await asyncio.wait_for(
+                            worker.call(fn, args), timeout
+                        )
+                    except asyncio.TimeoutError:
+                        self.stats.timeouts += 1
+                        logger.warning(f"   ⏱️ 正文提取超时（{timeout}s）: {fn.__name__}，终止该 worker")
+                        self._discard_worker(worker)
+                        return default
+                    except WorkerError as e:
+                        self.stats.failed += 1
+                        logger.warning(f"   ⚠️ 正文提取 worker 异常退出: {e}")
+                        self._discard_worker(worker)
+                        return default
+                    except RuntimeError as e:
+                        # 任务本身出错，worker 仍可复用
+                        self.stats.failed += 1
+                        logger.warning(f"   ⚠️ 正文提取失败: {fn.__name__}: {e}")
+                        self._checkin_worker(worker)
+                        return default
+                    except BaseException:
+                        # 调用方取消：worker 停在任务中途，不能复用
+                        self._discard_worker(worker)
+                        raise
+                    self._checkin_worker(worker)
+            finally:
+                self._in_flight -= 1
+
+        self.stats.completed += 1
+        self.stats.wait_ms.add(max(0.0, started_at - submitted_at) * 1000)
+        self.stats.run_ms.add(run_seconds * 1000)
+        return result
+
+    def record_stages(self, timings_ms: Dict[str, float]) -> None:
+        """记录提取流水线各阶段耗时（worker 返回的 ExtractionResult.timings_ms）"""
+        for name, elapsed in timings_ms.items():
+            self.stats.stage_ms.setdefault(name, LatencyWindow()).add(elapsed)
+
+    async def close(self) -> None:
+        """关闭进程池：空闲 worker 正常退出，执行中的 worker 直接终止"""
+        for worker in list(self._live):
+            if worker in self._idle:
+                worker.close()
+            else:
+                worker.kill()
+        self._idle.clear()
+        self._live.clear()
+
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        return {
+            "workers": self._workers,
+            "started": self.stats.spawned > 0,
+            "workers_alive": len(self._live),
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.stats.max_queue_depth,
+            "submitted": self.stats.submitted,
+            "completed": self.stats.completed,
+            "failed": self.stats.failed,
+            "timeouts": self.stats.timeouts,
+            "recycles": self.stats.recycles,
+            "spawned": self.stats.spawned,
+            "wait_ms": self.stats.wait_ms.summary(),
+            "run_ms": self.stats.run_ms.summary(),
+            "stage_ms": {name: window.summary() for name, window in self.stats.stage_ms.items()},
+        }
+
+
+# 全局进程池实例
+_global_extraction_pool: Optional[ExtractionPool] = None
+
+
+def get_extraction_pool(settings: Settings = None) -> ExtractionPool:
+    """获取全局正文提取进程池实例（单例）
+
+    Args:
+        settings: 配置对象（首次创建时需要）
+
+    Returns:
+        ExtractionPool: 进程池实例
+    """
+    global _global_extraction_pool
+
+    if _global_extraction_pool is None:
+        if settings is None:
+            settings = get_settings()
+        _global_extraction_pool = ExtractionPool(settings)
+
+    return _global_extraction_pool
+
+
+async def close_global_extraction_pool() -> None:
+    """关闭全局正文提取进程池"""
+    global _global_extraction_pool
+
+    if _global_extraction_pool:
+        await _global_extraction_pool.close()
+        _global_extraction_pool = None
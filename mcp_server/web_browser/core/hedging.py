@@ -0,0 +1,95 @@
+"""对冲请求（hedged requests）- 主引擎迟迟没有结果时并行启动备用引擎
+
+降级链只有在主引擎失败后才会尝试下一个引擎，而慢引擎（搜狐的滚动加载、头条的选择器等待）
+即使最终成功也会拖慢整个调用。这里按引擎记录成功搜索的耗时，主引擎超过其历史分位数
+（默认 p75）仍未返回时启动下一个引擎，取先返回非空结果的一方，另一方被取消。
+"""
+
+from typing import Dict, Optional
+
+from ..config.settings import get_settings, Settings
+from .metrics import LatencyWindow
+
+
+class EngineLatencyTracker:
+    """各引擎成功搜索的耗时（秒），用于计算对冲延迟"""
+
+    def __init__(self, settings: Settings):
+        """
+        Args:
+            settings: 配置对象
+        """
+        self.settings = settings
+        self._windows: Dict[str, LatencyWindow] = {}
+
+    def record(self, engine_id: str, seconds: float) -> None:
+        """记录一次成功搜索（有结果、未命中缓存）的耗时"""
+        self._windows.setdefault(engine_id, LatencyWindow()).add(seconds)
+
+    def hedge_delay(self, engine_id: str) -> float:
+        """启动备用引擎前等待的时间（秒）
+
+        样本足够时取该引擎耗时的 ``hedge_percentile`` 分位数，否则使用 ``hedge_default_delay``，
+        结果限制在 [hedge_min_delay, hedge_default_delay * 2] 之间。
+        """
+        window = self._windows.get(engine_id)
+        if window is None or len(window) < self.settings.hedge_min_samples:
+            return self.settings.hedge_default_delay
+        delay = window.percentile(self.settings.hedge_percentile)
+        return min(max(delay, self.settings.hedge_min_delay), self.settings.hedge_default_delay * 2)
+
+    def get_stats(self) -> dict:
+        """获取各引擎的耗时分位数和当前对冲延迟"""
+        stats = {}
+        for engine_id, window in self._windows.items():
+            p50 = window.percentile(50)
+            p75 = window.percentile(75)
+            stats[engine_id] = {
+                "count": len(window),
+                "p50_s": round(p50, 2) if p50 is not None else None,
+                "p75_s": round(p75, 2) if p75 is not None else None,
+                "hedge_delay_s": round(self.hedge_delay(engine_id), 2),
+            }
+        return stats
+
+
+class HedgeStats:
+    """对冲统计"""
+
+    def __init__(self):
+        self.searches = 0  # 走降级链的搜索次数（不含缓存命中）
+        self.hedged = 0  # 至少启动过一次备用引擎的搜索次数
+        self.hedges_launched = 0  # 因超时启动的备用引擎总数
+        self.primary_wins = 0  # 发生对冲后，先启动的引擎胜出
+        self.hedge_wins = 0  # 发生对冲后，备用引擎胜出
+        self.cancelled = 0  # 被取消的落后请求数
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "searches": self.searches,
+            "hedged": self.hedged,
+            "hedge_rate": f"{(self.hedged / self.searches * 100) if self.searches else 0:.1f}%",
+            "hedges_launched": self.hedges_launched,
+            "primary_wins": self.primary_wins,
+            "hedge_wins": self.hedge_wins,
+            "cancelled": self.cancelled,
+        }
+
+
+_engine_latency: Optional[EngineLatencyTracker] = None
+_hedge_stats = HedgeStats()
+
+
+def get_engine_latency(settings: Settings = None) -> EngineLatencyTracker:
+    """获取全局引擎耗时统计（单例）"""
+    global _engine_latency
+
+    if _engine_latency is None:
+        _engine_latency = EngineLatencyTracker(settings or get_settings())
+    return _engine_latency
+
+
+def get_hedge_stats() -> HedgeStats:
+    """获取全局对冲统计"""
+    return _hedge_stats
@@ -0,0 +1,349 @@
+"""HTTP 客户端 - 免浏览器的快速抓取路径
+
+服务端渲染的搜索结果页（百度、搜狗、360、必应新闻）不需要 Chromium 渲染，
+直接用共享的 httpx 客户端抓取 HTML 即可：
+
+- 全局共享一个 keep-alive 连接池（同一域名的连续查询复用 TCP/TLS 连接）
+- 启用 HTTP/2 并接受 br 压缩（依赖 ``httpx[http2,brotli]``；缺少 ``h2`` / ``brotli`` 时自动降级）
+- 流式读取响应：非 HTML（PDF、视频、下载文件等）或超过 http_max_body_bytes 的响应
+  立即放弃，不读入内存
+- 按 BOM → Content-Type → <meta charset> → UTF-8 → GB18030 的顺序解码，
+  兼容 GBK/GB2312 页面
+- Cookie 保存在共享客户端中，后续请求自动携带（与浏览器会话一致）
+"""
+
+import asyncio
+import codecs
+import importlib.util
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from ..config.settings import get_settings
+from .metrics import LatencyWindow
+
+# HTTP/2 需要 h2，br 解压需要 brotli / brotlicffi（由 httpx[http2,brotli] 安装，缺失时降级）
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_BROTLI_AVAILABLE = (
+    importlib.util.find_spec("brotli") is not None
+    or importlib.util.find_spec("brotlicffi") is not None
+)
+
+_CHARSET_HEADER_RE = re.compile(r"charset=[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+
+# 快速路径只处理 HTML（Content-Type 缺失时按 HTML 处理，由解码探测）
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# GBK 系列编码统一按超集 GB18030 解码，避免生僻字解码失败
+_GB_ALIASES = {"gb2312", "gbk", "x-gbk", "gb_2312-80", "cp936", "windows-936", "hz-gb-2312"}
+
+_BOMS: Tuple[Tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _normalize_charset(name: Optional[str]) -> Optional[str]:
+    """规范化字符集名称，无法识别时返回 None"""
+    if not name:
+        return None
+    name = name.strip().lower()
+    if name in _GB_ALIASES:
+        return "gb18030"
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def _is_html(content_type: str) -> bool:
+    """Content-Type 是否为 HTML"""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return not media_type or media_type in _HTML_CONTENT_TYPES
+
+
+class UnsupportedResponse(httpx.HTTPError):
+    """响应不是 HTML 或超过大小上限（剩余内容不再读取）"""
+
+
+def decode_html(content: bytes, content_type: str = "") -> Tuple[str, str]:
+    """按声明与探测结果解码 HTML
+
+    Args:
+        content: 响应体（已解压）
+        content_type: Content-Type 响应头
+
+    Returns:
+        (文本, 使用的编码)
+    """
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return content.decode(encoding, errors="replace"), encoding
+
+    candidates = []
+    header_match = _CHARSET_HEADER_RE.search(content_type or "")
+    if header_match:
+        candidates.append(_normalize_charset(header_match.group(1)))
+    meta_match = _META_CHARSET_RE.search(content[:4096])
+    if meta_match:
+        candidates.append(_normalize_charset(meta_match.group(1).decode("ascii", "ignore")))
+    candidates.extend(["utf-8", "gb18030"])
+
+    tried = set()
+    for encoding in candidates:
+        if not encoding or encoding in tried:
+            continue
+        tried.add(encoding)
+        try:
+            return content.decode(encoding), encoding
+        except (UnicodeDecodeError, LookupError):
+            continue
+    return content.decode("utf-8", errors="replace"), "utf-8"
+
+
+@dataclass
+class HttpPage:
+    """一次 HTTP 抓取的结果"""
+    url: str  # 请求 URL
+    final_url: str  # 跟随重定向后的 URL
+    status_code: int
+    text: str
+    encoding: str
+    content_type: str
+    http_version: str
+    elapsed_ms: float
+    downloaded_bytes: int  # 线路上传输的字节数（压缩后）
+    etag: Optional[str] = None  # 缓存验证器（用于条件请求）
+    last_modified: Optional[str] = None
+
+
+class HttpStats:
+    """HTTP 快速路径统计：请求耗时、传输量以及各引擎的命中/升级次数"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0  # 非 HTML 或超过大小上限而放弃的响应数
+        self.downloaded_bytes = 0
+        self.http_versions: Dict[str, int] = {}
+        self._latency = LatencyWindow()
+        self._outcomes: Dict[str, Dict[str, int]] = {}
+
+    def record_request(self, page: HttpPage) -> None:
+        """记录一次成功的请求"""
+        self.requests += 1
+        self.downloaded_bytes += page.downloaded_bytes
+        self.http_versions[page.http_version] = self.http_versions.get(page.http_version, 0) + 1
+        self._latency.add(page.elapsed_ms)
+
+    def record_outcome(self, key: str, outcome: str) -> None:
+        """记录快速路径结果（outcome: hit | blocked | empty | error）"""
+        outcomes = self._outcomes.setdefault(key, {})
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "downloaded_kb": round(self.downloaded_bytes / 1024, 1),
+            "http_versions": dict(self.http_versions),
+            "latency_ms": self._latency.summary(),
+            "outcomes": {key: dict(v) for key, v in self._outcomes.items()},
+        }
+
+
+_http_stats = HttpStats()
+
+
+def get_http_stats() -> HttpStats:
+    """获取全局 HTTP 统计"""
+    return _http_stats
+
+
+class HttpClient:
+    """共享的 HTTP 客户端（全局单例，按需创建连接池）"""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lock = asyncio.Lock()
+
+    def _default_headers(self) -> Dict[str, str]:
+        """与浏览器一致的默认请求头"""
+        encodings = "gzip, deflate, br" if _BROTLI_AVAILABLE else "gzip, deflate"
+        return {
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+            "Accept-Encoding": encodings,
+            "Upgrade-Insecure-Requests": "1",
+        }
+
+    def _proxy_url(self) -> Optional[str]:
+        """将浏览器代理配置转换为 httpx 代理 URL"""
+        server = self.settings.proxy_server
+        if not server:
+            return None
+        if "://" not in server:
+            server = f"http://{server}"
+        if self.settings.proxy_username and self.settings.proxy_password:
+            scheme, rest = server.split("://", 1)
+            server = f"{scheme}://{self.settings.proxy_username}:{self.settings.proxy_password}@{rest}"
+        return server
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """获取（或创建）共享的 httpx 客户端"""
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    limits = httpx.Limits(
+                        max_connections=self.settings.http_max_connections,
+                        max_keepalive_connections=self.settings.http_max_connections,
+                        keepalive_expiry=60,
+                    )
+                    self._client = httpx.AsyncClient(
+                        http2=_HTTP2_AVAILABLE,
+                        headers=self._default_headers(),
+                        timeout=httpx.Timeout(self.settings.http_timeout),
+                        limits=limits,
+                        follow_redirects=True,
+                        verify=False,
+                        proxy=self._proxy_url(),
+                    )
+                    logger.info(
+                        f"🔧 HTTP 客户端初始化: http2={'✅' if _HTTP2_AVAILABLE else '❌'}, "
+                        f"br={'✅' if _BROTLI_AVAILABLE else '❌'}, "
+                        f"max_connections={self.settings.http_max_connections}"
+                    )
+        return self._client
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> HttpPage:
+        """GET 一个 HTML 页面并解码
+
+        Args:
+            url: 页面URL
+            headers: 额外请求头（如 User-Agent、Referer）
+
+        Returns:
+            HttpPage: 抓取结果（非 2xx 状态码，包括条件请求的 304，不会抛出异常，由调用方判断）
+
+        Raises:
+            UnsupportedResponse: 2xx 响应不是 HTML，或响应体超过 http_max_body_bytes
+            httpx.HTTPError: 网络错误或超时
+        """
+        client = await self._get_client()
+        start = time.perf_counter()
+        max_bytes = self.settings.http_max_body_bytes
+        try:
+            async with client.stream("GET", url, headers=headers) as response:
+                content_type = response.headers.get("content-type", "")
+                if response.is_success and not _is_html(content_type):
+                    raise UnsupportedResponse(f"非 HTML 响应: {content_type}")
+                declared = response.headers.get("content-length", "")
+                if declared.isdigit() and int(declared) > max_bytes:
+                    raise UnsupportedResponse(f"响应过大: {int(declared)} 字节（上限 {max_bytes}）")
+                chunks = []
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise UnsupportedResponse(f"响应超过 {max_bytes} 字节")
+                    chunks.append(chunk)
+        except UnsupportedResponse as e:
+            _http_stats.rejected += 1
+            logger.debug(f"   ⚡ HTTP 放弃 {url}: {e}")
+            raise
+        except httpx.HTTPError:
+            _http_stats.errors += 1
+            raise
+
+        text, encoding = decode_html(b"".join(chunks), content_type)
+        page = HttpPage(
+            url=url,
+            final_url=str(response.url),
+            status_code=response.status_code,
+            text=text,
+            encoding=encoding,
+            content_type=content_type,
+            http_version=response.http_version,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            downloaded_bytes=response.num_bytes_downloaded,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        _http_stats.record_request(page)
+        logger.debug(
+            f"   ⚡ HTTP {page.status_code} {page.http_version} {url} "
+            f"[{page.encoding}, {page.downloaded_bytes / 1024:.1f}KB, {page.elapsed_ms:.0f}ms]"
+        )
+        return page
+
+    async def preconnect(self, urls: List[str], timeout: float = 5.0) -> int:
+        """预连接：对每个 origin 发一个 HEAD 请求，提前完成 DNS、TCP 和 TLS 握手
+
+        连接保留在连接池中（keep-alive），之后 HTTP 快速路径的首个请求可以直接复用。
+
+        Args:
+            urls: 要预连接的 URL（按 origin 去重）
+            timeout: 单个请求超时（秒）
+
+        Returns:
+            成功建立连接的 origin 数
+        """
+        origins = []
+        for url in urls:
+            parsed = httpx.URL(url)
+            origin = f"{parsed.scheme}://{parsed.host}"
+            if parsed.host and origin not in origins:
+                origins.append(origin)
+        if not origins:
+            return 0
+
+        client = await self._get_client()
+
+        async def _head(origin: str) -> bool:
+            try:
+                await client.head(origin, timeout=timeout)
+                return True
+            except httpx.HTTPError as e:
+                logger.debug(f"   预连接失败 {origin}: {type(e).__name__}")
+                return False
+
+        results = await asyncio.gather(*(_head(origin) for origin in origins))
+        return sum(results)
+
+    async def close(self) -> None:
+        """关闭连接池"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# 全局 HTTP 客户端实例
+_global_http_client: Optional[HttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    """获取全局 HTTP 客户端实例（单例）"""
+    global _global_http_client
+
+    if _global_http_client is None:
+        _global_http_client = HttpClient()
+
+    return _global_http_client
+
+
+async def close_global_http_client() -> None:
+    """关闭全局 HTTP 客户端"""
+    global _global_http_client
+
+    if _global_http_client:
+        await _global_http_client.close()
+        _global_http_client = None
@@ -0,0 +1,47 @@
+"""轻量级指标工具 - 滑动窗口延迟统计"""
+
+from collections import deque
+from typing import Deque, Optional
+
+
+class LatencyWindow:
+    """固定容量的滑动窗口，用于计算延迟分位数"""
+
+    def __init__(self, maxlen: int = 200):
+        """
+        Args:
+            maxlen: 保留的最近样本数
+        """
+        self._samples: Deque[float] = deque(maxlen=maxlen)
+
+    def add(self, value: float) -> None:
+        """记录一个样本"""
+        self._samples.append(value)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """计算分位数（最近邻插值）
+
+        Args:
+            p: 分位数，取值 0-100
+
+        Returns:
+            分位数值；没有样本时返回 None
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(p / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self, digits: int = 1) -> dict:
+        """返回 count/p50/p95 摘要"""
+        p50 = self.percentile(50)
+        p95 = self.percentile(95)
+        return {
+            "count": len(self._samples),
+            "p50": round(p50, digits) if p50 is not None else None,
+            "p95": round(p95, digits) if p95 is not None else None,
+        }
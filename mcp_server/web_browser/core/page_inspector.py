@@ -0,0 +1,266 @@
+"""页面检查 - 一次注入脚本获取页面状态与提取所需的数据
+
+反爬虫检测、页面状态检查、标题/正文/图片提取原本各自调用 ``page.title()``、
+``page.evaluate()``、``query_selector()`` 和 ``page.content()``，一次文章抓取
+要经过十余次 CDP 往返。这里把它们合并为一个检查脚本：
+
+- 一次 ``evaluate`` 返回 HTTP 状态、标题候选、拦截信号，以及（按需）页面 HTML 和图片属性
+- 关键词表集中维护，浏览器路径与 HTTP 路径共用
+- 检查配置（``InspectionProfile``）区分搜索结果页（只需拦截信号）和文章页（需要页面数据）
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Tuple
+
+from loguru import logger
+
+from .metrics import LatencyWindow
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# ========== 共享关键词表 ==========
+
+# 反爬虫检测关键词（页面标题）
+ANTI_BOT_TITLE_KEYWORDS: Tuple[str, ...] = (
+    "验证", "安全", "captcha", "人机验证", "机器人", "robot", "验证码",
+    "滑动验证", "点选验证", "短信验证", "阿里云", "云盾", "腾讯云", "天御",
+    "访问频繁", "请求过于频繁", "操作过于频繁", "系统检测", "异常访问",
+    "风险检测", "安全检测", "cc攻击", "防刷", "反爬",
+)
+
+# 文章页标题关键词（额外匹配 "bot"）
+ARTICLE_ANTI_BOT_TITLE_KEYWORDS: Tuple[str, ...] = (*ANTI_BOT_TITLE_KEYWORDS, "bot")
+
+# 反爬虫检测短语（搜索结果页正文前 500 字）
+ANTI_BOT_PHRASES: Tuple[str, ...] = (
+    "访问过于频繁", "请求过于频繁", "操作过于频繁", "系统检测到异常访问",
+    "疑似机器人", "人机验证", "安全验证", "请完成验证", "ip被封", "禁止访问",
+    "access denied", "forbidden", "rate limit", "too many requests",
+)
+
+# 文章页反爬虫提示短语（匹配全部正文）
+ARTICLE_ANTI_BOT_PHRASES: Tuple[str, ...] = (
+    *ANTI_BOT_PHRASES,
+    "您的访问过于频繁", "请稍后再试", "滑动验证", "点选验证", "阿里云盾",
+    "腾讯云天御", "风险控制", "安全检测", "cc防御", "waf防火墙", "访问被拒绝",
+    "blocked",
+)
+
+# 验证码元素选择器
+CAPTCHA_SELECTORS: Tuple[str, ...] = (
+    '#captcha', '.captcha', '[class*="captcha"]', '#geetest',
+    '[class*="geetest"]', '.recaptcha', '[class*="recaptcha"]',
+    '.verify', '[class*="verify"]',
+)
+
+# 文章页验证码元素选择器
+ARTICLE_CAPTCHA_SELECTORS: Tuple[str, ...] = (
+    *CAPTCHA_SELECTORS,
+    '[id*="captcha"]', '.geetest', '.validate', '[class*="validate"]',
+    'iframe[src*="captcha"]', 'iframe[src*="verify"]',
+)
+
+# IP 封禁提示
+IP_BLOCKED_PHRASES: Tuple[str, ...] = (
+    "ip被封", "ip已被封", "ip禁止", "ip限制", "封禁ip", "禁止ip", "blocked ip", "ip blocked",
+)
+
+# 需要登录的提示
+LOGIN_KEYWORDS: Tuple[str, ...] = ("登录", "login", "signin", "请先登录", "需要登录")
+
+# 错误页标题关键词
+ERROR_TITLE_KEYWORDS: Tuple[str, ...] = ("404", "不存在", "无法访问", "not found", "页面不存在", "访问失败")
+
+# 文章标题选择器（按优先级）
+TITLE_SELECTORS: Tuple[str, ...] = (
+    "h1",
+    ".article-title",
+    ".news-title",
+    ".title",
+    "[class*='title']",
+    "#title",
+)
+
+# 正文容器与正文区域图片选择器
+CONTENT_CONTAINER_SELECTOR = '.content, .article-content, main, [class*="content"]'
+CONTENT_IMAGE_SELECTOR = (
+    'article img, .content img, .article-content img, main img, .news-content img, [class*="content"] img'
+)
+
+
+@dataclass(frozen=True)
+class InspectionProfile:
+    """检查配置：要检测的拦截信号以及是否返回页面数据"""
+    captcha_selectors: Tuple[str, ...] = CAPTCHA_SELECTORS
+    anti_bot_phrases: Tuple[str, ...] = ()  # 在全部正文中匹配的短语（为空时不匹配）
+    include_document: bool = False  # 是否返回页面 HTML 和图片属性
+
+    def to_args(self) -> dict:
+        """转换为检查脚本参数"""
+        return {
+            "titleSelectors": list(TITLE_SELECTORS),
+            "captchaSelectors": list(self.captcha_selectors),
+            "antiBotPhrases": [phrase.lower() for phrase in self.anti_bot_phrases],
+            "ipBlockedPhrases": list(IP_BLOCKED_PHRASES),
+            "loginKeywords": list(LOGIN_KEYWORDS),
+            "contentSelector": CONTENT_CONTAINER_SELECTOR,
+            "imageSelector": CONTENT_IMAGE_SELECTOR,
+            "includeDocument": self.include_document,
+        }
+
+
+# 搜索结果页：只检测拦截信号
+SEARCH_INSPECTION = InspectionProfile()
+
+# 文章页：完整的状态检查 + 标题候选、页面 HTML 和图片属性
+ARTICLE_INSPECTION = InspectionProfile(
+    captcha_selectors=ARTICLE_CAPTCHA_SELECTORS,
+    anti_bot_phrases=ARTICLE_ANTI_BOT_PHRASES,
+    include_document=True,
+)
+
+
+@dataclass
+class PageSnapshot:
+    """一次页面检查的结果"""
+    status: int  # 导航响应状态码（Navigation Timing 不支持时为 0）
+    title: str
+    title_candidates: List[str]  # 与 TITLE_SELECTORS 一一对应的首个匹配元素文本
+    body_text: str  # 正文前 500 字
+    text_length: int
+    has_body: bool
+    has_article: bool
+    has_content: bool
+    captcha_elements: List[str]  # 命中的验证码选择器
+    anti_bot_phrases: List[str]  # 正文中命中的反爬虫短语
+    ip_blocked: bool
+    needs_login: bool
+    html: str = ""  # 序列化后的页面 HTML（include_document 时返回）
+    images: List[dict] = field(default_factory=list)  # 正文区域图片属性（include_document 时返回）
+    elapsed_ms: float = 0.0
+
+
+# 在浏览器内执行的检查脚本
+_INSPECTION_SCRIPT = """(opts) => {
+    const body = document.body;
+    const fullText = body ? (body.innerText || '') : '';
+    const lowerText = fullText.toLowerCase();
+    const query = (selector) => {
+        try { return document.querySelector(selector); } catch (e) { return null; }
+    };
+    const nav = window.performance?.getEntriesByType?.('navigation')?.[0];
+
+    const snapshot = {
+        status: nav?.responseStatus || 0,
+        title: document.title || '',
+        titleCandidates: opts.titleSelectors.map(selector => {
+            const el = query(selector);
+            return el ? (el.textContent || '').trim() : '';
+        }),
+        bodyText: fullText.substring(0, 500),
+        textLength: fullText.trim().length,
+        hasBody: !!body,
+        hasArticle: !!query('article'),
+        hasContent: !!query(opts.contentSelector),
+        captchaElements: opts.captchaSelectors.filter(selector => !!query(selector)),
+        antiBotPhrases: opts.antiBotPhrases.filter(phrase => lowerText.includes(phrase)),
+        ipBlocked: opts.ipBlockedPhrases.some(phrase => lowerText.includes(phrase)),
+        needsLogin: opts.loginKeywords.some(keyword => fullText.includes(keyword)),
+        html: '',
+        images: [],
+    };
+    if (!opts.includeDocument) return snapshot;
+
+    const doctype = document.doctype ? new XMLSerializer().serializeToString(document.doctype) : '';
+    snapshot.html = doctype + document.documentElement.outerHTML;
+    snapshot.images = Array.from(document.querySelectorAll(opts.imageSelector)).map(img => ({
+        src: img.src || img.getAttribute('data-src') || '',
+        alt: img.alt || '',
+        title: img.title || '',
+        width: img.width || 0,
+        height: img.height || 0,
+        naturalWidth: img.naturalWidth || 0,
+        naturalHeight: img.naturalHeight || 0,
+    }));
+    return snapshot;
+}"""
+
+
+class InspectionStats:
+    """页面检查耗时统计"""
+
+    def __init__(self):
+        self.inspections = 0
+        self.failures = 0
+        self._latency = LatencyWindow()
+
+    def record(self, elapsed_ms: float) -> None:
+        """记录一次成功的检查"""
+        self.inspections += 1
+        self._latency.add(elapsed_ms)
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "inspections": self.inspections,
+            "failures": self.failures,
+            "latency_ms": self._latency.summary(),
+        }
+
+
+_inspection_stats = InspectionStats()
+
+
+def get_inspection_stats() -> InspectionStats:
+    """获取全局页面检查统计"""
+    return _inspection_stats
+
+
+async def inspect_page(page: Page, profile: InspectionProfile = SEARCH_INSPECTION) -> PageSnapshot:
+    """一次往返获取页面状态、拦截信号和（按需）页面数据
+
+    Args:
+        page: Playwright页面对象
+        profile: 检查配置
+
+    Returns:
+        PageSnapshot: 检查结果
+
+    Raises:
+        playwright.async_api.Error: 页面已关闭或脚本执行失败
+    """
+    start = time.perf_counter()
+    try:
+        raw = await page.evaluate(_INSPECTION_SCRIPT, profile.to_args())
+    except Exception:
+        _inspection_stats.failures += 1
+        raise
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    _inspection_stats.record(elapsed_ms)
+
+    snapshot = PageSnapshot(
+        status=raw.get("status") or 0,
+        title=raw.get("title", ""),
+        title_candidates=raw.get("titleCandidates", []),
+        body_text=raw.get("bodyText", ""),
+        text_length=raw.get("textLength", 0),
+        has_body=raw.get("hasBody", False),
+        has_article=raw.get("hasArticle", False),
+        has_content=raw.get("hasContent", False),
+        captcha_elements=raw.get("captchaElements", []),
+        anti_bot_phrases=raw.get("antiBotPhrases", []),
+        ip_blocked=raw.get("ipBlocked", False),
+        needs_login=raw.get("needsLogin", False),
+        html=raw.get("html", ""),
+        images=raw.get("images", []),
+        elapsed_ms=elapsed_ms,
+    )
+    logger.debug(
+        f"   🔎 页面检查完成 [{elapsed_ms:.0f}ms, HTML {len(snapshot.html) / 1024:.0f}KB, "
+        f"{len(snapshot.images)} 张图片]"
+    )
+    return snapshot
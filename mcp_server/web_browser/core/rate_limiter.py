@@ -1,11 +1,54 @@
-"""速率限制器 - 基于域名和搜索引擎的速率限制"""
+"""速率限制器 - 基于域名和搜索引擎的 GCRA（通用信元速率算法）限流
+
+每个键（域名或引擎）只保存一个"理论到达时间"（TAT）。请求到来时同步计算预约时间并推进 TAT，
+然后在任何锁之外等待到预约时间。不同键之间互不阻塞，同一键的并发请求按预约顺序依次放行。
+
+- 速率：每个键每个时间窗口允许的请求数（可按键单独配置）
+- 突发容量：空闲后允许连续放行的请求数
+- 等待时间直方图：按维度（domain / engine）统计
+"""
 
 import asyncio
+import bisect
 import time
-from typing import Optional
+from typing import Dict, Optional
 
 from loguru import logger
 
+# 等待时间直方图的桶上限（秒）
+WAIT_BUCKETS = (0.0, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+# 键数量超过该值时清理已空闲的键
+_PRUNE_THRESHOLD = 1024
+
+
+class WaitHistogram:
+    """等待时间直方图"""
+
+    def __init__(self):
+        self.counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def add(self, wait: float) -> None:
+        """记录一次等待"""
+        self.counts[bisect.bisect_left(WAIT_BUCKETS, wait)] += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def to_dict(self) -> dict:
+        """转换为字典（桶标签为等待时间上限）"""
+        requests = sum(self.counts)
+        buckets = {f"<={bound}s": count for bound, count in zip(WAIT_BUCKETS, self.counts)}
+        buckets[f">{WAIT_BUCKETS[-1]}s"] = self.counts[-1]
+        return {
+            "requests": requests,
+            "throttled": requests - self.counts[0],
+            "avg_wait_s": round(self.total_wait / requests, 3) if requests else 0.0,
+            "max_wait_s": round(self.max_wait, 3),
+            "histogram": buckets,
+        }
+
 
 class RateLimiter:
     """速率限制器 - 支持域名和搜索引擎两个维度的速率限制"""
@@ -15,24 +58,26 @@ class RateLimiter:
         time_window: float = 1.0,
         max_domain_requests: int = 2,
         max_engine_requests: int = 2,
+        burst: Optional[int] = None,
+        overrides: Optional[Dict[str, float]] = None,
     ):
         """
         Args:
             time_window: 时间窗口（秒）
             max_domain_requests: 同一域名时间窗口内最大请求数
             max_engine_requests: 同一搜索引擎时间窗口内最大请求数
+            burst: 突发容量（空闲后可连续放行的请求数），为 None 时等于该键的窗口内最大请求数
+            overrides: 按键覆盖的时间窗口内最大请求数 {域名或引擎ID: 请求数}，可为小数（如 0.5）
         """
         self.time_window = time_window
         self.max_domain_requests = max_domain_requests
         self.max_engine_requests = max_engine_requests
+        self.burst = burst
+        self.overrides = dict(overrides or {})
 
-        # 域名维度的请求记录 {domain: [timestamps]}
-        self.domain_requests: dict = {}
-
-        # 搜索引擎维度的请求记录 {engine_name: [timestamps]}
-        self.engine_requests: dict = {}
-
-        self._lock = asyncio.Lock()
+        # 各键的理论到达时间 {"domain:xxx" / "engine:xxx": tat}
+        self._tat: Dict[str, float] = {}
+        self._histograms = {"domain": WaitHistogram(), "engine": WaitHistogram()}
 
     def _extract_domain(self, url: str) -> str:
         """从URL中提取域名"""
@@ -43,71 +88,78 @@ class RateLimiter:
         except Exception:
             return "unknown"
 
+    def _limits(self, key: str, default_rate: float) -> tuple[float, float]:
+        """计算键的发射间隔和突发容忍时间
+
+        Returns:
+            (interval, tolerance)：相邻请求的最小间隔，以及允许提前放行的时间
+        """
+        rate = self.overrides.get(key, default_rate)
+        interval = self.time_window / rate
+        burst = self.burst if self.burst is not None else max(1, int(rate))
+        return interval, interval * (burst - 1)
+
+    def _reserve(self, dimension: str, key: str, default_rate: float, now: float) -> float:
+        """为键预约一个时间槽，返回需要等待的秒数（同步执行，不会被其他协程打断）"""
+        interval, tolerance = self._limits(key, default_rate)
+        slot = f"{dimension}:{key}"
+        tat = max(self._tat.get(slot, now), now)
+        wait = max(0.0, tat - tolerance - now)
+        self._tat[slot] = tat + interval
+        return wait
+
+    def _prune(self, now: float) -> None:
+        """清理已空闲（TAT 早于当前时间）的键"""
+        if len(self._tat) > _PRUNE_THRESHOLD:
+            self._tat = {slot: tat for slot, tat in self._tat.items() if tat > now}
+
     async def acquire(
         self,
         domain: Optional[str] = None,
         engine: Optional[str] = None,
-    ) -> None:
+    ) -> float:
         """获取访问许可（支持域名和引擎两个维度的速率限制）
 
         Args:
             domain: 域名（可选，用于域名级别的限流）
             engine: 搜索引擎名称（可选，用于引擎级别的限流）
 
+        Returns:
+            实际等待的秒数
+
         Note:
-            移除了全局限制，允许不同域名/引擎的并发请求
+            预约在单次同步调用中完成，等待发生在锁之外：被限流的键只会让自己的请求等待，
+            不会阻塞其他域名或引擎的请求
         """
-        async with self._lock:
-            now = time.time()
-
-            # 1. 域名级别速率限制
-            if domain:
-                await self._acquire_domain(now, domain)
-
-            # 2. 搜索引擎级别速率限制
-            if engine:
-                await self._acquire_engine(now, engine)
-
-    async def _acquire_domain(self, now: float, domain: str) -> None:
-        """域名级别的速率限制"""
-        if domain not in self.domain_requests:
-            self.domain_requests[domain] = []
-
-        # 清理过期记录
-        self.domain_requests[domain] = [
-            t for t in self.domain_requests[domain] if now - t < self.time_window
-        ]
-
-        if len(self.domain_requests[domain]) >= self.max_domain_requests:
-            sleep_time = self.time_window - (now - self.domain_requests[domain][0])
-            if sleep_time > 0:
-                logger.debug(f"⏸️ [域名限制 {domain}] 等待 {sleep_time:.2f} 秒")
-                await asyncio.sleep(sleep_time)
-                now = time.time()
-                self.domain_requests[domain] = [
-                    t for t in self.domain_requests[domain] if now - t < self.time_window
-                ]
-
-        self.domain_requests[domain].append(now)
-
-    async def _acquire_engine(self, now: float, engine: str) -> None:
-        """搜索引擎级别的速率限制"""
-        if engine not in self.engine_requests:
-            self.engine_requests[engine] = []
-
-        # 清理过期记录
-        self.engine_requests[engine] = [
-            t for t in self.engine_requests[engine] if now - t < self.time_window
-        ]
-
-        if len(self.engine_requests[engine]) >= self.max_engine_requests:
-            sleep_time = self.time_window - (now - self.engine_requests[engine][0])
-            if sleep_time > 0:
-                logger.debug(f"⏸️ [引擎限制 {engine}] 等待 {sleep_time:.2f} 秒")
-                await asyncio.sleep(sleep_time)
-                now = time.time()
-                self.engine_requests[engine] = [
-                    t for t in self.engine_requests[engine] if now - t < self.time_window
-                ]
-
-        self.engine_requests[engine].append(now)
+        now = time.monotonic()
+        self._prune(now)
+
+        wait = 0.0
+        if domain:
+            domain_wait = self._reserve("domain", domain, self.max_domain_requests, now)
+            self._histograms["domain"].add(domain_wait)
+            wait = max(wait, domain_wait)
+        if engine:
+            engine_wait = self._reserve("engine", engine, self.max_engine_requests, now)
+            self._histograms["engine"].add(engine_wait)
+            wait = max(wait, engine_wait)
+
+        if wait > 0:
+            logger.debug(f"⏸️ [速率限制 {engine or domain}] 等待 {wait:.2f} 秒")
+            await asyncio.sleep(wait)
+        return wait
+
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        now = time.monotonic()
+        return {
+            "algorithm": "gcra",
+            "time_window": self.time_window,
+            "max_domain_requests": self.max_domain_requests,
+            "max_engine_requests": self.max_engine_requests,
+            "burst": self.burst,
+            "overrides": dict(self.overrides),
+            "active_keys": sum(1 for tat in self._tat.values() if tat > now),
+            "domain_wait": self._histograms["domain"].to_dict(),
+            "engine_wait": self._histograms["engine"].to_dict(),
+        }
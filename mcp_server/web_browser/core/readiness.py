@@ -0,0 +1,165 @@
+"""页面就绪检测 - 声明式的结果就绪条件
+
+引擎声明结果容器选择器和"结果数量稳定"条件，检测逻辑通过
+``page.wait_for_function`` 在浏览器内轮询执行，结果数量达到目标或
+连续若干次采样不再变化即返回，不需要任何固定时长的等待。
+"""
+
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from loguru import logger
+
+from .metrics import LatencyWindow
+
+
+@dataclass(frozen=True)
+class ReadinessCondition:
+    """结果就绪条件"""
+    result_selector: Optional[str] = None  # 结果条目选择器（为 None 时不等待）
+    timeout: int = 5000  # 最长等待时间（毫秒）
+    poll_interval: int = 250  # 浏览器内采样间隔（毫秒）
+    stable_rounds: int = 2  # 结果数量连续多少次采样不变视为稳定
+    min_results: int = 1  # 判定稳定所需的最少结果数
+    scroll_to_load: bool = False  # 结果不足时滚动到底部以触发懒加载
+    fixed_wait_budget_ms: int = 0  # 旧实现在结果出现后的固定等待时长（仅用于统计节省的时间）
+
+
+@dataclass
+class ReadinessReport:
+    """一次就绪检测的结果"""
+    ready: bool
+    result_count: int
+    elapsed_ms: float  # 总等待时间
+    reason: str
+    settle_ms: float = 0.0  # 首个结果出现到判定就绪的时间（对应旧实现的固定等待）
+
+
+# 在浏览器内执行的就绪判定函数（状态按 token 存放在 window 上，避免多次调用互相干扰）
+_READINESS_SCRIPT = """([selector, target, minCount, stableRounds, scroll, token]) => {
+    const store = (window.__mcpReadiness = window.__mcpReadiness || {});
+    const state = store[token] || (store[token] = {last: -1, stable: 0, first: null});
+    const count = document.querySelectorAll(selector).length;
+    const now = performance.now();
+    if (count >= minCount && state.first === null) state.first = now;
+    const settle = state.first === null ? 0 : now - state.first;
+    if (count >= target) return {count, settle, reason: 'target'};
+    if (count >= minCount && count === state.last) {
+        state.stable += 1;
+    } else {
+        state.stable = 0;
+    }
+    state.last = count;
+    if (state.stable >= stableRounds) return {count, settle, reason: 'stable'};
+    if (scroll && count > 0) window.scrollTo(0, document.body.scrollHeight);
+    return false;
+}"""
+
+_COUNT_SCRIPT = "(selector) => document.querySelectorAll(selector).length"
+
+_token_counter = itertools.count()
+
+
+class ReadinessStats:
+    """按引擎记录就绪等待耗时及相对旧固定等待节省的时间"""
+
+    def __init__(self):
+        self._wait: Dict[str, LatencyWindow] = {}
+        self._saved: Dict[str, LatencyWindow] = {}
+        self._timeouts: Dict[str, int] = {}
+
+    def record(self, engine_id: str, condition: ReadinessCondition, report: ReadinessReport) -> None:
+        """记录一次就绪检测"""
+        self._wait.setdefault(engine_id, LatencyWindow()).add(report.elapsed_ms)
+        if condition.fixed_wait_budget_ms and report.ready:
+            saved = condition.fixed_wait_budget_ms - report.settle_ms
+            self._saved.setdefault(engine_id, LatencyWindow()).add(saved)
+        if not report.ready:
+            self._timeouts[engine_id] = self._timeouts.get(engine_id, 0) + 1
+
+    def get_stats(self) -> dict:
+        """获取各引擎的就绪等待 p50/p95（毫秒）"""
+        stats = {}
+        for engine_id, window in self._wait.items():
+            stats[engine_id] = {
+                "wait_ms": window.summary(),
+                "timeouts": self._timeouts.get(engine_id, 0),
+            }
+            if engine_id in self._saved:
+                stats[engine_id]["saved_ms"] = self._saved[engine_id].summary()
+        return stats
+
+
+_readiness_stats = ReadinessStats()
+
+
+def get_readiness_stats() -> ReadinessStats:
+    """获取全局就绪统计"""
+    return _readiness_stats
+
+
+async def wait_for_ready(
+    page,
+    condition: ReadinessCondition,
+    target_count: int,
+    engine_id: str = "",
+) -> ReadinessReport:
+    """等待结果就绪：数量达到目标，或数量稳定不再变化
+
+    Args:
+        page: Playwright Page 对象
+        condition: 就绪条件
+        target_count: 目标结果数量（达到即返回）
+        engine_id: 引擎ID（用于统计）
+
+    Returns:
+        ReadinessReport: 就绪检测结果
+    """
+    if not condition.result_selector:
+        return ReadinessReport(ready=True, result_count=0, elapsed_ms=0.0, reason="no_condition")
+
+    start = time.perf_counter()
+    token = f"r{next(_token_counter)}"
+    try:
+        handle = await page.wait_for_function(
+            _READINESS_SCRIPT,
+            arg=[
+                condition.result_selector,
+                max(target_count, condition.min_results),
+                condition.min_results,
+                condition.stable_rounds,
+                condition.scroll_to_load,
+                token,
+            ],
+            polling=condition.poll_interval,
+            timeout=condition.timeout,
+        )
+        outcome = await handle.json_value()
+        report = ReadinessReport(
+            ready=True,
+            result_count=outcome["count"],
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            reason=outcome["reason"],
+            settle_ms=outcome["settle"],
+        )
+    except Exception as e:
+        try:
+            count = await page.evaluate(_COUNT_SCRIPT, condition.result_selector)
+        except Exception:
+            count = 0
+        report = ReadinessReport(
+            ready=False,
+            result_count=count,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            reason=f"timeout: {type(e).__name__}",
+        )
+
+    if engine_id:
+        _readiness_stats.record(engine_id, condition, report)
+    logger.debug(
+        f"   ⏱️ 就绪检测 [{engine_id or '-'}] {report.reason}: "
+        f"{report.result_count} 条, {report.elapsed_ms:.0f}ms"
+    )
+    return report
@@ -0,0 +1,471 @@
+"""资源拦截器 - 将静态拦截规则下推到浏览器内执行
+
+旧实现为每个 Context 注册 ``context.route("**/*", handler)``，每个子资源请求都要
+跨越 Playwright IPC 进入 Python 协程判断 abort/continue。本模块把拦截策略
+（``BlockPolicy``）编译为 URL 通配规则：
+
+- native 模式：通过 CDP ``Network.setBlockedURLs`` 下发到 Chromium，匹配的请求在
+  浏览器网络栈中直接拦截，不经过 Python；未匹配的请求正常加载，同样不经过 Python。
+  没有扩展名的图片/字体等（如带查询参数的 CDN 地址）匹配不到通配规则，再用 CDP
+  ``Fetch.enable`` 按资源类型兜底：被拦截类型的请求会暂停并进入 Python 一次，随即被拦截，
+  统计中计入 intercepted 而不是 native_blocked。
+  兜底可通过 ``native_type_fallback`` 关闭，此时只有通配规则生效，全程不经过 Python。
+  无法使用 CDP 时退化为只匹配待拦截 URL 的正则路由（未匹配请求仍不进入 Python，
+  此时无扩展名的资源不会被拦截）。
+- route 模式：保留逐请求 Python 判断（按 resource_type 精确拦截），用于对比和排障。
+
+拦截策略除资源类型外还支持按域名过滤：
+
+- trackers：拦截内置追踪/广告/评论挂件域名列表（``config/blocklists/trackers.txt``，
+  可通过 ``tracker_blocklist_file`` 追加）
+- first_party：在 trackers 基础上，只放行站点自身域名和常见 CDN
+  （``config/blocklists/cdn_domains.txt``），其余第三方请求一律拦截
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from ..config.settings import get_settings
+from .metrics import LatencyWindow
+
+# 资源类型 -> URL 通配规则（CDP setBlockedURLs 语法，* 匹配任意字符）
+_EXTENSIONS: Dict[str, Tuple[str, ...]] = {
+    "image": ("jpg", "jpeg", "png", "gif", "webp", "bmp", "svg", "ico", "avif"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "m3u8", "mp3", "m4a", "flv", "ogg", "wav"),
+    "stylesheet": ("css",),
+    "script": ("js",),
+}
+
+# 资源类型 -> CDP ResourceType（native 模式按类型兜底拦截）
+_CDP_RESOURCE_TYPES: Dict[str, str] = {
+    "image": "Image",
+    "font": "Font",
+    "media": "Media",
+    "stylesheet": "Stylesheet",
+    "script": "Script",
+}
+
+# 图标类请求（与旧实现一致：URL 包含 icon / favicon 即拦截）
+_ICON_PATTERNS: Tuple[str, ...] = ("*favicon*", "*icon*")
+
+# 原生拦截时 Chromium 报告的失败原因
+_BLOCKED_BY_CLIENT = "net::ERR_BLOCKED_BY_CLIENT"
+
+# 拦截列表中的域名过滤标记（与资源类型一起出现在 get_resource_block_list() 中）
+TRACKER = "tracker"  # 拦截追踪/广告域名
+THIRD_PARTY = "third_party"  # 只放行第一方域名和常见 CDN
+
+# 默认拦截的资源类型
+DEFAULT_RESOURCE_TYPES: Tuple[str, ...] = ("image", "font", "media")
+
+# 拦截模式
+BLOCK_MODES = ("default", "trackers", "first_party")
+
+_BLOCKLIST_DIR = Path(__file__).resolve().parent.parent / "config" / "blocklists"
+
+# 常见的二级公共后缀（用于推断文章的第一方域名）
+_SECOND_LEVEL_SUFFIXES = {
+    "com.cn", "net.cn", "org.cn", "gov.cn", "edu.cn", "ac.cn",
+    "com.hk", "com.tw", "co.uk", "co.jp",
+}
+
+# 页面加载指标（about:blank 返回 null）
+_LOAD_METRICS_SCRIPT = """() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav || location.href === 'about:blank') return null;
+    let bytes = nav.transferSize || 0;
+    for (const r of performance.getEntriesByType('resource')) bytes += r.transferSize || 0;
+    return {
+        load: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+        domReady: nav.domContentLoadedEventEnd > 0 ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        bytes,
+    };
+}"""
+
+
+def _read_domain_file(path: Path) -> List[str]:
+    """读取域名列表文件（每行一个域名，# 开头为注释）"""
+    domains = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip().lower()
+        if line:
+            domains.append(line.lstrip("*.").rstrip("."))
+    return domains
+
+
+@lru_cache(maxsize=1)
+def load_tracker_domains() -> Tuple[str, ...]:
+    """加载追踪/广告域名列表（内置列表 + 配置的额外列表）"""
+    domains = _read_domain_file(_BLOCKLIST_DIR / "trackers.txt")
+    extra_file = get_settings().tracker_blocklist_file
+    if extra_file:
+        try:
+            domains.extend(_read_domain_file(Path(extra_file)))
+        except OSError as e:
+            logger.warning(f"⚠️ 无法读取额外的追踪域名列表 {extra_file}: {e}")
+    return tuple(dict.fromkeys(domains))
+
+
+@lru_cache(maxsize=1)
+def load_cdn_domains() -> Tuple[str, ...]:
+    """加载常见 CDN 域名列表（first_party 模式下放行）"""
+    return tuple(dict.fromkeys(_read_domain_file(_BLOCKLIST_DIR / "cdn_domains.txt")))
+
+
+def registrable_domain(host: str) -> str:
+    """获取主机名的可注册域名（如 news.sina.com.cn -> sina.com.cn）"""
+    labels = host.lower().strip(".").split(".")
+    if len(labels) <= 2:
+        return ".".join(labels)
+    if ".".join(labels[-2:]) in _SECOND_LEVEL_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+class BlockingStats:
+    """拦截统计：区分浏览器原生拦截与进入 Python 的请求，并按模式记录页面加载指标"""
+
+    def __init__(self):
+        self.blocked_by_client = 0  # 浏览器报告 ERR_BLOCKED_BY_CLIENT 的请求数（含按类型兜底拦截的）
+        self.type_blocked = 0  # 按资源类型兜底拦截的数量（经 CDP Fetch 进入 Python）
+        self.intercepted = 0  # 进入 Python 处理的请求数（路由处理器 + 按类型兜底）
+        self.intercepted_aborted = 0  # 其中被 Python 拦截的数量
+        self.third_party_blocked = 0  # first_party 模式拦截的第三方请求数
+        self.native_pages = 0  # 成功下发原生规则的页面数
+        self.fallback_pages = 0  # 退化为正则路由的页面数
+        self._loads: Dict[str, Dict[str, LatencyWindow]] = {}
+
+    def record_load(self, label: str, metrics: dict) -> None:
+        """记录一次页面加载（label 形如 "serp:trackers"、"page:first_party"）"""
+        windows = self._loads.setdefault(label, {
+            "load_ms": LatencyWindow(),
+            "dom_ready_ms": LatencyWindow(),
+            "transfer_kb": LatencyWindow(),
+        })
+        if metrics.get("load") is not None:
+            windows["load_ms"].add(metrics["load"])
+        if metrics.get("domReady") is not None:
+            windows["dom_ready_ms"].add(metrics["domReady"])
+        windows["transfer_kb"].add(metrics.get("bytes", 0) / 1024)
+
+    @property
+    def native_blocked(self) -> int:
+        """浏览器内直接拦截、不经过 Python 的请求数"""
+        return max(0, self.blocked_by_client - self.type_blocked)
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "native_blocked": self.native_blocked,
+            "type_blocked": self.type_blocked,
+            "intercepted": self.intercepted,
+            "intercepted_aborted": self.intercepted_aborted,
+            "third_party_blocked": self.third_party_blocked,
+            "native_pages": self.native_pages,
+            "fallback_pages": self.fallback_pages,
+            "by_mode": {
+                label: {name: window.summary() for name, window in windows.items()}
+                for label, windows in self._loads.items()
+            },
+        }
+
+
+_blocking_stats = BlockingStats()
+
+
+def get_blocking_stats() -> BlockingStats:
+    """获取全局拦截统计"""
+    return _blocking_stats
+
+
+def compile_block_patterns(block_list: Iterable[str], block_trackers: bool = False) -> List[str]:
+    """将资源类型列表编译为 URL 通配规则
+
+    Args:
+        block_list: 资源类型列表，如 ["image", "font", "media"]
+        block_trackers: 是否同时拦截追踪/广告域名
+
+    Returns:
+        URL 通配规则列表（同时覆盖带查询参数的 URL）
+    """
+    return list(_compiled_patterns(tuple(block_list), block_trackers))
+
+
+@lru_cache(maxsize=64)
+def _compiled_patterns(block_list: Tuple[str, ...], block_trackers: bool) -> Tuple[str, ...]:
+    """编译并缓存通配规则（同一策略的所有页面共用）"""
+    patterns: List[str] = []
+    for resource_type in block_list:
+        for ext in _EXTENSIONS.get(resource_type, ()):
+            patterns.append(f"*.{ext}")
+            patterns.append(f"*.{ext}?*")
+    patterns.extend(_ICON_PATTERNS)
+    if block_trackers:
+        for domain in load_tracker_domains():
+            patterns.append(f"*://{domain}/*")
+            patterns.append(f"*://*.{domain}/*")
+    return tuple(patterns)
+
+
+def _patterns_to_regex(patterns: Iterable[str]) -> re.Pattern:
+    """将通配规则转换为等价的正则表达式（用于非 Chromium 的退化路由）"""
+    parts = [".*".join(re.escape(chunk) for chunk in p.split("*")) for p in patterns]
+    return re.compile(r"^(?:" + "|".join(parts) + r")$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _pattern_regex(patterns: Tuple[str, ...]) -> re.Pattern:
+    """缓存通配规则对应的正则表达式"""
+    return _patterns_to_regex(patterns)
+
+
+@lru_cache(maxsize=256)
+def _third_party_regex(first_party_domains: Tuple[str, ...]) -> re.Pattern:
+    """构建只匹配第三方请求的正则（第一方域名和常见 CDN 不匹配，直接由浏览器加载）"""
+    allowed = dict.fromkeys(first_party_domains + load_cdn_domains())
+    hosts = "|".join(re.escape(domain) for domain in allowed)
+    return re.compile(
+        r"^https?://(?!(?:[^/?#]*\.)?(?:" + hosts + r")(?::\d+)?(?:[/?#]|$))",
+        re.IGNORECASE,
+    )
+
+
+@dataclass(frozen=True)
+class BlockPolicy:
+    """资源拦截策略：资源类型 + 域名过滤模式"""
+    resource_types: Tuple[str, ...]
+    mode: str = "default"  # "default" | "trackers" | "first_party"
+    first_party_domains: Tuple[str, ...] = ()  # first_party 模式下放行的站点域名
+
+    @classmethod
+    def from_block_list(cls, block_list: Iterable[str], first_party_domains: Iterable[str] = ()) -> "BlockPolicy":
+        """从引擎的拦截列表构建策略（列表中可包含 "tracker" / "third_party" 标记）"""
+        block_list = list(block_list)
+        resource_types = tuple(t for t in block_list if t not in (TRACKER, THIRD_PARTY))
+        first_party_domains = tuple(first_party_domains)
+        if THIRD_PARTY in block_list and first_party_domains:
+            mode = "first_party"
+        elif TRACKER in block_list or THIRD_PARTY in block_list:
+            mode = "trackers"
+        else:
+            mode = "default"
+        return cls(resource_types=resource_types, mode=mode, first_party_domains=first_party_domains)
+
+    @classmethod
+    def for_url(
+        cls, url: str, mode: str, resource_types: Iterable[str] = DEFAULT_RESOURCE_TYPES
+    ) -> "BlockPolicy":
+        """为单个页面（如文章页）构建策略，first_party 模式以 URL 的可注册域名为第一方
+
+        Raises:
+            ValueError: 未知的拦截模式
+        """
+        if mode not in BLOCK_MODES:
+            raise ValueError(f"未知的拦截模式: {mode}（可选: {', '.join(BLOCK_MODES)}）")
+        first_party_domains: Tuple[str, ...] = ()
+        if mode == "first_party":
+            host = urlparse(url).hostname or ""
+            first_party_domains = (registrable_domain(host),) if host else ()
+        return cls(resource_types=tuple(resource_types), mode=mode, first_party_domains=first_party_domains)
+
+    @property
+    def blocks_trackers(self) -> bool:
+        """是否拦截追踪/广告域名"""
+        return self.mode in ("trackers", "first_party")
+
+    @property
+    def patterns(self) -> Tuple[str, ...]:
+        """下发到浏览器的通配规则"""
+        return _compiled_patterns(self.resource_types, self.blocks_trackers)
+
+    @property
+    def third_party_regex(self) -> Optional[re.Pattern]:
+        """只匹配第三方请求的正则（非 first_party 模式返回 None）"""
+        if self.mode != "first_party" or not self.first_party_domains:
+            return None
+        return _third_party_regex(self.first_party_domains)
+
+
+@dataclass
+class PageBlockState:
+    """页面级拦截状态（随页面复用保留）"""
+    cdp_session: Any = None
+    native_unavailable: bool = False  # CDP 不可用（非 Chromium），使用正则路由
+    blocked_patterns: Optional[Tuple[str, ...]] = None  # 当前已下发的通配规则
+    blocked_types: Optional[Tuple[str, ...]] = None  # 当前按资源类型兜底拦截的类型
+    transfer_bytes: int = 0  # 本次使用期间的传输字节数（CDP 统计）
+
+
+class ResourceBlocker:
+    """资源拦截器（每个 Context 一个实例，持有该 Context 的默认策略）"""
+
+    def __init__(self, policy: BlockPolicy, mode: str = "native", type_fallback: bool = True):
+        """
+        Args:
+            policy: Context 默认的拦截策略（通常来自引擎）
+            mode: 拦截模式（"native" | "route"）
+            type_fallback: native 模式下是否按资源类型兜底拦截（被拦截的请求经 CDP 进入 Python）
+        """
+        self.policy = policy
+        self.mode = mode
+        self.type_fallback = type_fallback
+
+    async def install(self, context) -> None:
+        """在 Context 上安装拦截统计（创建 Context 后调用一次）"""
+        if self.mode == "native":
+            # 统计原生拦截数量（仅事件通知，不阻塞请求加载）
+            context.on("requestfailed", self._on_request_failed)
+
+    async def apply_to_page(self, page, state: PageBlockState, policy: Optional[BlockPolicy] = None) -> None:
+        """为页面应用拦截策略（每次取出页面时调用）
+
+        CDP 规则绑定在页面上，页面重置（about:blank）后仍然有效，只有策略变化时才重新下发；
+        页面级路由（退化路由、第三方过滤、route 模式）在页面重置时被移除，每次重新注册。
+
+        Args:
+            page: Playwright Page 对象
+            state: 页面级拦截状态
+            policy: 本次请求的策略；为 None 时使用 Context 默认策略
+        """
+        policy = policy or self.policy
+        state.transfer_bytes = 0
+
+        if self.mode == "route":
+            await page.route("**/*", lambda route: self._route_handler(route, policy))
+            return
+
+        if state.cdp_session is None and not state.native_unavailable:
+            await self._open_cdp_session(page, state)
+
+        if state.cdp_session is not None:
+            await self._push_native_rules(state, policy)
+        elif policy.patterns:
+            # 非 Chromium 浏览器：退化为只匹配待拦截 URL 的正则路由
+            await page.route(_pattern_regex(policy.patterns), self._abort_handler)
+            _blocking_stats.fallback_pages += 1
+
+        third_party = policy.third_party_regex
+        if third_party is not None:
+            # 正则只匹配第三方请求：第一方和 CDN 请求不进入 Python
+            await page.route(third_party, self._abort_third_party)
+
+    async def prepare(self, page, state: PageBlockState) -> None:
+        """预热页面时提前建立 CDP 会话并下发默认规则（不注册页面级路由）"""
+        if self.mode != "native" or state.cdp_session is not None or state.native_unavailable:
+            return
+        await self._open_cdp_session(page, state)
+        if state.cdp_session is not None:
+            await self._push_native_rules(state, self.policy)
+
+    async def _push_native_rules(self, state: PageBlockState, policy: BlockPolicy) -> None:
+        """下发原生拦截规则（只有策略变化时才重新下发）
+
+        通配规则按扩展名拦截；启用 type_fallback 时 Fetch 拦截按资源类型兜底，
+        覆盖没有扩展名的资源 URL（每个被拦截的请求进入 Python 一次）。
+        """
+        cdp = state.cdp_session
+        if state.blocked_patterns != policy.patterns:
+            await cdp.send("Network.setBlockedURLs", {"urls": list(policy.patterns)})
+            state.blocked_patterns = policy.patterns
+        blocked_types = policy.resource_types if self.type_fallback else ()
+        if state.blocked_types != blocked_types:
+            cdp_types = [_CDP_RESOURCE_TYPES[t] for t in blocked_types if t in _CDP_RESOURCE_TYPES]
+            if cdp_types:
+                await cdp.send("Fetch.enable", {
+                    "patterns": [{"resourceType": t, "requestStage": "Request"} for t in cdp_types],
+                })
+            elif state.blocked_types:
+                await cdp.send("Fetch.disable")
+            state.blocked_types = blocked_types
+
+    async def _open_cdp_session(self, page, state: PageBlockState) -> None:
+        """为页面创建 CDP 会话，并统计传输字节数"""
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            await cdp.send("Network.enable")
+        except Exception as e:
+            logger.debug(f"原生拦截不可用，使用正则路由: {e}")
+            state.native_unavailable = True
+            return
+
+        def on_loading_finished(params: dict) -> None:
+            state.transfer_bytes += int(params.get("encodedDataLength", 0))
+
+        async def on_request_paused(params: dict) -> None:
+            # 只有被拦截类型的请求会暂停（见 _push_native_rules）；这一步经过 Python
+            _blocking_stats.intercepted += 1
+            _blocking_stats.intercepted_aborted += 1
+            _blocking_stats.type_blocked += 1
+            try:
+                await cdp.send("Fetch.failRequest", {
+                    "requestId": params["requestId"],
+                    "errorReason": "BlockedByClient",
+                })
+            except Exception as e:
+                logger.debug(f"按资源类型拦截失败: {e}")
+
+        cdp.on("Network.loadingFinished", on_loading_finished)
+        cdp.on("Fetch.requestPaused", on_request_paused)
+        state.cdp_session = cdp
+        _blocking_stats.native_pages += 1
+
+    async def record_load(self, page, state: PageBlockState, label: str) -> None:
+        """记录页面加载耗时和传输字节数（归还页面前调用）"""
+        try:
+            metrics = await page.evaluate(_LOAD_METRICS_SCRIPT)
+        except Exception:
+            return
+        if not metrics:
+            return
+        if state.cdp_session is not None:
+            # CDP 统计包含跨域资源（Resource Timing 对未声明 Timing-Allow-Origin 的资源计为 0）
+            metrics["bytes"] = state.transfer_bytes
+        _blocking_stats.record_load(label, metrics)
+
+    @staticmethod
+    def _on_request_failed(request) -> None:
+        """记录被浏览器拦截的请求（按类型兜底拦截的请求也会触发，由 native_blocked 扣除）"""
+        if request.failure == _BLOCKED_BY_CLIENT:
+            _blocking_stats.blocked_by_client += 1
+
+    @staticmethod
+    async def _abort_handler(route) -> None:
+        """退化路由：只有已匹配拦截规则的请求才会进入这里"""
+        _blocking_stats.intercepted += 1
+        _blocking_stats.intercepted_aborted += 1
+        await route.abort()
+
+    @staticmethod
+    async def _abort_third_party(route) -> None:
+        """第三方过滤路由：只有非第一方、非 CDN 的请求才会进入这里"""
+        _blocking_stats.intercepted += 1
+        _blocking_stats.third_party_blocked += 1
+        await route.abort()
+
+    @staticmethod
+    async def _route_handler(route, policy: BlockPolicy) -> None:
+        """route 模式：逐请求按资源类型和域名判断"""
+        _blocking_stats.intercepted += 1
+        resource_type = route.request.resource_type
+        url = route.request.url.lower()
+
+        blocked = resource_type in policy.resource_types or "icon" in url or "favicon" in url
+        if not blocked and policy.blocks_trackers:
+            blocked = _pattern_regex(policy.patterns).match(url) is not None
+        if not blocked and policy.third_party_regex is not None:
+            blocked = policy.third_party_regex.match(url) is not None
+            if blocked:
+                _blocking_stats.third_party_blocked += 1
+
+        if blocked:
+            _blocking_stats.intercepted_aborted += 1
+            await route.abort()
+        else:
+            await route.continue_()
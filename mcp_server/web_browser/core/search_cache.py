@@ -0,0 +1,265 @@
+"""搜索结果缓存 - 内存 LRU + SQLite 持久化两级缓存
+
+多个 Agent（验证、时间线、预测）会围绕同一事件反复发起相同或重叠的查询，
+每次都要消耗一次浏览器导航和限速令牌。本模块在 ``_execute_search`` 之前缓存成功的结果：
+
+- 键为规范化后的关键词（NFKC + 大小写折叠 + 合并空白）、引擎、搜索类型和结果数量
+- 按搜索类型设置有效期（新闻默认较短）
+- 内存层为 LRU，持久层为 SQLite（进程重启后仍可命中），持久层命中后回填内存
+- 记录两级命中、未命中、写入和过期次数
+"""
+
+import asyncio
+import json
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import aiosqlite
+from loguru import logger
+
+from ..config.settings import get_settings, Settings
+
+
+def normalize_query(query: str) -> str:
+    """规范化关键词：全角/半角统一、大小写折叠、合并空白"""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def make_cache_key(engine_id: str, query: str, search_type: str, num_results: int) -> str:
+    """生成缓存键"""
+    return f"{engine_id}|{search_type}|{num_results}|{normalize_query(query)}"
+
+
+@dataclass
+class CacheEntry:
+    """缓存条目"""
+    payload: dict  # 搜索结果
+    created_at: float
+    expires_at: float
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+
+class SearchCacheStats:
+    """缓存统计"""
+
+    def __init__(self):
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.stores = 0
+        self.expired = 0
+        self.evictions = 0
+        self.disk_errors = 0
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": f"{(hits / lookups * 100) if lookups else 0:.1f}%",
+            "bypassed": self.bypassed,
+            "stores": self.stores,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "disk_errors": self.disk_errors,
+        }
+
+
+class SearchCache:
+    """搜索结果缓存（全局单例）"""
+
+    def __init__(self, settings: Settings):
+        """
+        Args:
+            settings: 配置对象
+        """
+        self.settings = settings
+        self.enabled = settings.search_cache_enabled
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._max_memory = settings.search_cache_memory_size
+        self._db_path = Path(settings.search_cache_db_path) if settings.search_cache_db_path else None
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
+        self.stats = SearchCacheStats()
+
+    def ttl_for(self, search_type: str) -> int:
+        """获取搜索类型对应的有效期（秒）"""
+        if search_type == "news":
+            return self.settings.search_cache_ttl_news
+        return self.settings.search_cache_ttl_web
+
+    async def _get_conn(self) -> Optional[aiosqlite.Connection]:
+        """获取（或创建）持久层连接，未配置路径时返回 None"""
+        if self._db_path is None:
+            return None
+        if self._conn is None:
+            async with self._lock:
+                if self._conn is None:
+                    self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = await aiosqlite.connect(self._db_path, timeout=30)
+                    await conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS search_cache (
+                            key TEXT PRIMARY KEY,
+                            payload TEXT NOT NULL,
+                            created_at REAL NOT NULL,
+                            expires_at REAL NOT NULL
+                        )
+                    """
+                    )
+                    await conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_search_cache_expires_at ON search_cache(expires_at)"
+                    )
+                    # 启动时清理过期条目
+                    await conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (time.time(),))
+                    await conn.commit()
+                    self._conn = conn
+                    logger.info(f"✅ 搜索缓存持久层初始化完成: {self._db_path}")
+        return self._conn
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """写入内存层（LRU 淘汰）"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get(
+        self, engine_id: str, query: str, search_type: str, num_results: int, record_miss: bool = True
+    ) -> Optional[CacheEntry]:
+        """查找缓存
+
+        Args:
+            record_miss: 未命中时是否计入统计（依次查找多个引擎时由调用方统一记录一次）
+
+        Returns:
+            未过期的缓存条目；未命中时返回 None
+        """
+        if not self.enabled or self.ttl_for(search_type) <= 0:
+            return None
+        key = make_cache_key(engine_id, query, search_type, num_results)
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            if not entry.expired:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return entry
+            del self._memory[key]
+            self.stats.expired += 1
+
+        try:
+            conn = await self._get_conn()
+            if conn is not None:
+                async with conn.execute(
+                    "SELECT payload, created_at, expires_at FROM search_cache WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ) as cursor:
+                    row = await cursor.fetchone()
+                if row is not None:
+                    entry = CacheEntry(payload=json.loads(row[0]), created_at=row[1], expires_at=row[2])
+                    self._remember(key, entry)
+                    self.stats.disk_hits += 1
+                    return entry
+        except Exception as e:
+            self.stats.disk_errors += 1
+            logger.warning(f"⚠️ 读取搜索缓存失败: {e}")
+
+        if record_miss:
+            self.stats.misses += 1
+        return None
+
+    async def put(
+        self, engine_id: str, query: str, search_type: str, num_results: int, payload: dict
+    ) -> None:
+        """写入缓存（两级同时写入）"""
+        ttl = self.ttl_for(search_type)
+        if not self.enabled or ttl <= 0:
+            return
+        key = make_cache_key(engine_id, query, search_type, num_results)
+        now = time.time()
+        entry = CacheEntry(payload=payload, created_at=now, expires_at=now + ttl)
+        self._remember(key, entry)
+        self.stats.stores += 1
+
+        try:
+            conn = await self._get_conn()
+            if conn is not None:
+                await conn.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, payload, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(payload, ensure_ascii=False), entry.created_at, entry.expires_at),
+                )
+                await conn.commit()
+        except Exception as e:
+            self.stats.disk_errors += 1
+            logger.warning(f"⚠️ 写入搜索缓存失败: {e}")
+
+    def record_miss(self) -> None:
+        """记录一次未命中（配合 get(record_miss=False) 使用）"""
+        if self.enabled:
+            self.stats.misses += 1
+
+    def record_bypass(self) -> None:
+        """记录一次跳过缓存的查询"""
+        self.stats.bypassed += 1
+
+    async def close(self) -> None:
+        """关闭持久层连接"""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        return {
+            "enabled": self.enabled,
+            "memory_entries": len(self._memory),
+            "max_memory_entries": self._max_memory,
+            "db_path": str(self._db_path) if self._db_path else None,
+            "ttl": {"web": self.settings.search_cache_ttl_web, "news": self.settings.search_cache_ttl_news},
+            **self.stats.to_dict(),
+        }
+
+
+# 全局缓存实例
+_global_search_cache: Optional[SearchCache] = None
+
+
+def get_search_cache(settings: Settings = None) -> SearchCache:
+    """获取全局搜索缓存实例（单例）
+
+    Args:
+        settings: 配置对象（首次创建时需要）
+
+    Returns:
+        SearchCache: 缓存实例
+    """
+    global _global_search_cache
+
+    if _global_search_cache is None:
+        if settings is None:
+            settings = get_settings()
+        _global_search_cache = SearchCache(settings)
+
+    return _global_search_cache
+
+
+async def close_global_search_cache() -> None:
+    """关闭全局搜索缓存"""
+    global _global_search_cache
+
+    if _global_search_cache:
+        await _global_search_cache.close()
+        _global_search_cache = None
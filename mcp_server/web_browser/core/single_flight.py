@@ -0,0 +1,83 @@
+"""请求合并（single-flight）- 相同的并发请求共享一个在途任务
+
+事件处理器会并发启动验证、时间线、预测等子 Agent，它们经常在几秒内请求同一个
+关键词或同一篇文章，每个请求都会占用一个页面槽位和一个限速令牌。这里按请求键
+合并并发调用：第一个调用者发起任务，之后到达的相同请求直接等待同一任务的结果。
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """按键合并并发调用"""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: 名称（用于统计）
+        """
+        self.name = name
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}  # 每个在途任务的等待者数量
+        self.executed = 0  # 实际执行的次数
+        self.coalesced = 0  # 合并到在途任务的次数
+        self.cancelled = 0  # 所有等待者都已取消、随之取消的任务数
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """执行（或加入）键对应的任务
+
+        Args:
+            key: 请求键，相同键的并发调用共享结果
+            fn: 无参协程函数，只在没有在途任务时调用
+
+        Returns:
+            任务结果（所有调用者收到同一个对象，调用者不得修改）
+
+        Note:
+            某个调用者被取消不影响其他调用者；最后一个调用者被取消时取消共享任务，
+            并等待其退出后再向上抛出 CancelledError（页面和限速令牌在此之前释放）。
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda done: self._on_done(key, done))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            remaining = self._waiters.pop(task) - 1
+            if remaining:
+                self._waiters[task] = remaining
+            elif not task.done():
+                # 最后一个等待者被取消：之后到达的相同请求重新发起，不再加入正在取消的任务
+                if self._in_flight.get(key) is task:
+                    del self._in_flight[key]
+                task.cancel()
+                self.cancelled += 1
+                await asyncio.wait({task})
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        """任务完成后移除，并取走异常（调用者都已取消时避免"未获取异常"警告）"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        total = self.executed + self.coalesced
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesce_rate": f"{(self.coalesced / total * 100) if total else 0:.1f}%",
+            "cancelled": self.cancelled,
+            "in_flight": len(self._in_flight),
+        }
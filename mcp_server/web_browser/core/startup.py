@@ -0,0 +1,92 @@
+"""启动统计 - 预热各阶段耗时与首个结果耗时（TTFR）
+
+每个 Agent 会话都会启动新的 MCP 进程。不预热时，第一个搜索要在请求里启动 Chromium、
+创建上下文和页面，第一篇文章要等正文提取进程池启动，首个结果往往要多等好几秒。
+本模块记录：
+
+- 从导入 core 包到服务开始接受请求的耗时（导入耗时）
+- 后台预热各阶段（浏览器、上下文、正文提取进程池、预连接）的耗时和错误
+- 各类请求（search / article）的首个请求时间和首个有效结果时间：
+  自进程启动起的耗时、该请求本身的耗时，以及结果返回时预热是否已完成
+"""
+
+import time
+from typing import Dict, Optional
+
+
+class StartupStats:
+    """启动与预热统计（全局单例）"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()  # core 包导入时间（近似进程启动时间）
+        self.ready_at: Optional[float] = None  # 服务开始接受请求的时间
+        self.warm_started_at: Optional[float] = None
+        self.warm_done_at: Optional[float] = None
+        self.stages_ms: Dict[str, float] = {}
+        self.stage_errors: Dict[str, str] = {}
+        self.first_request_ms: Dict[str, float] = {}  # {类型: 自启动起的毫秒数}
+        self.first_result: Dict[str, dict] = {}
+
+    def _since_start_ms(self, moment: float) -> float:
+        return round((moment - self.started_at) * 1000, 1)
+
+    def mark_ready(self) -> None:
+        """服务开始接受请求"""
+        if self.ready_at is None:
+            self.ready_at = time.perf_counter()
+
+    def record_stage(self, name: str, elapsed_ms: float, error: Optional[str] = None) -> None:
+        """记录一个预热阶段"""
+        self.stages_ms[name] = round(elapsed_ms, 1)
+        if error:
+            self.stage_errors[name] = error
+
+    @property
+    def warm(self) -> bool:
+        """预热是否已完成"""
+        return self.warm_done_at is not None
+
+    def request_started(self, kind: str) -> float:
+        """记录请求开始（只保留每类的首个请求），返回开始时间供 result_ready 使用"""
+        now = time.perf_counter()
+        self.first_request_ms.setdefault(kind, self._since_start_ms(now))
+        return now
+
+    def result_ready(self, kind: str, request_start: float) -> None:
+        """记录有效结果返回（只保留每类的首个结果）"""
+        if kind in self.first_result:
+            return
+        now = time.perf_counter()
+        self.first_result[kind] = {
+            "since_start_ms": self._since_start_ms(now),
+            "request_ms": round((now - request_start) * 1000, 1),
+            "warm": self.warm,
+        }
+
+    def to_dict(self) -> dict:
+        """转换为字典"""
+        return {
+            "import_ms": self._since_start_ms(self.ready_at) if self.ready_at is not None else None,
+            "warm_start": {
+                "started": self.warm_started_at is not None,
+                "done": self.warm,
+                "total_ms": (
+                    round((self.warm_done_at - self.warm_started_at) * 1000, 1)
+                    if self.warm and self.warm_started_at is not None
+                    else None
+                ),
+                "stages_ms": dict(self.stages_ms),
+                "errors": dict(self.stage_errors),
+            },
+            "first_request_ms": dict(self.first_request_ms),
+            "time_to_first_result": dict(self.first_result),
+        }
+
+
+# 全局统计实例（导入时开始计时）
+_startup_stats = StartupStats()
+
+
+def get_startup_stats() -> StartupStats:
+    """获取全局启动统计"""
+    return _startup_stats
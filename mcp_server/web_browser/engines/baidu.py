@@ -1,12 +1,22 @@
 """百度搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, List
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
+from ..utils.html_parser import element_text, first, has_class
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# 相对时间（如 "3小时前"、"5月1日"）
+_TIME_RE = re.compile(r"昨天|前天|\d+小时前|\d+月\d+日|\d+天前")
+
 
 class BaiduEngine(BaseEngine):
     """百度搜索引擎"""
@@ -19,35 +29,123 @@ class BaiduEngine(BaseEngine):
         )
         super().__init__(config)
 
+    # 结果页为服务端渲染，只需加载百度自身域名和 CDN（bdstatic/bdimg 等）
+    first_party_domains = ("baidu.com",)
+    supports_http = True
+
     def get_resource_block_list(self) -> List[str]:
-        """百度可以拦截图片、字体和媒体"""
-        return ["image", "font", "media"]
+        """百度可以拦截图片、字体、媒体以及全部第三方请求"""
+        return ["image", "font", "media", "third_party"]
+
+    # 网页/新闻结果使用不同的结果条目
+    _WEB_READINESS = ReadinessCondition(
+        result_selector="#content_left div[srcid], #content_left div.result-op",
+    )
+    _NEWS_READINESS = ReadinessCondition(result_selector='div[tpl="news-normal"]')
+
+    def get_readiness(self, search_type: str = "web") -> ReadinessCondition:
+        """网页和新闻搜索的结果条目不同"""
+        return self._NEWS_READINESS if search_type == "news" else self._WEB_READINESS
 
-    async def search(
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行百度搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        await page.goto(url, timeout=30000)
-
-        # 检查是否被拦截
-        page_title = await page.title()
-        if "验证" in page_title or "安全" in page_title:
-            logger.warning("   ⚠️ 被百度安全验证拦截")
-            return []
-
-        # 解析结果
+        """解析百度搜索结果（安全验证页由框架的反爬虫检测处理）"""
         if search_type == "news":
             return await self._parse_news_results(page)
         else:
             return await self._parse_web_results(page)
 
+    def parse_html(
+        self,
+        root,
+        base_url: str,
+        query: str,
+        num_results: int = 30,
+        search_type: str = "web",
+    ) -> List[SearchResult]:
+        """从 HTTP 抓取的 HTML 中解析结果（与浏览器解析逻辑一致）"""
+        if search_type == "news":
+            results = self._parse_news_html(root)
+            logger.info(f"   ✅ 百度新闻成功解析 {len(results)} 条结果 (HTTP)")
+        else:
+            results = self._parse_web_html(root)
+            logger.info(f"   ✅ 百度成功解析 {len(results)} 条结果 (HTTP)")
+        return results[:30]
+
+    @staticmethod
+    def _parse_web_html(root) -> List[SearchResult]:
+        """解析网页搜索结果（lxml）"""
+        content_left = first(root.xpath('//*[@id="content_left"]'))
+        if content_left is None:
+            return []
+
+        results = []
+        for item in content_left.xpath(f'.//div[@srcid] | .//div[{has_class("result-op")}]'):
+            h3 = first(item.xpath(".//h3"))
+            link = first(h3.xpath(".//a")) if h3 is not None else None
+            if link is None:
+                continue
+
+            title = element_text(link)
+            url = link.get("href", "")
+            if not title:
+                continue
+
+            span_texts = [element_text(span) for span in item.xpath(".//span")]
+
+            # 提取时间
+            time_str = next((text for text in span_texts if _TIME_RE.search(text)), "")
+
+            # 提取摘要
+            summary = ""
+            for div in item.xpath(".//div"):
+                text = element_text(div)
+                if len(text) > 30 and text != title and (not time_str or time_str not in text):
+                    summary = text
+                    break
+
+            # 提取来源
+            source = next(
+                (
+                    text for text in span_texts
+                    if 2 <= len(text) <= 10 and not _TIME_RE.search(text) and text != title
+                ),
+                "",
+            )
+
+            results.append(SearchResult(title=title, url=url, summary=summary, source=source, time=time_str))
+        return results
+
+    @staticmethod
+    def _parse_news_html(root) -> List[SearchResult]:
+        """解析新闻搜索结果（lxml）"""
+        results = []
+        for item in root.xpath('//div[@tpl="news-normal"]'):
+            url = item.get("mu", "")
+            if not url:
+                continue
+
+            title = element_text(first(item.xpath(".//h3")))
+            if not title:
+                continue
+
+            time_str = element_text(first(item.xpath(f'.//span[{has_class("c-color-gray2")}]')))
+            time_str = time_str.replace("发布于：", "")
+
+            summary = element_text(first(item.xpath(
+                f'.//div[{has_class("c-span-last")}]'
+                f'/span[{has_class("c-font-normal")} and {has_class("c-color-text")}]'
+            )))
+            source = element_text(first(item.xpath(f'.//div[{has_class("news-source_Xj4Dv")}]/a')))
+
+            results.append(SearchResult(title=title, url=url, summary=summary, source=source, time=time_str))
+        return results
+
     async def _parse_web_results(self, page: Page) -> List[SearchResult]:
         """解析网页搜索结果"""
         raw_results = await page.evaluate("""() => {
@@ -86,7 +184,7 @@ class BaiduEngine(BaseEngine):
                     const allDivs = item.querySelectorAll('div');
                     for (const div of allDivs) {
                         const text = div.innerText?.trim() || '';
-                        if (text.length > 30 && text !== title && !text.includes(timeStr)) {
+                        if (text.length > 30 && text !== title && (!timeStr || !text.includes(timeStr))) {
                             summary = text;
                             break;
                         }
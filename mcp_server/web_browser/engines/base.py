@@ -2,9 +2,14 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse
 
+from loguru import logger
+
+from ..core.readiness import ReadinessCondition, ReadinessReport, wait_for_ready
+from ..core.resource_blocker import BlockPolicy
+
 
 @dataclass
 class EngineConfig:
@@ -41,7 +46,30 @@ class SearchResultWithStatus:
 
 
 class BaseEngine(ABC):
-    """搜索引擎基类"""
+    """搜索引擎基类
+
+    导航协议：引擎只声明搜索URL和就绪条件，由框架（``_execute_search``）
+    负责唯一一次导航、反爬虫检测和调用解析，避免同一结果页被加载两次：
+
+        1. ``navigate()``        - 访问 ``get_search_url()``（每次搜索只导航一次）
+        2. 反爬虫检测            - 由框架完成
+        3. ``wait_until_ready()`` - 按声明的就绪条件等待结果稳定
+        4. ``parse()``           - 从已加载的页面中解析结果
+
+    服务端渲染的引擎可声明 ``supports_http`` 并实现 ``parse_html()``：框架先用共享的
+    HTTP 客户端抓取结果页并用 lxml 解析，被拦截或结果为空时才升级到浏览器流程。
+    """
+
+    # 导航等待事件（"commit" | "domcontentloaded" | "load"），结果是否就绪由 readiness 判断
+    wait_until: str = "domcontentloaded"
+    # 结果就绪条件（结果条目选择器 + 数量稳定判定）
+    readiness: ReadinessCondition = ReadinessCondition()
+    # 导航超时时间（毫秒）
+    navigation_timeout: int = 30000
+    # 第一方域名（拦截列表包含 "third_party" 时，只放行这些域名及常见 CDN）
+    first_party_domains: Tuple[str, ...] = ()
+    # 是否支持免浏览器的 HTTP 快速路径（结果页为服务端渲染，需实现 parse_html）
+    supports_http: bool = False
 
     def __init__(self, config: EngineConfig):
         self.config = config
@@ -58,12 +86,97 @@ class BaseEngine(ABC):
         子类可以覆盖此方法来自定义拦截策略
 
         Returns:
-            List[str]: 资源类型列表，可选值: "image", "font", "media", "stylesheet", "script"
+            List[str]: 资源类型列表，可选值: "image", "font", "media", "stylesheet", "script"；
+                另可包含域名过滤标记 "tracker"（拦截追踪/广告域名）和
+                "third_party"（只放行 first_party_domains 及常见 CDN）
+        """
+        # 默认策略：拦截图片、字体、媒体和追踪/广告域名
+        return ["image", "font", "media", "tracker"]
+
+    def get_block_policy(self) -> BlockPolicy:
+        """获取资源拦截策略（由 get_resource_block_list 和 first_party_domains 构建）"""
+        return BlockPolicy.from_block_list(self.get_resource_block_list(), self.first_party_domains)
+
+    async def navigate(self, page, url: str):
+        """访问搜索结果页（框架每次搜索只调用一次）
+
+        Args:
+            page: Playwright Page 对象
+            url: 搜索URL
+
+        Returns:
+            Playwright Response 对象（可能为 None）
+        """
+        logger.info(f"   🌐 访问: {url}")
+        return await page.goto(url, wait_until=self.wait_until, timeout=self.navigation_timeout)
+
+    def get_readiness(self, search_type: str = "web") -> ReadinessCondition:
+        """获取结果就绪条件（子类可按搜索类型返回不同条件）"""
+        return self.readiness
+
+    async def wait_until_ready(
+        self, page, num_results: int = 30, search_type: str = "web"
+    ) -> ReadinessReport:
+        """等待结果就绪：结果数量达到目标或不再变化即返回
+
+        Args:
+            page: Playwright Page 对象
+            num_results: 期望的结果数量
+            search_type: 搜索类型
+
+        Returns:
+            ReadinessReport: 就绪检测结果（超时后框架仍会尝试解析）
         """
-        # 默认策略：只拦截图片、字体、媒体
-        return ["image", "font", "media"]
+        report = await wait_for_ready(
+            page, self.get_readiness(search_type), num_results, self.engine_id
+        )
+        if not report.ready:
+            logger.warning(f"   ⚠️ {self.name}页面加载超时（已加载 {report.result_count} 条）")
+        return report
 
     @abstractmethod
+    async def parse(
+        self,
+        page,
+        query: str,
+        num_results: int = 30,
+        search_type: str = "web",
+    ) -> List[SearchResult]:
+        """从已加载的搜索结果页中解析结果（不得再次导航）
+
+        Args:
+            page: 已完成导航的 Playwright Page 对象
+            query: 搜索关键词
+            num_results: 返回结果数量
+            search_type: 搜索类型 ("web" 或 "news")
+
+        Returns:
+            搜索结果列表
+        """
+        pass
+
+    def parse_html(
+        self,
+        root,
+        base_url: str,
+        query: str,
+        num_results: int = 30,
+        search_type: str = "web",
+    ) -> List[SearchResult]:
+        """从 HTTP 抓取的 HTML 中解析结果（supports_http 为 True 的引擎需要实现）
+
+        Args:
+            root: lxml 解析后的文档根元素
+            base_url: 最终页面URL（用于补全相对链接）
+            query: 搜索关键词
+            num_results: 返回结果数量
+            search_type: 搜索类型 ("web" 或 "news")
+
+        Returns:
+            搜索结果列表
+        """
+        raise NotImplementedError(f"{self.name}不支持 HTTP 快速路径")
+
     async def search(
         self,
         page,
@@ -71,7 +184,9 @@ class BaseEngine(ABC):
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行搜索
+        """执行完整搜索（导航 + 等待 + 解析），供独立调用的脚本使用
+
+        框架内部不调用此方法，而是拆分步骤以便在导航后插入反爬虫检测。
 
         Args:
             page: Playwright Page 对象
@@ -82,7 +197,10 @@ class BaseEngine(ABC):
         Returns:
             搜索结果列表
         """
-        pass
+        url = self.get_search_url(query, num_results, search_type)
+        await self.navigate(page, url)
+        await self.wait_until_ready(page, num_results, search_type)
+        return await self.parse(page, query, num_results, search_type)
 
     def get_search_url(self, query: str, num_results: int, search_type: str = "web") -> str:
         """构建搜索URL"""
@@ -1,12 +1,18 @@
 """必应搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
+from ..utils.html_parser import element_text, first, has_class
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class BingEngine(BaseEngine):
     """必应搜索引擎"""
@@ -19,35 +25,66 @@ class BingEngine(BaseEngine):
         )
         super().__init__(config)
 
-    async def search(
+    # 使用 domcontentloaded 而非 load，大幅提升速度；新闻卡片数量稳定即可解析（最多等待 5 秒）
+    wait_until = "domcontentloaded"
+    readiness = ReadinessCondition(result_selector='div[class*="news-card"]', timeout=5000)
+
+    # 只需加载必应自身域名（bing.com / bing.net）
+    first_party_domains = ("bing.com", "bing.net")
+    supports_http = True
+
+    def get_resource_block_list(self) -> List[str]:
+        """必应可以拦截图片、字体、媒体以及全部第三方请求"""
+        return ["image", "font", "media", "third_party"]
+
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行必应搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        # 使用 domcontentloaded 而非 load，大幅提升速度
-        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-        # 等待新闻卡片出现（最多等待 5 秒）
-        try:
-            await page.wait_for_selector('div[class*="news-card"]', timeout=5000)
-        except Exception:
-            logger.debug("   ⏱️ 未检测到新闻卡片，可能页面结构已变化")
-
-        # 检查是否被拦截
-        page_title = await page.title()
-        if "验证" in page_title:
-            logger.warning("   ⚠️ 被必应安全验证拦截")
-            return []
-
-        # 解析结果（新闻和网页使用相同的解析逻辑）
+        """解析必应搜索结果（新闻和网页使用相同的解析逻辑）"""
         return await self._parse_results(page)
 
+    def parse_html(
+        self,
+        root,
+        base_url: str,
+        query: str,
+        num_results: int = 30,
+        search_type: str = "web",
+    ) -> List[SearchResult]:
+        """从 HTTP 抓取的 HTML 中解析结果（与浏览器解析逻辑一致）"""
+        results = []
+        for card in root.xpath('//div[contains(@class, "news-card")]'):
+            url = card.get("data-url", "")
+            if not url:
+                continue
+
+            title = card.get("data-title", "") or element_text(first(card.xpath(".//h2")))
+            if not title:
+                continue
+
+            time_str = ""
+            time_span = first(card.xpath('.//span[@tabindex="0"]'))
+            if time_span is not None:
+                inner_div = first(time_span.xpath(".//div"))
+                time_str = time_span.get("aria-label") or element_text(
+                    inner_div if inner_div is not None else time_span
+                )
+
+            results.append(SearchResult(
+                title=title,
+                url=url,
+                summary=element_text(first(card.xpath(f'.//*[{has_class("snippet")}]'))),
+                source=card.get("data-author", ""),
+                time=time_str,
+            ))
+
+        logger.info(f"   ✅ 必应成功解析 {len(results)} 条结果 (HTTP)")
+        return results[:30]
+
     async def _parse_results(self, page: Page) -> List[SearchResult]:
         """解析搜索结果"""
         raw_results = await page.evaluate("""() => {
@@ -1,12 +1,18 @@
 """360搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
+from ..utils.html_parser import element_text, first, has_class
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class Engine360(BaseEngine):
     """360搜索引擎"""
@@ -19,21 +25,58 @@ class Engine360(BaseEngine):
         )
         super().__init__(config)
 
-    async def search(
+    readiness = ReadinessCondition(result_selector='li[data-from="news"]')
+
+    # 结果页为服务端渲染，只需加载 360 自身域名和 CDN（qhimg/qhres 等）
+    first_party_domains = ("so.com", "360.cn")
+    supports_http = True
+
+    def get_resource_block_list(self) -> List[str]:
+        """360 可以拦截图片、字体、媒体以及全部第三方请求"""
+        return ["image", "font", "media", "third_party"]
+
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行360搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        await page.goto(url, timeout=30000)
-
+        """解析360搜索结果"""
         return await self._parse_results(page)
 
+    def parse_html(
+        self,
+        root,
+        base_url: str,
+        query: str,
+        num_results: int = 30,
+        search_type: str = "web",
+    ) -> List[SearchResult]:
+        """从 HTTP 抓取的 HTML 中解析结果（与浏览器解析逻辑一致）"""
+        results = []
+        for item in root.xpath('//li[@data-from="news"]'):
+            url = item.get("data-url", "")
+            if not url:
+                continue
+
+            h3 = first(item.xpath(".//h3"))
+            title_div = first(h3.xpath(f'.//*[{has_class("g-txt-inner")}]')) if h3 is not None else None
+            title = element_text(title_div)
+            if not title:
+                continue
+
+            results.append(SearchResult(
+                title=title,
+                url=url,
+                summary=element_text(first(item.xpath(f'.//*[{has_class("summary")}]'))),
+                source=element_text(first(item.xpath(f'.//*[{has_class("sitename")}]'))),
+                time=element_text(first(item.xpath(f'.//*[{has_class("time")}]'))),
+            ))
+
+        logger.info(f"   ✅ 360成功解析 {len(results)} 条结果 (HTTP)")
+        return results[:30]
+
     async def _parse_results(self, page: Page) -> List[SearchResult]:
         """解析搜索结果"""
         raw_results = await page.evaluate("""() => {
@@ -2,11 +2,13 @@
 
 import random
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from loguru import logger
 
+from ..core.engine_registry import EngineRegistry
 from .base import BaseEngine
+from .ranking import EngineRanker
 from .baidu import BaiduEngine
 from .bing import BingEngine
 from .sogou import SogouEngine
@@ -36,7 +38,7 @@ class EngineFactory:
         "sohu": SohuEngine,
     }
 
-    # 引擎速度优先级（根据测试数据，越快越靠前）
+    # 引擎速度优先级（根据测试数据，越快越靠前；启用自适应排序时仅作为冷启动先验）
     _SPEED_PRIORITY = [
         "baidu",
         "sogou",
@@ -53,17 +55,27 @@ class EngineFactory:
     # 禁用时间配置（秒）
     BAN_DURATION_BASE = 300  # 基础禁用时间：5分钟
     BAN_DURATION_MAX = 1800  # 最大禁用时间：30分钟
-
-    def __init__(self, enabled_engines: List[str] = None):
+    BAN_COUNT_RESET = 7200  # 解禁后2小时内未再被禁用则重新计数
+
+    def __init__(
+        self,
+        enabled_engines: List[str] = None,
+        ranker: Optional[EngineRanker] = None,
+        registry: Optional[EngineRegistry] = None,
+    ):
         """初始化引擎工厂
 
         Args:
             enabled_engines: 启用的引擎列表
+            ranker: 自适应排序器（为 None 时随机选择、按静态速度优先级降级）
+            registry: 引擎状态注册表（多进程共享禁用记录；为 None 时只在进程内保存）
         """
         self.enabled_engines = enabled_engines or list(self._ENGINE_CLASSES.keys())
+        self.ranker = ranker
+        self.registry = registry or EngineRegistry()
         self._engines: Dict[str, BaseEngine] = {}
-        # 记录被禁用的引擎及其信息 {engine_id: {'unban_time': timestamp, 'ban_count': count}}
-        self._banned_engines: Dict[str, dict] = {}
+        # 本进程已知处于禁用状态的引擎（用于记录解禁日志）
+        self._known_banned: Set[str] = set()
 
     def get_engine(self, engine_id: str) -> Optional[BaseEngine]:
         """获取指定引擎实例
@@ -94,8 +106,13 @@ class EngineFactory:
 
         return self._engines[engine_id]
 
+    @classmethod
+    def ban_duration(cls, ban_count: int) -> float:
+        """计算禁用时长（指数增长，最大30分钟）"""
+        return min(cls.BAN_DURATION_BASE * (2 ** (ban_count - 1)), cls.BAN_DURATION_MAX)
+
     def ban_engine(self, engine_id: str, reason: str = "被反爬虫拦截"):
-        """禁用引擎（递增禁用机制）
+        """禁用引擎（递增禁用机制，禁用记录在所有进程间共享）
 
         Args:
             engine_id: 引擎ID
@@ -106,31 +123,19 @@ class EngineFactory:
         - 第2次：10分钟
         - 第3次：20分钟
         - 第4次及以后：30分钟（上限）
-        """
-        # 获取当前禁用次数
-        if engine_id in self._banned_engines:
-            ban_count = self._banned_engines[engine_id].get('ban_count', 0) + 1
-        else:
-            ban_count = 1
 
-        # 计算禁用时长（指数增长，最大30分钟）
-        ban_duration = min(
-            self.BAN_DURATION_BASE * (2 ** (ban_count - 1)),
-            self.BAN_DURATION_MAX
-        )
-
-        unban_time = time.time() + ban_duration
-        self._banned_engines[engine_id] = {
-            'unban_time': unban_time,
-            'ban_count': ban_count
-        }
+        解禁后 BAN_COUNT_RESET 秒内再次被禁用时次数累加，否则重新从第1次计数。
+        """
+        ban = self.registry.ban(engine_id, reason, self.ban_duration, self.BAN_COUNT_RESET)
+        self._known_banned.add(engine_id)
+        ban_duration = ban["unban_time"] - ban["banned_at"]
         logger.warning(
             f"🚫 禁用引擎 {engine_id}: {reason} "
-            f"(第{ban_count}次，{ban_duration//60}分钟)"
+            f"(第{ban['ban_count']}次，{ban_duration // 60:.0f}分钟)"
         )
 
     def is_engine_banned(self, engine_id: str) -> bool:
-        """检查引擎是否被禁用
+        """检查引擎是否被禁用（包括被其他进程禁用）
 
         Args:
             engine_id: 引擎ID
@@ -138,24 +143,28 @@ class EngineFactory:
         Returns:
             True if banned, False otherwise
         """
-        if engine_id not in self._banned_engines:
-            return False
+        if self.registry.is_banned(engine_id):
+            self._known_banned.add(engine_id)
+            return True
 
-        ban_info = self._banned_engines[engine_id]
-        unban_time = ban_info['unban_time']
-
-        # 检查是否已到解禁时间
-        if time.time() >= unban_time:
-            # 自动解禁，但保留禁用计数用于递增机制
-            # （重置计数可选，这里选择保留以累积惩罚）
-            del self._banned_engines[engine_id]
+        # 到解禁时间后自动解禁（禁用记录保留，用于递增机制）
+        if engine_id in self._known_banned:
+            self._known_banned.discard(engine_id)
             logger.info(f"✅ 引擎 {engine_id} 已自动解禁")
-            return False
+        return False
 
-        return True
+    def get_next_unban_in(self) -> Optional[float]:
+        """距最早解禁的引擎还有多少秒（没有被禁用的引擎时返回 None）"""
+        bans = self.registry.active_bans()
+        if not bans:
+            return None
+        return max(0.0, min(ban["unban_time"] for ban in bans.values()) - time.time())
 
     def get_random_engine(self) -> Optional[BaseEngine]:
-        """随机选择一个启用的引擎（跳过被禁用的）"""
+        """选择一个启用的引擎（跳过被禁用的）
+
+        有自适应排序器时按 Thompson 采样选择，否则均匀随机选择。
+        """
         available_engines = []
         for engine_id in self.enabled_engines:
             if engine_id in self._ENGINE_CLASSES and not self.is_engine_banned(engine_id):
@@ -165,19 +174,52 @@ class EngineFactory:
             logger.warning("❌ 没有可用的搜索引擎（所有引擎均被禁用）")
             return None
 
-        engine_id = random.choice(available_engines)
+        if self.ranker is not None:
+            engine_id = self.ranker.choose(available_engines)
+        else:
+            engine_id = random.choice(available_engines)
         return self.get_engine(engine_id)
 
     def get_engines_by_priority(self) -> List[BaseEngine]:
-        """按速度优先级获取启用的引擎列表（跳过被禁用的）"""
+        """按优先级获取启用的引擎列表（跳过被禁用的）
+
+        有自适应排序器时按实时得分排序，否则按静态速度优先级。
+        """
+        engine_ids = [
+            engine_id
+            for engine_id in self._SPEED_PRIORITY
+            if engine_id in self.enabled_engines and not self.is_engine_banned(engine_id)
+        ]
+        if self.ranker is not None:
+            engine_ids = self.ranker.rank(engine_ids)
+
         engines = []
-        for engine_id in self._SPEED_PRIORITY:
-            if engine_id in self.enabled_engines and not self.is_engine_banned(engine_id):
-                engine = self.get_engine(engine_id)
-                if engine:
-                    engines.append(engine)
+        for engine_id in engine_ids:
+            engine = self.get_engine(engine_id)
+            if engine:
+                engines.append(engine)
         return engines
 
+    def record_outcome(self, engine_id: str, outcome: str, seconds: float) -> None:
+        """记录一次实际搜索的结果（ok | empty | blocked | error），用于自适应排序"""
+        if self.ranker is not None:
+            self.ranker.record(engine_id, outcome, seconds)
+
+    def get_ranking_stats(self) -> dict:
+        """获取引擎排序统计"""
+        engine_ids = [e for e in self.enabled_engines if e in self._ENGINE_CLASSES]
+        if self.ranker is None:
+            return {
+                "mode": "static",
+                "order": [e for e in self._SPEED_PRIORITY if e in engine_ids],
+            }
+        return {"mode": "adaptive", "engines": self.ranker.get_stats(engine_ids)}
+
+    @classmethod
+    def get_speed_priority(cls) -> List[str]:
+        """获取静态速度优先级"""
+        return list(cls._SPEED_PRIORITY)
+
     def get_enabled_engine_ids(self) -> List[str]:
         """获取所有启用的引擎ID（不包括被禁用的）"""
         return [
@@ -192,7 +234,7 @@ class EngineFactory:
 
     def get_banned_engine_count(self) -> int:
         """获取被禁用引擎数量"""
-        return len(self._banned_engines)
+        return len(self.registry.active_bans())
 
     @classmethod
     def get_all_engine_ids(cls) -> List[str]:
@@ -1,12 +1,17 @@
 """谷歌搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class GoogleEngine(BaseEngine):
     """谷歌搜索引擎"""
@@ -19,25 +24,18 @@ class GoogleEngine(BaseEngine):
         )
         super().__init__(config)
 
-    async def search(
+    readiness = ReadinessCondition(
+        result_selector="div[data-news-doc-id], div[data-news-cluster-id]",
+    )
+
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行谷歌搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        await page.goto(url, timeout=30000)
-
-        # 检查是否被拦截
-        page_content = await page.content()
-        if "验证" in page_content:
-            logger.warning("   ⚠️ 被谷歌安全验证拦截")
-            return []
-
+        """解析谷歌搜索结果（验证页由框架的反爬虫检测处理）"""
         return await self._parse_results(page)
 
     async def _parse_results(self, page: Page) -> List[SearchResult]:
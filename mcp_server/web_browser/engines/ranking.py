@@ -0,0 +1,179 @@
+"""引擎自适应排序 - 按实时统计选择引擎和确定降级顺序
+
+静态的速度优先级来自一次性测试，引擎改版或加强反爬后就不再准确。这里按引擎滚动统计：
+
+- 成功率：Beta 后验（成功 = 返回非空结果；空结果、被拦截、出错都算失败），
+  每次更新前按 ``decay`` 衰减旧观测，使统计跟随引擎的最新表现
+- 延迟：成功搜索耗时的 EWMA
+- 空结果率、拦截率、错误率（同样衰减）
+
+得分 = 成功概率 / (EWMA 延迟 + latency_offset)，即单位时间的期望成功次数。
+auto 选择使用 Thompson 采样（从 Beta 后验抽样成功概率，兼顾探索），
+降级顺序使用后验均值（顺序稳定）。没有样本的引擎以静态速度优先级推算的延迟作为先验。
+
+配置了 EngineRegistry 时，统计保存在共享注册表中，同一主机上的所有进程共同更新。
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence
+
+from ..core.engine_registry import EngineRegistry
+
+# 结果类型
+OUTCOMES = ("ok", "empty", "blocked", "error")
+
+
+@dataclass
+class EngineHealth:
+    """单个引擎的滚动统计"""
+    engine_id: str
+    prior_latency: float  # 没有成功样本时使用的延迟先验（秒）
+    alpha: float = 1.0  # Beta 后验：成功（含先验 1）
+    beta: float = 1.0  # Beta 后验：失败（含先验 1）
+    ewma_latency: Optional[float] = None  # 成功搜索耗时 EWMA（秒）
+    attempts: int = 0  # 累计次数（不衰减）
+    weighted_attempts: float = 0.0  # 衰减后的次数
+    weighted_empty: float = 0.0
+    weighted_blocked: float = 0.0
+    weighted_error: float = 0.0
+
+    @property
+    def latency(self) -> float:
+        """当前延迟估计（秒）"""
+        return self.ewma_latency if self.ewma_latency is not None else self.prior_latency
+
+    @property
+    def success_mean(self) -> float:
+        """成功概率后验均值"""
+        return self.alpha / (self.alpha + self.beta)
+
+    def rate(self, weighted: float) -> float:
+        """衰减后的比率"""
+        return weighted / self.weighted_attempts if self.weighted_attempts else 0.0
+
+
+class EngineRanker:
+    """引擎自适应排序器"""
+
+    def __init__(
+        self,
+        priority: Sequence[str],
+        decay: float = 0.97,
+        ewma_alpha: float = 0.3,
+        latency_offset: float = 1.0,
+        store: Optional[EngineRegistry] = None,
+    ):
+        """
+        Args:
+            priority: 静态速度优先级（用于推算冷启动时的延迟先验，越靠前越快）
+            decay: 每次更新前旧观测的衰减系数（越小越快遗忘）
+            ewma_alpha: 延迟 EWMA 的平滑系数（越大越看重最近一次）
+            latency_offset: 得分中加在延迟上的常数（秒），避免极快的引擎得分失真
+            store: 共享注册表（为 None 时统计只保存在进程内）
+        """
+        self.priority = list(priority)
+        self.decay = decay
+        self.ewma_alpha = ewma_alpha
+        self.latency_offset = latency_offset
+        self.store = store
+        self._health: Dict[str, EngineHealth] = {}
+
+    def _new_health(self, engine_id: str) -> EngineHealth:
+        position = self.priority.index(engine_id) if engine_id in self.priority else len(self.priority)
+        return EngineHealth(engine_id=engine_id, prior_latency=3.0 + position * 0.5)
+
+    def _get(self, engine_id: str) -> EngineHealth:
+        if self.store is not None:
+            state = self.store.health_snapshot().get(engine_id)
+            if state is not None:
+                return EngineHealth(**state)
+        health = self._health.get(engine_id)
+        if health is None:
+            health = self._new_health(engine_id)
+            self._health[engine_id] = health
+        return health
+
+    def record(self, engine_id: str, outcome: str, seconds: float) -> None:
+        """记录一次实际搜索（不含缓存命中和被取消的请求）
+
+        Args:
+            engine_id: 引擎ID
+            outcome: ok | empty | blocked | error
+            seconds: 搜索耗时（秒）
+        """
+        if self.store is None:
+            self._apply(self._get(engine_id), outcome, seconds)
+            return
+
+        def update(state: Optional[dict]) -> dict:
+            health = EngineHealth(**state) if state is not None else self._new_health(engine_id)
+            self._apply(health, outcome, seconds)
+            return asdict(health)
+
+        self.store.update_health(engine_id, update)
+
+    def _apply(self, health: EngineHealth, outcome: str, seconds: float) -> None:
+        """把一次结果计入统计"""
+        # 衰减旧观测（保留 Beta(1, 1) 先验）
+        health.alpha = 1.0 + (health.alpha - 1.0) * self.decay
+        health.beta = 1.0 + (health.beta - 1.0) * self.decay
+        health.weighted_attempts *= self.decay
+        health.weighted_empty *= self.decay
+        health.weighted_blocked *= self.decay
+        health.weighted_error *= self.decay
+
+        health.attempts += 1
+        health.weighted_attempts += 1
+        if outcome == "ok":
+            health.alpha += 1
+            if health.ewma_latency is None:
+                health.ewma_latency = seconds
+            else:
+                health.ewma_latency += self.ewma_alpha * (seconds - health.ewma_latency)
+        else:
+            health.beta += 1
+            if outcome == "empty":
+                health.weighted_empty += 1
+            elif outcome == "blocked":
+                health.weighted_blocked += 1
+            else:
+                health.weighted_error += 1
+
+    def score(self, engine_id: str, sample: bool = False) -> float:
+        """引擎得分（单位时间的期望成功次数）
+
+        Args:
+            sample: 为 True 时从 Beta 后验抽样成功概率（Thompson 采样），否则使用后验均值
+        """
+        health = self._get(engine_id)
+        success = random.betavariate(health.alpha, health.beta) if sample else health.success_mean
+        return success / (health.latency + self.latency_offset)
+
+    def rank(self, engine_ids: Sequence[str]) -> List[str]:
+        """按得分（后验均值）从高到低排序"""
+        return sorted(engine_ids, key=lambda engine_id: -self.score(engine_id))
+
+    def choose(self, engine_ids: Sequence[str]) -> Optional[str]:
+        """Thompson 采样选择一个引擎"""
+        if not engine_ids:
+            return None
+        return max(engine_ids, key=lambda engine_id: self.score(engine_id, sample=True))
+
+    def get_stats(self, engine_ids: Sequence[str]) -> dict:
+        """获取各引擎统计（按当前降级顺序排列）"""
+        stats = {}
+        for position, engine_id in enumerate(self.rank(engine_ids), 1):
+            health = self._get(engine_id)
+            stats[engine_id] = {
+                "rank": position,
+                "score": round(self.score(engine_id), 4),
+                "attempts": health.attempts,
+                "success_rate": round(health.success_mean, 3),
+                "zero_result_rate": round(health.rate(health.weighted_empty), 3),
+                "block_rate": round(health.rate(health.weighted_blocked), 3),
+                "error_rate": round(health.rate(health.weighted_error), 3),
+                "ewma_latency_s": round(health.ewma_latency, 2) if health.ewma_latency is not None else None,
+                "latency_estimate_s": round(health.latency, 2),
+            }
+        return stats
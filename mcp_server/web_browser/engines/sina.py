@@ -1,13 +1,18 @@
 """新浪新闻搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 from urllib.parse import quote
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class SinaEngine(BaseEngine):
     """新浪新闻搜索引擎"""
@@ -22,7 +27,7 @@ class SinaEngine(BaseEngine):
 
     def get_resource_block_list(self) -> List[str]:
         """新浪需要保留样式表"""
-        return ["image", "media"]
+        return ["image", "media", "tracker"]
 
     def get_search_url(self, query: str, num_results: int = 30, search_type: str = "web") -> str:
         """构建搜索URL"""
@@ -30,26 +35,22 @@ class SinaEngine(BaseEngine):
         # 新浪搜索使用 q 参数，并添加 c=news 指定新闻搜索
         return f"https://search.sina.com.cn/?q={encoded_query}&c=news&from=channel&ie=utf-8"
 
-    async def search(
+    # 结果数量稳定即视为加载完成（取代原先出现后再固定等待 2 秒；超时后仍继续尝试解析）
+    readiness = ReadinessCondition(
+        result_selector="div#result div.box-result",
+        timeout=15000,
+        stable_rounds=3,
+        fixed_wait_budget_ms=2000,
+    )
+
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行新浪新闻搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        await page.goto(url, timeout=30000)
-
-        # 等待页面加载
-        try:
-            await page.wait_for_selector("div#result", timeout=15000)
-            await page.wait_for_timeout(2000)
-        except Exception:
-            logger.warning("   ⚠️ 新浪新闻页面加载超时，但继续尝试解析")
-
+        """解析新浪新闻搜索结果"""
         # 解析结果
         raw_results = await page.evaluate("""() => {
             const results = [];
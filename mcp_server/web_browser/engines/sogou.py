@@ -1,12 +1,22 @@
 """搜狗搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, List
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
+from ..utils.html_parser import element_text, first, has_class
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# 独立日期（如 "2024-05-01"、"2024年5月1日"）
+_DATE_RE = re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$|^\d{4}年\d{1,2}月\d{1,2}日$")
+
 
 class SogouEngine(BaseEngine):
     """搜狗搜索引擎"""
@@ -19,29 +29,101 @@ class SogouEngine(BaseEngine):
         )
         super().__init__(config)
 
-    async def search(
+    readiness = ReadinessCondition(result_selector='#main div[class*="vrwrap"]')
+
+    # 结果页为服务端渲染，只需加载搜狗自身域名和 CDN（sogoucdn 等）
+    first_party_domains = ("sogou.com",)
+    supports_http = True
+
+    def get_resource_block_list(self) -> List[str]:
+        """搜狗可以拦截图片、字体、媒体以及全部第三方请求"""
+        return ["image", "font", "media", "third_party"]
+
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行搜狗搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        await page.goto(url, timeout=30000)
-
+        """解析搜狗搜索结果"""
         # 解析结果
         results = await self._parse_results(page)
 
         # 标准化URL
-        current_url = await page.evaluate("() => window.location.href")
+        current_url = page.url
         for item in results:
             item.url = self.normalize_url(item.url, current_url)
 
         return results
 
+    def parse_html(
+        self,
+        root,
+        base_url: str,
+        query: str,
+        num_results: int = 30,
+        search_type: str = "web",
+    ) -> List[SearchResult]:
+        """从 HTTP 抓取的 HTML 中解析结果（与浏览器解析逻辑一致）"""
+        results = []
+        main = first(root.xpath('//*[@id="main"]'))
+        items = main.xpath('.//div[contains(@class, "vrwrap")]') if main is not None else []
+        for item in items:
+            h3 = first(item.xpath(".//h3"))
+            link = first(h3.xpath(".//a")) if h3 is not None else None
+            if link is None:
+                continue
+
+            title = element_text(link)
+            url = link.get("href", "")
+            if not title:
+                continue
+
+            source = ""
+            time_str = ""
+            news_from = first(item.xpath('.//p[contains(@class, "news-from")]'))
+            if news_from is not None:
+                spans = news_from.xpath(".//span")
+                if len(spans) >= 1:
+                    source = element_text(spans[0])
+                if len(spans) >= 2:
+                    time_str = element_text(spans[1])
+
+            if not time_str:
+                for div in item.xpath(".//div"):
+                    text = element_text(div)
+                    if _DATE_RE.match(text):
+                        time_str = text
+                        break
+
+            summary = ""
+            for p in item.xpath(".//p"):
+                classes = (p.get("class") or "").split()
+                if "news-from" in classes or "text-lightgray" in classes:
+                    continue
+                text = element_text(p)
+                if len(text) > 20 and text != title:
+                    summary = text
+                    break
+
+            if not summary:
+                star_wiki = first(item.xpath(
+                    f'.//p[contains(@class, "star-wiki")] | .//*[{has_class("str_info")}]'
+                ))
+                summary = element_text(star_wiki)
+
+            results.append(SearchResult(
+                title=title,
+                url=self.normalize_url(url, base_url),
+                summary=summary,
+                source=source,
+                time=time_str,
+            ))
+
+        logger.info(f"   ✅ 搜狗成功解析 {len(results)} 条结果 (HTTP)")
+        return results[:30]
+
     async def _parse_results(self, page: Page) -> List[SearchResult]:
         """解析搜索结果"""
         raw_results = await page.evaluate("""() => {
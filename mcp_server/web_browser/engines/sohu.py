@@ -1,13 +1,18 @@
 """搜狐新闻搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 from urllib.parse import quote
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class SohuEngine(BaseEngine):
     """搜狐新闻搜索引擎"""
@@ -26,61 +31,25 @@ class SohuEngine(BaseEngine):
         # 搜狐搜索使用keyword参数，type=10002表示新闻
         return f"https://search.sohu.com/?keyword={encoded_query}&type=10002&ie=utf8"
 
-    async def search(
+    # 搜狐使用滚动加载：结果不足时在浏览器内持续滚动，数量达到目标或不再增长即返回
+    # （取代原先最多 10 次滚动、每次固定等待 1.5 秒的循环）
+    readiness = ReadinessCondition(
+        result_selector="div.cards-small-img",
+        timeout=15000,
+        poll_interval=500,
+        stable_rounds=3,
+        scroll_to_load=True,
+        fixed_wait_budget_ms=3000,
+    )
+
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行搜狐新闻搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        await page.goto(url, timeout=30000)
-
-        # 等待页面加载
-        try:
-            await page.wait_for_selector("div.cards-small-img", timeout=5000)
-        except Exception:
-            logger.warning("   ⚠️ 搜狐新闻页面加载超时")
-            return []
-
-        # 搜狐使用滚动加载，需要滚动页面来加载更多结果
-        max_scroll_attempts = 10  # 最大滚动次数
-        scroll_pause_time = 1500  # 每次滚动后等待时间（毫秒）
-
-        for attempt in range(max_scroll_attempts):
-            # 检查当前已加载的结果数量
-            current_count = await page.evaluate("""() => {
-                return document.querySelectorAll('div.cards-small-img').length;
-            }""")
-
-            logger.info(f"   📜 滚动加载 (第{attempt + 1}次): 已加载 {current_count} 条结果")
-
-            # 如果已获取足够结果，停止滚动
-            if current_count >= num_results:
-                logger.info(f"   ✅ 已获取足够结果 ({current_count} 条)")
-                break
-
-            # 滚动到页面底部
-            await page.evaluate("""() => {
-                window.scrollTo(0, document.body.scrollHeight);
-            }""")
-
-            # 等待新数据加载
-            await page.wait_for_timeout(scroll_pause_time)
-
-            # 检查是否有新数据加载
-            new_count = await page.evaluate("""() => {
-                return document.querySelectorAll('div.cards-small-img').length;
-            }""")
-
-            # 如果没有新数据，说明已经到底了
-            if new_count == current_count:
-                logger.info("   ✅ 已到达页面底部")
-                break
-
+        """解析搜狐新闻搜索结果"""
         # 解析结果
         raw_results = await page.evaluate("""() => {
             const results = [];
@@ -1,13 +1,18 @@
 """腾讯新闻搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 from urllib.parse import quote
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class TencentEngine(BaseEngine):
     """腾讯新闻搜索引擎"""
@@ -26,26 +31,16 @@ class TencentEngine(BaseEngine):
         # 腾讯新闻搜索使用query参数
         return f"https://news.qq.com/search?query={encoded_query}&page=1"
 
-    async def search(
+    readiness = ReadinessCondition(result_selector="div.img-text-card", timeout=5000)
+
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行腾讯新闻搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        await page.goto(url, timeout=30000)
-
-        # 等待页面加载
-        try:
-            await page.wait_for_selector("div.img-text-card", timeout=5000)
-        except Exception:
-            logger.warning("   ⚠️ 腾讯新闻页面加载超时")
-            return []
-
+        """解析腾讯新闻搜索结果"""
         # 解析结果
         raw_results = await page.evaluate("""() => {
             const results = [];
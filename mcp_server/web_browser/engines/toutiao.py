@@ -1,13 +1,18 @@
 """今日头条搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 from urllib.parse import quote
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class ToutiaoEngine(BaseEngine):
     """今日头条搜索引擎"""
@@ -21,8 +26,8 @@ class ToutiaoEngine(BaseEngine):
         super().__init__(config)
 
     def get_resource_block_list(self) -> List[str]:
-        """今日头条需要样式表，但可以拦截图片和媒体"""
-        return ["image", "media"]
+        """今日头条需要样式表，但可以拦截图片、媒体和追踪/广告域名"""
+        return ["image", "media", "tracker"]
 
     def get_search_url(self, query: str, num_results: int = 30, search_type: str = "web") -> str:
         """构建搜索URL"""
@@ -30,28 +35,22 @@ class ToutiaoEngine(BaseEngine):
         # 今日头条搜索使用keyword参数
         return f"https://so.toutiao.com/search?dvpf=pc&keyword={encoded_query}&pd=information&from=news&page_num=0"
 
-    async def search(
+    # 结果数量稳定即视为加载完成（取代原先出现后再固定等待 2 秒）
+    readiness = ReadinessCondition(
+        result_selector="div.result-content",
+        timeout=15000,
+        stable_rounds=3,
+        fixed_wait_budget_ms=2000,
+    )
+
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行今日头条搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        await page.goto(url, timeout=30000)
-
-        # 等待页面加载
-        try:
-            await page.wait_for_selector("div.result-content", timeout=15000)
-            # 额外等待确保内容完全加载
-            await page.wait_for_timeout(2000)
-        except Exception:
-            logger.warning("   ⚠️ 今日头条页面加载超时")
-            return []
-
+        """解析今日头条搜索结果"""
         # 解析结果
         raw_results = await page.evaluate("""() => {
             const results = [];
@@ -1,13 +1,18 @@
 """网易新闻搜索引擎"""
 
-from typing import List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 from urllib.parse import quote
 
 from loguru import logger
-from playwright.async_api import Page
 
+from ..core.readiness import ReadinessCondition
 from .base import BaseEngine, EngineConfig, SearchResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class WangyiEngine(BaseEngine):
     """网易新闻搜索引擎"""
@@ -21,8 +26,8 @@ class WangyiEngine(BaseEngine):
         super().__init__(config)
 
     def get_resource_block_list(self) -> List[str]:
-        """网易可以拦截更多资源以加快速度"""
-        return []
+        """网易需要完整加载页面资源，只拦截追踪/广告域名"""
+        return ["tracker"]
 
     def get_search_url(self, query: str, num_results: int = 30, search_type: str = "web") -> str:
         """构建搜索URL"""
@@ -30,26 +35,16 @@ class WangyiEngine(BaseEngine):
         # 网易搜索使用keyword参数
         return f"https://www.163.com/search?keyword={encoded_query}"
 
-    async def search(
+    readiness = ReadinessCondition(result_selector="div.keyword_new", timeout=5000)
+
+    async def parse(
         self,
         page: Page,
         query: str,
         num_results: int = 30,
         search_type: str = "web",
     ) -> List[SearchResult]:
-        """执行网易新闻搜索"""
-        url = self.get_search_url(query, num_results, search_type)
-
-        logger.info(f"   🌐 访问: {url}")
-        await page.goto(url, timeout=30000)
-
-        # 等待页面加载
-        try:
-            await page.wait_for_selector("div.keyword_new", timeout=5000)
-        except Exception:
-            logger.warning("   ⚠️ 网易新闻页面加载超时")
-            return []
-
+        """解析网易新闻搜索结果"""
         # 解析结果
         raw_results = await page.evaluate("""() => {
             const results = [];
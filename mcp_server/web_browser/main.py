@@ -19,11 +19,36 @@ Web Browser MCP Server - 智能浏览器与搜索工具
 - 智能降级，确保高可用性
 """
 
-from mcp.server.fastmcp import FastMCP
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+# 最先导入 core：启动统计从这里开始计时（包的 __init__ 按需导入，不会提前导入 core）
+from .core import (
+    get_startup_stats,
+    close_global_browser_pool,
+    close_global_extraction_pool,
+    close_global_http_client,
+    close_global_search_cache,
+    close_global_article_cache,
+    close_global_engine_registry,
+)
+
+from mcp.server.fastmcp import Context, FastMCP
 from loguru import logger
 
+from ..shared.output import shape_output
+from ..shared.serialization import dumps
+from ..shared.progress import context_progress
 from .config.settings import get_settings
-from .tools import multi_search, fetch_article_content, baidu_hot_search
+from .tools import (
+    multi_search,
+    fetch_article_content,
+    fetch_articles_batch,
+    baidu_hot_search,
+    get_service_stats,
+    warm_start,
+)
 
 # 初始化配置
 settings = get_settings()
@@ -32,8 +57,48 @@ logger.info(f"   启用的搜索引擎: {', '.join(settings.enabled_engines)}")
 logger.info("   智能反爬虫检测: ✅ 已启用")
 logger.info("   自动引擎禁用: ✅ 已启用（5-30分钟递增）")
 
+
+
+async def _close_resources() -> None:
+    """关闭全局资源：浏览器和 worker 子进程不会比服务活得更久，待写入的健康统计落盘"""
+    for name, close in (
+        ("浏览器池", close_global_browser_pool),
+        ("正文提取进程池", close_global_extraction_pool),
+        ("HTTP 客户端", close_global_http_client),
+        ("搜索缓存", close_global_search_cache),
+        ("文章缓存", close_global_article_cache),
+    ):
+        try:
+            await close()
+        except Exception as e:
+            logger.warning(f"⚠️ 关闭{name}失败: {e}")
+
+    # 最后关闭注册表：同步写入剩余的健康统计（此时已不再处理请求）
+    try:
+        close_global_engine_registry()
+    except Exception as e:
+        logger.warning(f"⚠️ 关闭引擎状态注册表失败: {e}")
+    logger.info("👋 Web Browser MCP Server 已关闭")
+
+
+@asynccontextmanager
+async def lifespan(_server: FastMCP):
+    """服务生命周期：开始接受请求后在后台预热，不阻塞 MCP 握手；退出时关闭全局资源"""
+    get_startup_stats().mark_ready()
+    warm_task = None
+    if settings.warm_start:
+        warm_task = asyncio.create_task(warm_start())
+    try:
+        yield
+    finally:
+        if warm_task is not None and not warm_task.done():
+            warm_task.cancel()
+            await asyncio.gather(warm_task, return_exceptions=True)
+        await _close_resources()
+
+
 # 创建 FastMCP 服务器
-server = FastMCP("web_browser")
+server = FastMCP("web_browser", lifespan=lifespan)
 
 
 # ========== 注册工具函数 ==========
@@ -45,70 +110,175 @@ async def multi_search_tool(
     engine: str = "auto",
     num_results: int = 30,
     search_type: str = "web",
+    bypass_cache: bool = False,
+    mode: str = "fallback",
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+    ctx: Context = None,
 ) -> str:
-    """智能多引擎搜索（支持10个搜索引擎，自动切换）
+    """智能多引擎搜索（支持10个搜索引擎，自动切换或并发融合）
 
     Args:
         query: 搜索关键词
         engine: 搜索引擎 (auto|baidu|bing|sogou|google|360|toutiao|tencent|wangyi|sina|sohu)
         num_results: 返回数量（默认30）
         search_type: 搜索类型 (web|news)
+        bypass_cache: 跳过缓存强制重新搜索（默认False；网页结果缓存1小时，新闻10分钟）
+        mode: 搜索模式 (fallback|fanout)，默认 fallback 依次尝试引擎；
+            fanout 并发查询多个引擎，合并去重后按多引擎排名融合排序，覆盖面更广
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "total,results.title,results.url"
+        compact: 紧凑输出（不缩进，去掉 checks/issues/suggestions 等诊断数组）
+        truncate: 按字段名截断长字符串，如 {"snippet": 2000, "*": 500}（"*" 为其余字段的上限）
 
     Returns:
-        JSON格式，包含：engine, engine_name, total, results[{title, url, snippet, source}]
+        JSON格式，包含：engine, engine_name, total, results[{title, url, snippet, source}]；
+        命中缓存时额外包含 cached=true 和 cache_age（秒）；
+        fallback 模式下当前引擎超过其历史耗时 p75 仍未返回时会并行启动下一个引擎，
+        由备用引擎返回时包含 hedged=true；
+        fanout 模式下每条结果额外包含 engines（返回该结果的引擎）、engine_ranks 和 rrf_score，
+        并返回 engine_status（各引擎状态）
+
+    每个引擎返回后发送一次进度通知，消息为该引擎的状态和前几条结果
+    {engine, status, total, results}，可提前使用已返回的结果。
 
     推荐使用 auto 模式自动选择可用引擎。
     返回结构详见: docs/MCP工具使用说明.md
     """
-    result = await multi_search(query, engine, num_results, search_type)
+    result = await multi_search(
+        query, engine, num_results, search_type, bypass_cache, mode, context_progress(ctx)
+    )
 
     # 记录统计信息
-    import json
-    result_data = json.loads(result)
-    available = result_data.get("available_engines", "?")
-    banned = result_data.get("banned_engines", "?")
+    available = result.get("available_engines", "?")
+    banned = result.get("banned_engines", "?")
 
-    if result_data.get("total", 0) > 0:
-        logger.info(f"   ✅ 搜索成功: {result_data.get('engine_name')} 返回 {result_data.get('total')} 条结果")
+    if result.get("total", 0) > 0:
+        logger.info(f"   ✅ 搜索成功: {result.get('engine_name')} 返回 {result.get('total')} 条结果")
         logger.info(f"   📊 引擎状态: 可用 {available} 个, 被禁用 {banned} 个")
     else:
         logger.warning(f"   ⚠️ 搜索失败或返回0条结果")
         logger.warning(f"   📊 引擎状态: 可用 {available} 个, 被禁用 {banned} 个")
 
-    return result
+    return shape_output("multi_search", result, fields, compact, truncate)
 
 
 @server.tool(name="web-browser_fetch_article_content_tool")
 async def fetch_article_content_tool(
     url: str,
     include_images: bool = True,
+    block_mode: Optional[str] = None,
+    mode: Optional[str] = None,
+    bypass_cache: bool = False,
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+    ctx: Context = None,
 ) -> str:
     """获取网页文章内容和图片链接
 
-    使用浏览器访问网页，智能提取文章正文、标题和图片链接。
-    自动处理动态内容，包含页面质量检测。
+    分级抓取：先用 HTTP 直接获取静态 HTML 并提取正文，内容质量不足、
+    页面需要 JavaScript 渲染或被拦截时再使用浏览器。包含页面质量检测。
+    升级到浏览器时发送一次进度通知（含升级原因），抓取完成时再发送一次（含标题和正文预览）。
 
     Args:
         url: 文章URL
         include_images: 是否提取图片链接（默认True）
+        block_mode: 资源拦截模式 (default|trackers|first_party)，默认 trackers（可配置）；
+            first_party 只加载文章站点自身域名和常见 CDN，速度最快（仅浏览器层）
+        mode: 抓取模式 (auto|http|browser)，默认 auto；http 只用 HTTP，browser 直接用浏览器
+        bypass_cache: 跳过文章缓存强制重新抓取（默认False；缓存10分钟内直接返回，
+            之后用 ETag/Last-Modified 条件请求重新验证）
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "title,content,status.status"
+        compact: 紧凑输出（不缩进，去掉 checks/issues/suggestions 等诊断数组）
+        truncate: 按字段名截断长字符串，如 {"content": 2000, "*": 500}（"*" 为其余字段的上限）
 
     Returns:
         JSON格式，包含：url, title, content, content_length,
-        images[{url, alt, width, height}], image_count, status
+        images[{url, alt, width, height}], image_count, status,
+        fetch_tier（http|browser|news_storage，实际使用的抓取层级）, escalation_reason（升级到浏览器的原因）；
+        命中缓存时额外包含 cached=true、cache_status（fresh|revalidated|news_storage）和 cache_age（秒）
 
     返回结构详见: docs/MCP工具使用说明.md
     """
-    return await fetch_article_content(url, include_images)
+    result = await fetch_article_content(url, include_images, block_mode, mode, bypass_cache, context_progress(ctx))
+    return shape_output("fetch_article_content", result, fields, compact, truncate)
+
+
+@server.tool(name="web-browser_fetch_articles_batch_tool")
+async def fetch_articles_batch_tool(
+    urls: List[str],
+    include_images: bool = True,
+    max_concurrency: Optional[int] = None,
+    deadline: Optional[float] = None,
+    mode: Optional[str] = None,
+    block_mode: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+    ctx: Context = None,
+) -> str:
+    """批量获取多篇文章内容（一次调用代替多次 fetch_article_content_tool）
+
+    URL 按域名分组后交错并发抓取，同一站点同时只有一个请求，并遵守站点级速率限制。
+    每篇文章的抓取流程（缓存、HTTP/浏览器分级、质量检测）与单篇工具相同。
+    每篇文章完成后发送一次进度通知（含标题和正文预览），可提前处理已完成的文章。
+
+    Args:
+        urls: 文章URL列表（自动去重，单次最多50个）
+        include_images: 是否提取图片链接（默认True）
+        max_concurrency: 最大并发数（默认4，最大8）
+        deadline: 整批截止时间（秒，默认120，0 表示不限制），到期未完成的文章标记为 timeout/skipped
+        mode: 抓取模式 (auto|http|browser)，默认 auto
+        block_mode: 资源拦截模式 (default|trackers|first_party)，默认 trackers（可配置），同 fetch_article_content_tool
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "results.url,results.article.title,results.article.content"
+        compact: 紧凑输出（不缩进，去掉 checks/issues/suggestions 等诊断数组）
+        truncate: 按字段名截断长字符串，如 {"content": 2000, "*": 500}（"*" 为其余字段的上限）
+
+    Returns:
+        JSON格式，包含：total, succeeded, failed, elapsed_ms,
+        results[{url, batch_status（ok|failed|error|timeout|skipped）, queued_ms, elapsed_ms,
+        article（与 fetch_article_content_tool 的返回结构相同）}]，顺序与输入一致
+    """
+    result = await fetch_articles_batch(
+        urls, include_images, max_concurrency, deadline, mode, block_mode, on_progress=context_progress(ctx)
+    )
+    return shape_output("fetch_articles_batch", result, fields, compact, truncate)
 
 
 @server.tool(name="web-browser_baidu_hot_search_tool")
-async def baidu_hot_search_tool() -> str:
+async def baidu_hot_search_tool(
+    fields: Optional[str] = None,
+    compact: bool = False,
+    truncate: Optional[Dict[str, int]] = None,
+) -> str:
     """获取百度热搜榜 - 使用 Playwright 浏览器自动化
 
+    Args:
+        fields: 只返回指定字段（逗号分隔，嵌套字段用点号，列表逐项投影），如 "hot_items.title,hot_items.url"
+        compact: 紧凑输出（不缩进）
+        truncate: 按字段名截断长字符串，如 {"title": 30}（"*" 为其余字段的上限）
+
     Returns:
         JSON 格式的热搜榜单（前50条）
     """
-    return await baidu_hot_search()
+    return shape_output("baidu_hot_search", await baidu_hot_search(), fields, compact, truncate)
+
+
+@server.tool(name="web-browser_stats_tool")
+async def stats_tool() -> str:
+    """获取服务运行统计（用于诊断性能问题）
+
+    Returns:
+        JSON格式，包含：startup（导入耗时、预热各阶段耗时、首个结果耗时 TTFR）,
+        browser_pool（浏览器池与资源拦截）, readiness, http（HTTP 快速路径）,
+        extraction_pool, search_cache, article_cache, coalescing（合并的并发请求数）,
+        hedging（对冲次数与各引擎耗时分位数）,
+        engine_ranking（各引擎成功率、空结果率、拦截率、延迟 EWMA 与当前排序）,
+        engine_registry（跨进程共享的禁用记录：禁用次数、原因与剩余时间）,
+        rate_limiter（限流等待直方图）, payload（各工具的输出大小与序列化耗时）
+    """
+    return dumps(get_service_stats())
 
 
 if __name__ == "__main__":
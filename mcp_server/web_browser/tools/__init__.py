@@ -23,7 +23,10 @@ from .search_tools import (
     sohu_news_search,
     multi_search,
     fetch_article_content,
+    fetch_articles_batch,
     baidu_hot_search,
+    get_service_stats,
+    warm_start,
 )
 
 __all__ = [
@@ -49,5 +52,8 @@ __all__ = [
     "sohu_news_search",
     "multi_search",
     "fetch_article_content",
+    "fetch_articles_batch",
     "baidu_hot_search",
+    "get_service_stats",
+    "warm_start",
 ]
@@ -0,0 +1,76 @@
+"""工具结果类型 - 工具函数之间传递的结构化结果
+
+工具函数返回这里定义的结果对象，不再在内部序列化为 JSON；降级、融合、缓存和日志统计
+直接读取字段，只在 FastMCP 边界（main.py）由 ``shared.output.shape_output`` 序列化一次。
+使用 TypedDict 而不是 dataclass：结果本身就是最终 JSON 的结构，缓存和字段投影都按字典处理。
+"""
+
+from typing import Dict, List, TypedDict
+
+
+class SearchResponse(TypedDict, total=False):
+    """搜索结果（单个引擎、降级搜索和 fanout 融合搜索共用）"""
+    engine: str
+    engine_name: str
+    query: str
+    total: int
+    results: List[dict]
+    fetch_mode: str  # http | browser
+    escalation_reason: str
+    error: str
+    blocked: bool
+    block_reason: str
+    cached: bool
+    cache_age: float
+    hedged: bool
+    available_engines: int
+    banned_engines: int
+    # fanout 模式
+    mode: str
+    engines_queried: List[str]
+    engine_status: Dict[str, str]
+    elapsed_ms: float
+
+
+class ArticleResult(TypedDict, total=False):
+    """文章抓取结果"""
+    url: str
+    title: str
+    content: str
+    content_length: int
+    images: List[dict]
+    image_count: int
+    status: dict
+    fetch_tier: str  # http | browser | news_storage
+    metadata: dict
+    suggestions: List[str]
+    escalation_reason: str
+    cached: bool
+    cache_status: str  # fresh | revalidated | news_storage
+    cache_age: float
+
+
+class BatchArticleItem(TypedDict, total=False):
+    """批量抓取中单篇文章的结果"""
+    url: str
+    batch_status: str  # ok | failed | error | timeout | skipped
+    queued_ms: float
+    elapsed_ms: float
+    article: ArticleResult
+    error: str
+
+
+class BatchArticleResponse(TypedDict):
+    """批量抓取结果"""
+    total: int
+    succeeded: int
+    failed: int
+    elapsed_ms: float
+    results: List[BatchArticleItem]
+
+
+class HotSearchResponse(TypedDict, total=False):
+    """百度热搜榜"""
+    total: int
+    hot_items: List[dict]
+    error: str
@@ -1,18 +1,52 @@
 """搜索工具 - 统一的搜索接口"""
 
-import json
+from __future__ import annotations
+
+import asyncio
 import re
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urljoin, urlparse
 
 from loguru import logger
-from playwright.async_api import Page
 
 from ..config.settings import get_settings
+from ..core.article_cache import ArticleEntry, get_article_cache
+from ..core.batch_scheduler import BatchItem, DomainScheduler
 from ..core.browser_pool import get_browser_pool
+from ..core.engine_registry import get_engine_registry
+from ..core.extraction_pool import get_extraction_pool
+from ..core.hedging import get_engine_latency, get_hedge_stats
+from ..core.http_client import HttpPage, get_http_client, get_http_stats
+from ..core.page_inspector import (
+    ANTI_BOT_TITLE_KEYWORDS,
+    ANTI_BOT_PHRASES,
+    ARTICLE_ANTI_BOT_TITLE_KEYWORDS,
+    ARTICLE_INSPECTION,
+    ERROR_TITLE_KEYWORDS,
+    SEARCH_INSPECTION,
+    PageSnapshot,
+    inspect_page,
+)
 from ..core.rate_limiter import RateLimiter
+from ..core.readiness import get_readiness_stats
+from ..core.resource_blocker import BLOCK_MODES, BlockPolicy
+from ..core.search_cache import get_search_cache, make_cache_key
+from ..core.single_flight import SingleFlight
+from ..core.startup import get_startup_stats
 from ..engines.base import SearchResult
 from ..engines.factory import EngineFactory
-from ..utils.helpers import get_random_user_agent, search_result_to_dict
+from ..engines.ranking import EngineRanker
+from ..utils.helpers import canonicalize_url, get_random_user_agent, search_result_to_dict
+from ..utils.html_extract import DEFAULT_STAGES, ExtractionResult, extract_article
+from ..utils.html_parser import element_text, first, page_title, parse_document
+from ..utils.result_fusion import fuse_results
+from .results import ArticleResult, BatchArticleResponse, HotSearchResponse, SearchResponse
+from ...shared.output import get_payload_stats
+from ...shared.progress import ProgressCallback, ProgressReporter
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 
 # 全局实例
@@ -22,12 +56,64 @@ _rate_limiter = RateLimiter(
     time_window=_settings.rate_limit_time_window,
     max_domain_requests=_settings.max_domain_requests_per_second,
     max_engine_requests=_settings.max_engine_requests_per_second,
+    burst=_settings.rate_limit_burst,
+    overrides=_settings.rate_limit_overrides,
 )
-_engine_factory = EngineFactory(enabled_engines=_settings.enabled_engines)
+_engine_registry = get_engine_registry(_settings)
+_engine_factory = EngineFactory(
+    enabled_engines=_settings.enabled_engines,
+    ranker=EngineRanker(
+        priority=EngineFactory.get_speed_priority(),
+        decay=_settings.engine_ranking_decay,
+        latency_offset=_settings.engine_ranking_latency_offset,
+        store=_engine_registry,
+    )
+    if _settings.engine_ranking == "adaptive"
+    else None,
+    registry=_engine_registry,
+)
+_http_client = get_http_client()
+_extraction_pool = get_extraction_pool(_settings)
+_startup_stats = get_startup_stats()
+_search_cache = get_search_cache(_settings)
+_article_cache = get_article_cache(_settings)
+_engine_latency = get_engine_latency(_settings)
+_hedge_stats = get_hedge_stats()
+# 相同的并发搜索/文章抓取共享一个在途任务
+_search_flights = SingleFlight("search")
+_article_flights = SingleFlight("article")
+
+# 与 CAPTCHA_SELECTORS 等价的 XPath（HTTP 层使用）
+_CAPTCHA_XPATH = (
+    '//*[@id="captcha" or @id="geetest" or contains(@class, "captcha") '
+    'or contains(@class, "geetest") or contains(@class, "verify")]'
+)
+
+# 被重定向到验证页的 URL 特征（HTTP 快速路径）
+_ANTI_BOT_URL_MARKERS = ["wappass.baidu.com", "antispider", "captcha", "verify", "/sorry/"]
+
+# 文章抓取模式
+_ARTICLE_FETCH_MODES = ("auto", "http", "browser")
+
+# 多引擎搜索模式
+_MULTI_SEARCH_MODES = ("fallback", "fanout")
+
+# 进度消息中每个引擎附带的结果条数、每篇文章附带的正文字符数
+_PROGRESS_PREVIEW_RESULTS = 10
+_PROGRESS_PREVIEW_CHARS = 300
+
+# 内容质量等级（_assess_content_quality 的 quality 字段，数值越大质量越好）
+_QUALITY_RANK = {"unknown": 0, "poor": 0, "warning": 1, "acceptable": 2, "good": 3}
+
+# 页面需要 JavaScript 才能显示内容的提示（noscript 中常见）
+_JS_REQUIRED_PHRASES = [
+    "enable javascript", "javascript is disabled", "javascript is required",
+    "启用javascript", "开启javascript", "启用 javascript", "开启 javascript", "支持javascript",
+]
 
 
 async def _check_anti_bot(page: Page, url: str) -> tuple[bool, str]:
-    """检测页面是否被反爬虫拦截
+    """检测页面是否被反爬虫拦截（一次页面检查完成全部检测）
 
     Args:
         page: Playwright页面对象
@@ -37,58 +123,119 @@ async def _check_anti_bot(page: Page, url: str) -> tuple[bool, str]:
         (是否被拦截, 拦截原因)
     """
     try:
-        # 1. 检查HTTP状态
-        response = await page.evaluate("() => ({ status: window.performance?.getEntriesByType?.('navigation')?.[0]?.responseStatus || 200 })")
-        if response and response.get("status", 200) >= 400:
-            return True, f"HTTP错误: {response['status']}"
-
-        # 2. 检查页面标题
-        page_title = await page.title()
-        anti_bot_keywords = [
-            "验证", "安全", "captcha", "人机验证", "机器人", "robot", "验证码",
-            "滑动验证", "点选验证", "短信验证", "阿里云", "云盾", "腾讯云", "天御",
-            "访问频繁", "请求过于频繁", "操作过于频繁", "系统检测", "异常访问",
-            "风险检测", "安全检测", "cc攻击", "防刷", "反爬"
-        ]
+        snapshot = await inspect_page(page, SEARCH_INSPECTION)
+    except Exception as e:
+        logger.warning(f"⚠️ 反爬虫检测失败: {e}")
+        return False, ""
 
-        page_title_lower = page_title.lower()
-        for keyword in anti_bot_keywords:
-            if keyword.lower() in page_title_lower or keyword in page_title:
-                return True, f"页面标题包含反爬虫关键词: {keyword}"
-
-        # 3. 检查页面内容
-        body_text = await page.evaluate("() => document.body.innerText?.substring(0, 500) || ''")
-        anti_bot_phrases = [
-            '访问过于频繁', '请求过于频繁', '操作过于频繁', '系统检测到异常访问',
-            '疑似机器人', '人机验证', '安全验证', '请完成验证', 'ip被封', '禁止访问',
-            'access denied', 'forbidden', 'rate limit', 'too many requests'
-        ]
+    # 1. 检查HTTP状态（Navigation Timing 不可用时视为正常）
+    if snapshot.status >= 400:
+        return True, f"HTTP错误: {snapshot.status}"
 
-        for phrase in anti_bot_phrases:
-            if phrase.lower() in body_text.lower():
-                return True, f"页面内容包含反爬虫提示: {phrase}"
-
-        # 4. 检查验证码元素
-        captcha_elements = await page.evaluate("""() => {
-            const selectors = ['#captcha', '.captcha', '[class*="captcha"]', '#geetest',
-                             '[class*="geetest"]', '.recaptcha', '[class*="recaptcha"]',
-                             '.verify', '[class*="verify"]'];
-            for (const selector of selectors) {
-                if (document.querySelector(selector)) {
-                    return true;
-                }
-            }
-            return false;
-        }""")
+    # 2. 检查页面标题和页面内容
+    is_blocked, reason = _match_anti_bot_text(snapshot.title, snapshot.body_text)
+    if is_blocked:
+        return True, reason
 
-        if captcha_elements:
-            return True, "检测到验证码元素"
+    # 3. 检查验证码元素
+    if snapshot.captcha_elements:
+        return True, "检测到验证码元素"
+
+    return False, ""
 
-        return False, ""
 
+def _match_anti_bot_text(title: str, body_text: str) -> tuple[bool, str]:
+    """按关键词检测页面标题和正文开头是否为反爬虫页面"""
+    title_lower = title.lower()
+    for keyword in ANTI_BOT_TITLE_KEYWORDS:
+        if keyword.lower() in title_lower or keyword in title:
+            return True, f"页面标题包含反爬虫关键词: {keyword}"
+
+    body_lower = body_text.lower()
+    for phrase in ANTI_BOT_PHRASES:
+        if phrase.lower() in body_lower:
+            return True, f"页面内容包含反爬虫提示: {phrase}"
+
+    return False, ""
+
+
+def _check_anti_bot_html(status_code: int, final_url: str, root) -> tuple[bool, str]:
+    """检测 HTTP 抓取的页面是否被反爬虫拦截（与 _check_anti_bot 的规则一致）
+
+    Args:
+        status_code: HTTP状态码
+        final_url: 跟随重定向后的URL
+        root: lxml 文档根元素
+
+    Returns:
+        (是否被拦截, 拦截原因)
+    """
+    if status_code >= 400:
+        return True, f"HTTP错误: {status_code}"
+
+    final_url_lower = final_url.lower()
+    for marker in _ANTI_BOT_URL_MARKERS:
+        if marker in final_url_lower:
+            return True, f"被重定向到验证页: {final_url}"
+
+    body_text = element_text(first(root.xpath("//body")))[:500]
+    is_blocked, reason = _match_anti_bot_text(page_title(root), body_text)
+    if is_blocked:
+        return True, reason
+
+    if root.xpath(_CAPTCHA_XPATH):
+        return True, "检测到验证码元素"
+
+    return False, ""
+
+
+async def _execute_http_search(
+    engine,
+    query: str,
+    search_url: str,
+    num_results: int,
+    search_type: str,
+) -> tuple[Optional[SearchResponse], str]:
+    """HTTP 快速路径：不启动浏览器页面，直接抓取并解析服务端渲染的结果页
+
+    Returns:
+        (搜索结果, 结果类型)；结果类型为 "hit" 时返回结果，
+        否则（blocked | empty | error）返回 None，由调用方升级到浏览器
+    """
+    try:
+        http_page = await _http_client.fetch(
+            search_url, headers={"User-Agent": get_random_user_agent()}
+        )
+        root = parse_document(http_page.text)
     except Exception as e:
-        logger.warning(f"⚠️ 反爬虫检测失败: {e}")
-        return False, ""
+        logger.debug(f"   ⚡ {engine.config.name} HTTP 抓取失败: {e}")
+        return None, "error"
+
+    is_blocked, block_reason = _check_anti_bot_html(http_page.status_code, http_page.final_url, root)
+    if is_blocked:
+        # HTTP 请求被拦截不代表浏览器也会被拦截，只升级，不禁用引擎
+        logger.info(f"   ⚡ {engine.config.name} HTTP 请求被拦截（{block_reason}），升级到浏览器")
+        return None, "blocked"
+
+    try:
+        results = engine.parse_html(root, http_page.final_url, query, num_results, search_type)
+    except Exception as e:
+        logger.debug(f"   ⚡ {engine.config.name} HTML 解析失败: {e}")
+        return None, "error"
+
+    if not results:
+        logger.info(f"   ⚡ {engine.config.name} HTTP 结果为空，升级到浏览器")
+        return None, "empty"
+
+    results_dict = [search_result_to_dict(r) for r in results]
+    return {
+        "engine": engine.engine_id,
+        "engine_name": engine.config.name,
+        "query": query,
+        "total": len(results_dict),
+        "results": results_dict,
+        "fetch_mode": "http",
+    }, "hit"
 
 
 async def _execute_search(
@@ -96,21 +243,65 @@ async def _execute_search(
     query: str,
     num_results: int = 30,
     search_type: str = "web",
-) -> str:
-    """执行搜索的内部函数（带反爬虫检测）"""
+    cache_lookup: bool = True,
+) -> SearchResponse:
+    """执行搜索（先查缓存，成功的结果写入缓存）
+
+    Args:
+        cache_lookup: 是否查找缓存；为 False 时直接搜索，但结果仍会写入缓存
+    """
+    if cache_lookup:
+        cached = await _get_cached_search(engine_id, query, num_results, search_type)
+        if cached is not None:
+            return cached
+
+    result, elapsed = await _execute_search_uncached(engine_id, query, num_results, search_type)
+    outcome = _search_outcome(result)
+    _engine_factory.record_outcome(engine_id, outcome, elapsed)
+    if outcome == "ok":
+        _engine_latency.record(engine_id, elapsed)
+        await _search_cache.put(engine_id, query, search_type, num_results, result)
+    return result
+
+
+async def _get_cached_search(
+    engine_id: str,
+    query: str,
+    num_results: int,
+    search_type: str,
+    record_miss: bool = True,
+) -> Optional[SearchResponse]:
+    """查找缓存的搜索结果，命中时返回附带缓存信息的结果"""
+    entry = await _search_cache.get(engine_id, query, search_type, num_results, record_miss=record_miss)
+    if entry is None:
+        return None
+    cache_age = time.time() - entry.created_at
+    logger.info(f"💾 [缓存命中] {engine_id} {query} ({search_type})，缓存于 {cache_age:.0f} 秒前")
+    return {**entry.payload, "cached": True, "cache_age": round(cache_age, 1)}
+
+
+async def _execute_search_uncached(
+    engine_id: str,
+    query: str,
+    num_results: int = 30,
+    search_type: str = "web",
+) -> tuple[SearchResponse, float]:
+    """执行搜索的内部函数（先限速，再搜索）
+
+    Returns:
+        (搜索结果, 搜索耗时秒)；耗时从限速放行后开始计算，不含限速等待，
+        用于引擎排序和对冲延迟（被限速的引擎不应显得更慢）
+    """
     engine = _engine_factory.get_engine(engine_id)
     if not engine:
-        return json.dumps(
-            {
-                "error": f"搜索引擎 {engine_id} 不可用",
-                "engine": engine_id,
-                "engine_name": engine_id,
-                "query": query,
-                "total": 0,
-                "results": [],
-            },
-            ensure_ascii=False,
-        )
+        return {
+            "error": f"搜索引擎 {engine_id} 不可用",
+            "engine": engine_id,
+            "engine_name": engine_id,
+            "query": query,
+            "total": 0,
+            "results": [],
+        }, 0.0
 
     logger.info(f"🔍 [{engine.config.name}] {query} ({search_type})")
 
@@ -119,11 +310,37 @@ async def _execute_search(
     domain = engine.extract_domain(search_url)
     await _rate_limiter.acquire(domain=domain, engine=engine_id)
 
+    start = time.perf_counter()
+    result = await _search_engine(engine, query, search_url, num_results, search_type)
+    return result, time.perf_counter() - start
+
+
+async def _search_engine(
+    engine,
+    query: str,
+    search_url: str,
+    num_results: int,
+    search_type: str,
+) -> SearchResponse:
+    """用单个引擎搜索（HTTP 快速路径优先，必要时使用浏览器，带反爬虫检测）"""
+    engine_id = engine.engine_id
+
+    # HTTP 快速路径（服务端渲染的引擎），被拦截或结果为空时继续走浏览器流程
+    escalation_reason = None
+    if _settings.http_fast_path_enabled and engine.supports_http:
+        result, outcome = await _execute_http_search(engine, query, search_url, num_results, search_type)
+        get_http_stats().record_outcome(engine_id, outcome)
+        if result is not None:
+            return result
+        escalation_reason = outcome
+
     try:
-        user_agent = get_random_user_agent()
-        async with _browser_pool.get_page(user_agent=user_agent, engine=engine) as page:
-            # 先访问页面
-            await page.goto(search_url, timeout=30000)
+        # 不指定 User-Agent：复用该引擎已有指纹的 Context，新建时由浏览器池随机选择
+        async with _browser_pool.get_page(engine=engine) as page:
+            # 唯一一次导航（引擎声明 URL 与等待条件，框架负责访问）
+            nav_start = time.perf_counter()
+            await engine.navigate(page, search_url)
+            nav_ms = (time.perf_counter() - nav_start) * 1000
 
             # 检测反爬虫拦截
             is_blocked, block_reason = await _check_anti_bot(page, search_url)
@@ -131,23 +348,24 @@ async def _execute_search(
                 logger.error(f"🚨 {engine.config.name} 被反爬虫拦截: {block_reason}")
                 # 禁用该引擎
                 _engine_factory.ban_engine(engine_id, block_reason)
-                return json.dumps(
-                    {
-                        "engine": engine_id,
-                        "engine_name": engine.config.name,
-                        "query": query,
-                        "total": 0,
-                        "results": [],
-                        "blocked": True,
-                        "block_reason": block_reason,
-                        "error": "被反爬虫拦截",
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                )
+                return {
+                    "engine": engine_id,
+                    "engine_name": engine.config.name,
+                    "query": query,
+                    "total": 0,
+                    "results": [],
+                    "blocked": True,
+                    "block_reason": block_reason,
+                    "error": "被反爬虫拦截",
+                }
 
-            # 执行搜索
-            results = await engine.search(page, query, num_results, search_type)
+            # 按引擎声明的就绪条件等待结果稳定，然后解析（不再二次导航）
+            readiness = await engine.wait_until_ready(page, num_results, search_type)
+            results = await engine.parse(page, query, num_results, search_type)
+            logger.debug(
+                f"   ⏱️ {engine.config.name} 导航 {nav_ms:.0f}ms, "
+                f"就绪等待 {readiness.elapsed_ms:.0f}ms ({readiness.reason})"
+            )
 
             # 如果没有结果，可能是被拦截了
             if len(results) == 0:
@@ -157,74 +375,48 @@ async def _execute_search(
 
             results_dict = [search_result_to_dict(r) for r in results]
 
-            return json.dumps(
-                {
-                    "engine": engine_id,
-                    "engine_name": engine.config.name,
-                    "query": query,
-                    "total": len(results_dict),
-                    "results": results_dict,
-                },
-                ensure_ascii=False,
-                indent=2,
-            )
-
-    except Exception as e:
-        logger.error(f"❌ {engine.config.name} 搜索失败: {e}")
-        return json.dumps(
-            {
+            result = {
                 "engine": engine_id,
                 "engine_name": engine.config.name,
                 "query": query,
-                "total": 0,
-                "results": [],
-                "error": str(e),
-            },
-            ensure_ascii=False,
-        )
+                "total": len(results_dict),
+                "results": results_dict,
+                "fetch_mode": "browser",
+            }
+            if escalation_reason:
+                result["escalation_reason"] = escalation_reason
+            return result
 
+    except Exception as e:
+        logger.error(f"❌ {engine.config.name} 搜索失败: {e}")
+        return {
+            "engine": engine_id,
+            "engine_name": engine.config.name,
+            "query": query,
+            "total": 0,
+            "results": [],
+            "error": str(e),
+        }
 
-async def _multi_search_with_fallback(
-    query: str,
-    preferred_engine: str = "auto",
-    num_results: int = 30,
-    search_type: str = "web",
-) -> str:
-    """多搜索引擎搜索（智能降级，自动跳过被禁用的引擎）"""
-    available_count = _engine_factory.get_available_engine_count()
-    banned_count = _engine_factory.get_banned_engine_count()
 
-    logger.info(f"📊 可用引擎: {available_count}个, 被禁用: {banned_count}个")
+def _select_engines(preferred_engine: str = "auto") -> tuple[list, Optional[str]]:
+    """确定引擎尝试顺序（首选引擎在前，其余按速度优先级，跳过被禁用的）
 
-    # 选择引擎
+    Returns:
+        (去重后的引擎列表, 错误信息)；没有可用引擎时列表为空
+    """
     if preferred_engine == "auto":
         engine = _engine_factory.get_random_engine()
         if not engine:
-            return json.dumps(
-                {
-                    "query": query,
-                    "total": 0,
-                    "results": [],
-                    "error": f"所有搜索引擎均被禁用，请稍后重试（被禁用引擎将在{EngineFactory.BAN_DURATION}秒后自动解禁）",
-                },
-                ensure_ascii=False,
-            )
-        engines_to_try = [engine] + _engine_factory.get_engines_by_priority()
+            unban_in = _engine_factory.get_next_unban_in() or 0
+            return [], f"所有搜索引擎均被禁用，请稍后重试（最早的引擎将在{unban_in:.0f}秒后自动解禁）"
     else:
         engine = _engine_factory.get_engine(preferred_engine)
         if not engine:
             engine = _engine_factory.get_random_engine()
         if not engine:
-            return json.dumps(
-                {
-                    "query": query,
-                    "total": 0,
-                    "results": [],
-                    "error": "所有搜索引擎均被禁用",
-                },
-                ensure_ascii=False,
-            )
-        engines_to_try = [engine] + _engine_factory.get_engines_by_priority()
+            return [], "所有搜索引擎均被禁用"
+    engines_to_try = [engine] + _engine_factory.get_engines_by_priority()
 
     # 去重
     seen_engines = set()
@@ -233,58 +425,290 @@ async def _multi_search_with_fallback(
         if e and e.engine_id not in seen_engines:
             seen_engines.add(e.engine_id)
             unique_engines.append(e)
+    return unique_engines, None
+
+
+async def _multi_search_with_fallback(
+    query: str,
+    preferred_engine: str = "auto",
+    num_results: int = 30,
+    search_type: str = "web",
+    bypass_cache: bool = False,
+    on_progress: Optional[ProgressCallback] = None,
+) -> SearchResponse:
+    """多搜索引擎搜索（智能降级，自动跳过被禁用的引擎）"""
+    available_count = _engine_factory.get_available_engine_count()
+    banned_count = _engine_factory.get_banned_engine_count()
+
+    logger.info(f"📊 可用引擎: {available_count}个, 被禁用: {banned_count}个")
+
+    # 选择引擎
+    unique_engines, error = _select_engines(preferred_engine)
+    if error:
+        return {
+            "query": query,
+            "total": 0,
+            "results": [],
+            "error": error,
+        }
 
     logger.info(f"   📋 引擎尝试顺序: {[e.engine_id for e in unique_engines]}")
 
-    # 依次尝试每个引擎
-    for engine in unique_engines:
-        try:
-            result = await _execute_search(
+    # 先查缓存（不消耗导航和限速令牌）：auto 模式下任一候选引擎有未过期的结果即直接返回；
+    # 指定引擎时只查该引擎，不能用其他引擎的缓存代替
+    if bypass_cache:
+        _search_cache.record_bypass()
+    else:
+        cache_candidates = unique_engines if preferred_engine == "auto" else unique_engines[:1]
+        for engine in cache_candidates:
+            cached = await _get_cached_search(
+                engine.engine_id, query, num_results, search_type, record_miss=False
+            )
+            if cached is not None:
+                return cached
+        _search_cache.record_miss()
+
+    # 依次尝试每个引擎；当前引擎超过其历史耗时分位数仍未返回时并行启动下一个（对冲）
+    _hedge_stats.searches += 1
+    progress = ProgressReporter(on_progress, total=len(unique_engines))
+    queue = list(unique_engines)
+    running: dict = {}  # {task: (engine, 是否为对冲启动)}
+    hedge_at: Optional[float] = None  # 下一次对冲的时间点
+    hedged = False
+
+    def launch(is_hedge: bool) -> None:
+        nonlocal hedge_at
+        engine = queue.pop(0)
+        task = asyncio.ensure_future(
+            _execute_search(
                 engine_id=engine.engine_id,
                 query=query,
                 num_results=num_results,
                 search_type=search_type,
+                cache_lookup=False,
             )
+        )
+        running[task] = (engine, is_hedge)
+        hedge_at = time.perf_counter() + _engine_latency.hedge_delay(engine.engine_id)
 
-            result_data = json.loads(result)
-
-            # 如果被拦截，继续尝试下一个引擎
-            if result_data.get("blocked"):
-                logger.warning(f"   ⚠️ {engine.config.name} 被拦截，尝试下一个引擎")
+    try:
+        while running or queue:
+            if not running:
+                launch(is_hedge=False)
+
+            timeout = None
+            if _settings.hedge_enabled and queue and len(running) < _settings.hedge_max_parallel:
+                timeout = max(0.0, hedge_at - time.perf_counter())
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            if not done:
+                slow_engine = running[next(reversed(running))][0]
+                logger.info(
+                    f"   ⏱️ {slow_engine.config.name} 超过 {_engine_latency.hedge_delay(slow_engine.engine_id):.1f} 秒"
+                    f"未返回，并行启动 {queue[0].config.name}"
+                )
+                launch(is_hedge=True)
+                _hedge_stats.hedges_launched += 1
+                hedged = True
                 continue
 
-            # 如果有结果，返回
-            if result_data.get("total", 0) > 0:
-                logger.info(f"   ✅ {engine.config.name} 成功返回 {result_data['total']} 条结果")
-                # 添加引擎状态信息
-                result_data["available_engines"] = available_count
-                result_data["banned_engines"] = banned_count
-                return result
+            failures = 0
+            for task in done:
+                engine, is_hedge = running.pop(task)
+                try:
+                    result_data = task.result()
+                except Exception as e:
+                    logger.warning(f"   ❌ {engine.config.name} 搜索失败: {e}")
+                    await progress.step(_engine_progress(engine.engine_id, "error", {"error": str(e)}))
+                    failures += 1
+                    continue
+                await progress.step(_engine_progress(engine.engine_id, _search_outcome(result_data), result_data))
 
-        except Exception as e:
-            logger.warning(f"   ❌ {engine.config.name} 搜索失败: {e}")
-            continue
+                # 如果被拦截，继续尝试下一个引擎
+                if result_data.get("blocked"):
+                    logger.warning(f"   ⚠️ {engine.config.name} 被拦截，尝试下一个引擎")
+                    failures += 1
+                    continue
+
+                # 如果有结果，返回
+                if result_data.get("total", 0) > 0:
+                    logger.info(f"   ✅ {engine.config.name} 成功返回 {result_data['total']} 条结果")
+                    # 复制一份再附加字段：同一对象已写入搜索缓存
+                    result_data = {**result_data}
+                    if hedged:
+                        _hedge_stats.hedged += 1
+                        if is_hedge:
+                            _hedge_stats.hedge_wins += 1
+                        else:
+                            _hedge_stats.primary_wins += 1
+                        result_data["hedged"] = True
+                    # 添加引擎状态信息
+                    result_data["available_engines"] = available_count
+                    result_data["banned_engines"] = banned_count
+                    return result_data
+                failures += 1
+
+            # 有引擎失败而其他引擎仍在进行时，立即启动下一个引擎补位（补位不计为对冲）
+            while failures and running and queue and len(running) < _settings.hedge_max_parallel:
+                launch(is_hedge=False)
+                failures -= 1
+    finally:
+        # 取消落后的请求，并等待其退出（释放页面和连接后再返回）
+        if running:
+            for task in running:
+                task.cancel()
+                _hedge_stats.cancelled += 1
+            await asyncio.gather(*running, return_exceptions=True)
+
+    if hedged:
+        _hedge_stats.hedged += 1
 
     # 所有引擎都失败
-    return json.dumps(
-        {
-            "query": query,
-            "total": 0,
-            "results": [],
-            "error": "所有搜索引擎均不可用或返回0条结果",
-            "available_engines": _engine_factory.get_available_engine_count(),
-            "banned_engines": _engine_factory.get_banned_engine_count(),
-        },
-        ensure_ascii=False,
+    return {
+        "query": query,
+        "total": 0,
+        "results": [],
+        "error": "所有搜索引擎均不可用或返回0条结果",
+        "available_engines": _engine_factory.get_available_engine_count(),
+        "banned_engines": _engine_factory.get_banned_engine_count(),
+    }
+
+
+def _search_outcome(result_data: dict) -> str:
+    """单个引擎搜索结果的状态（ok | cached | empty | blocked | error）"""
+    if result_data.get("blocked"):
+        return "blocked"
+    if result_data.get("error"):
+        return "error"
+    if result_data.get("total", 0) == 0:
+        return "empty"
+    return "cached" if result_data.get("cached") else "ok"
+
+
+def _engine_progress(engine_id: str, status: str, result_data: dict) -> dict:
+    """单个引擎完成时的进度消息（结果只保留标题和链接）"""
+    payload = {
+        "engine": engine_id,
+        "status": status,
+        "total": result_data.get("total", 0),
+        "results": [
+            {"title": r.get("title", ""), "url": r.get("url", "")}
+            for r in result_data.get("results", [])[:_PROGRESS_PREVIEW_RESULTS]
+        ],
+    }
+    if result_data.get("error"):
+        payload["error"] = result_data["error"]
+    return payload
+
+
+async def _multi_search_fanout(
+    query: str,
+    preferred_engine: str = "auto",
+    num_results: int = 30,
+    search_type: str = "web",
+    bypass_cache: bool = False,
+    on_progress: Optional[ProgressCallback] = None,
+) -> SearchResponse:
+    """多引擎并发搜索（fanout 模式），用倒数排名融合合并结果
+
+    同时查询 ``fanout_engines`` 个引擎（各引擎仍受各自的速率限制），结果按规范化 URL
+    和规范化标题去重。至少 ``fanout_min_engines`` 个引擎成功且去重结果达到 num_results、
+    所有引擎都已返回或到达 ``fanout_deadline`` 时结束，取消仍未返回的引擎。
+    """
+    start = time.perf_counter()
+    candidates, error = _select_engines(preferred_engine)
+    if error:
+        return {"query": query, "mode": "fanout", "total": 0, "results": [], "error": error}
+
+    engines = candidates[: _settings.fanout_engines]
+    min_engines = min(_settings.fanout_min_engines, len(engines))
+    logger.info(f"🔀 [fanout] {query} ({search_type}) 并发查询: {[e.engine_id for e in engines]}")
+    if bypass_cache:
+        _search_cache.record_bypass()
+
+    tasks = {
+        asyncio.ensure_future(
+            _execute_search(
+                engine_id=engine.engine_id,
+                query=query,
+                num_results=num_results,
+                search_type=search_type,
+                cache_lookup=not bypass_cache,
+            )
+        ): engine.engine_id
+        for engine in engines
+    }
+    ranked_lists: list[tuple[str, list]] = []
+    engine_status = {engine.engine_id: "timeout" for engine in engines}
+    progress = ProgressReporter(on_progress, total=len(engines))
+    pending = set(tasks)
+    deadline = start + _settings.fanout_deadline
+
+    try:
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                engine_id = tasks[task]
+                try:
+                    result_data = task.result()
+                except Exception as e:
+                    logger.warning(f"   ❌ [fanout] {engine_id} 搜索失败: {e}")
+                    engine_status[engine_id] = "error"
+                    await progress.step(_engine_progress(engine_id, "error", {"error": str(e)}))
+                    continue
+                engine_status[engine_id] = _search_outcome(result_data)
+                await progress.step(_engine_progress(engine_id, engine_status[engine_id], result_data))
+                if engine_status[engine_id] in ("ok", "cached"):
+                    ranked_lists.append((engine_id, result_data.get("results", [])))
+
+            if len(ranked_lists) >= min_engines and pending:
+                unique_count = len(fuse_results(ranked_lists, k=_settings.fanout_rrf_k))
+                if unique_count >= num_results:
+                    logger.info(f"   ✅ [fanout] 已有 {unique_count} 条去重结果，不再等待其余 {len(pending)} 个引擎")
+                    break
+    finally:
+        # 取消仍未返回的引擎，并等待其退出（释放页面），再构建响应
+        for task in pending:
+            task.cancel()
+            engine_status[tasks[task]] = "cancelled" if time.perf_counter() < deadline else "timeout"
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    hits = fuse_results(ranked_lists, k=_settings.fanout_rrf_k, limit=num_results)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    succeeded = [engine_id for engine_id, _ in ranked_lists]
+    logger.info(
+        f"   🔀 [fanout] {len(succeeded)}/{len(engines)} 个引擎成功，融合后 {len(hits)} 条结果，"
+        f"耗时 {elapsed_ms:.0f}ms"
     )
 
+    result = {
+        "engine": "fanout",
+        "engine_name": "+".join(succeeded) or "fanout",
+        "mode": "fanout",
+        "query": query,
+        "total": len(hits),
+        "results": [hit.to_dict() for hit in hits],
+        "engines_queried": [engine.engine_id for engine in engines],
+        "engine_status": engine_status,
+        "elapsed_ms": round(elapsed_ms, 1),
+        "available_engines": _engine_factory.get_available_engine_count(),
+        "banned_engines": _engine_factory.get_banned_engine_count(),
+    }
+    if not hits:
+        result["error"] = "所有并发查询的引擎均不可用或返回0条结果"
+    return result
+
 
 # ========== 公开工具函数 ==========
 
 
 async def baidu_search(
     query: str, num_results: int = 30, time_range: Optional[str] = None
-) -> str:
+) -> SearchResponse:
     """百度搜索
 
     Args:
@@ -296,97 +720,97 @@ async def baidu_search(
     return await _execute_search("baidu", query, num_results, "web")
 
 
-async def baidu_news_search(query: str, num_results: int = 30) -> str:
+async def baidu_news_search(query: str, num_results: int = 30) -> SearchResponse:
     """百度新闻搜索"""
     return await _execute_search("baidu", query, num_results, "news")
 
 
-async def bing_search(query: str, num_results: int = 30) -> str:
+async def bing_search(query: str, num_results: int = 30) -> SearchResponse:
     """必应搜索"""
     return await _execute_search("bing", query, num_results, "web")
 
 
-async def bing_news_search(query: str, num_results: int = 30) -> str:
+async def bing_news_search(query: str, num_results: int = 30) -> SearchResponse:
     """必应新闻搜索"""
     return await _execute_search("bing", query, num_results, "news")
 
 
-async def sogou_search(query: str, num_results: int = 30) -> str:
+async def sogou_search(query: str, num_results: int = 30) -> SearchResponse:
     """搜狗搜索"""
     return await _execute_search("sogou", query, num_results, "web")
 
 
-async def sogou_news_search(query: str, num_results: int = 30) -> str:
+async def sogou_news_search(query: str, num_results: int = 30) -> SearchResponse:
     """搜狗新闻搜索"""
     return await _execute_search("sogou", query, num_results, "news")
 
 
-async def google_search(query: str, num_results: int = 30) -> str:
+async def google_search(query: str, num_results: int = 30) -> SearchResponse:
     """谷歌搜索"""
     return await _execute_search("google", query, num_results, "web")
 
 
-async def google_news_search(query: str, num_results: int = 30) -> str:
+async def google_news_search(query: str, num_results: int = 30) -> SearchResponse:
     """谷歌新闻搜索"""
     return await _execute_search("google", query, num_results, "news")
 
 
-async def search_360(query: str, num_results: int = 30) -> str:
+async def search_360(query: str, num_results: int = 30) -> SearchResponse:
     """360搜索"""
     return await _execute_search("360", query, num_results, "web")
 
 
-async def search_360_news(query: str, num_results: int = 30) -> str:
+async def search_360_news(query: str, num_results: int = 30) -> SearchResponse:
     """360新闻搜索"""
     return await _execute_search("360", query, num_results, "news")
 
 
-async def toutiao_search(query: str, num_results: int = 30) -> str:
+async def toutiao_search(query: str, num_results: int = 30) -> SearchResponse:
     """今日头条搜索"""
     return await _execute_search("toutiao", query, num_results, "web")
 
 
-async def toutiao_news_search(query: str, num_results: int = 30) -> str:
+async def toutiao_news_search(query: str, num_results: int = 30) -> SearchResponse:
     """今日头条新闻搜索"""
     return await _execute_search("toutiao", query, num_results, "news")
 
 
-async def tencent_search(query: str, num_results: int = 30) -> str:
+async def tencent_search(query: str, num_results: int = 30) -> SearchResponse:
     """腾讯新闻搜索"""
     return await _execute_search("tencent", query, num_results, "web")
 
 
-async def tencent_news_search(query: str, num_results: int = 30) -> str:
+async def tencent_news_search(query: str, num_results: int = 30) -> SearchResponse:
     """腾讯新闻搜索"""
     return await _execute_search("tencent", query, num_results, "news")
 
 
-async def wangyi_search(query: str, num_results: int = 30) -> str:
+async def wangyi_search(query: str, num_results: int = 30) -> SearchResponse:
     """网易新闻搜索"""
     return await _execute_search("wangyi", query, num_results, "web")
 
 
-async def wangyi_news_search(query: str, num_results: int = 30) -> str:
+async def wangyi_news_search(query: str, num_results: int = 30) -> SearchResponse:
     """网易新闻搜索"""
     return await _execute_search("wangyi", query, num_results, "news")
 
 
-async def sina_search(query: str, num_results: int = 30) -> str:
+async def sina_search(query: str, num_results: int = 30) -> SearchResponse:
     """新浪新闻搜索"""
     return await _execute_search("sina", query, num_results, "web")
 
 
-async def sina_news_search(query: str, num_results: int = 30) -> str:
+async def sina_news_search(query: str, num_results: int = 30) -> SearchResponse:
     """新浪新闻搜索"""
     return await _execute_search("sina", query, num_results, "news")
 
 
-async def sohu_search(query: str, num_results: int = 30) -> str:
+async def sohu_search(query: str, num_results: int = 30) -> SearchResponse:
     """搜狐新闻搜索"""
     return await _execute_search("sohu", query, num_results, "web")
 
 
-async def sohu_news_search(query: str, num_results: int = 30) -> str:
+async def sohu_news_search(query: str, num_results: int = 30) -> SearchResponse:
     """搜狐新闻搜索"""
     return await _execute_search("sohu", query, num_results, "news")
 
@@ -396,17 +820,62 @@ async def multi_search(
     engine: str = "auto",
     num_results: int = 30,
     search_type: str = "web",
-) -> str:
-    """多搜索引擎 - 支持自动降级"""
-    return await _multi_search_with_fallback(query, engine, num_results, search_type)
+    bypass_cache: bool = False,
+    mode: str = "fallback",
+    on_progress: Optional[ProgressCallback] = None,
+) -> SearchResponse:
+    """多搜索引擎 - 支持自动降级和多引擎并发融合
+
+    Args:
+        bypass_cache: 为 True 时跳过缓存强制重新搜索（新结果仍会写入缓存）
+        mode: 搜索模式
+            - fallback: 依次尝试引擎，返回第一个有结果的引擎的结果
+            - fanout: 并发查询多个引擎（engine 不为 auto 时作为首选），按倒数排名融合并去重，
+              每条结果的 engines 字段列出返回它的引擎
+        on_progress: 进度回调，每个引擎返回后上报一次（附带该引擎的结果预览）
+
+    Note:
+        相同参数的并发调用会合并为一次搜索，所有调用者收到同一结果；进度只上报给发起搜索的调用者
+    """
+    if mode not in _MULTI_SEARCH_MODES:
+        return {
+            "query": query,
+            "total": 0,
+            "results": [],
+            "error": f"未知的搜索模式: {mode}（可选值: {', '.join(_MULTI_SEARCH_MODES)}）",
+        }
+
+    search = _multi_search_fanout if mode == "fanout" else _multi_search_with_fallback
+    key = f"{make_cache_key(engine, query, search_type, num_results)}|{bypass_cache}|{mode}"
+    request_start = _startup_stats.request_started("search")
+    result = await _search_flights.run(
+        key, lambda: search(query, engine, num_results, search_type, bypass_cache, on_progress)
+    )
+    if result.get("total", 0) > 0:
+        _startup_stats.result_ready("search", request_start)
+    return result
 
 
-async def fetch_article_content(url: str, include_images: bool = True) -> str:
-    """获取文章正文内容
+async def fetch_article_content(
+    url: str,
+    include_images: bool = True,
+    block_mode: Optional[str] = None,
+    mode: Optional[str] = None,
+    bypass_cache: bool = False,
+    on_progress: Optional[ProgressCallback] = None,
+) -> ArticleResult:
+    """获取文章正文内容（先查缓存，再分级抓取：先 HTTP，必要时再用浏览器）
 
     Args:
         url: 文章URL
         include_images: 是否提取图片链接（默认True）
+        block_mode: 资源拦截模式（default|trackers|first_party），为 None 时使用配置的 article_block_mode
+        mode: 抓取模式（auto|http|browser），为 None 时使用配置的 article_fetch_mode
+            - auto: 先 HTTP 抓取并提取，内容质量不足、需要 JavaScript 渲染或被拦截时升级到浏览器
+            - http: 只使用 HTTP 抓取
+            - browser: 直接使用浏览器
+        bypass_cache: 为 True 时跳过缓存重新抓取（新结果仍会写入缓存）
+        on_progress: 进度回调，升级到浏览器和完成时各上报一次
 
     Note:
         始终会检测并返回页面状态信息，包括：
@@ -414,42 +883,389 @@ async def fetch_article_content(url: str, include_images: bool = True) -> str:
         - 页面加载状态
         - 内容质量评估
         - 智能建议
+        - 实际使用的抓取层级（fetch_tier）
+
+        同一文章（规范化 URL 相同、参数相同）的并发调用会合并为一次抓取
     """
     logger.info(f"📄 [获取文章正文] URL: {url}")
 
-    await _rate_limiter.acquire()
+    mode = mode or _settings.article_fetch_mode
+    if mode not in _ARTICLE_FETCH_MODES:
+        return _invalid_option_result(
+            url, f"未知的抓取模式: {mode}", f"mode 可选值: {', '.join(_ARTICLE_FETCH_MODES)}"
+        )
+    block_mode = block_mode or _settings.article_block_mode
+    if block_mode not in BLOCK_MODES:
+        return _invalid_option_result(
+            url, f"未知的拦截模式: {block_mode}", f"block_mode 可选值: {', '.join(BLOCK_MODES)}"
+        )
+
+    canonical_url = canonicalize_url(url)
+    key = f"{canonical_url}|{include_images}|{mode}|{block_mode}|{bypass_cache}"
+    request_start = _startup_stats.request_started("article")
+    result = await _article_flights.run(
+        key,
+        lambda: _fetch_article_content(
+            url, canonical_url, include_images, block_mode, mode, bypass_cache, on_progress
+        ),
+    )
+    if result.get("content"):
+        _startup_stats.result_ready("article", request_start)
+    return result
+
+
+def _invalid_option_result(url: str, reason: str, suggestion: str) -> ArticleResult:
+    """参数取值无效时的返回结果（不发起抓取）"""
+    return {
+        "url": url,
+        "status": {"status": "error", "reason": reason},
+        "title": "",
+        "content": "",
+        "images": [],
+        "suggestions": [suggestion],
+    }
+
+
+async def fetch_articles_batch(
+    urls: list[str],
+    include_images: bool = True,
+    max_concurrency: Optional[int] = None,
+    deadline: Optional[float] = None,
+    mode: Optional[str] = None,
+    block_mode: Optional[str] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> BatchArticleResponse:
+    """批量获取文章正文（按域名交错并发，同一站点的请求不会集中发出）
+
+    Args:
+        urls: 文章URL列表（按规范化 URL 去重，最多 batch_max_urls 个）
+        include_images: 是否提取图片链接
+        max_concurrency: 全局最大并发数，为 None 时使用配置的 batch_max_concurrency
+        deadline: 整个批次的截止时间（秒），为 None 时使用配置的 batch_deadline，为 0 时不限制；
+            到期后仍在进行的抓取被取消（timeout），未启动的 URL 标记为 skipped
+        mode: 抓取模式（auto|http|browser），同 fetch_article_content
+        block_mode: 资源拦截模式，同 fetch_article_content
+        on_progress: 进度回调，每篇文章完成（或失败）时上报一次，附带标题和正文开头
+
+    Returns:
+        批量结果：total, succeeded, failed, elapsed_ms, results[{url, batch_status, queued_ms, elapsed_ms, article}]，
+        results 顺序与输入一致；batch_status 为 ok（有正文）| failed | error | timeout | skipped
+    """
+    start = time.perf_counter()
+    unique_urls: dict[str, str] = {}  # {规范化 URL: 首个原始 URL}
+    for url in urls:
+        if url and url.strip():
+            unique_urls.setdefault(canonicalize_url(url), url.strip())
+    batch_urls = list(unique_urls.values())
+    dropped = batch_urls[_settings.batch_max_urls:]
+    batch_urls = batch_urls[: _settings.batch_max_urls]
+
+    concurrency = min(max_concurrency or _settings.batch_max_concurrency, _settings.batch_max_concurrency_limit)
+    logger.info(
+        f"📚 [批量获取文章] {len(batch_urls)} 篇（去重前 {len(urls)} 篇），"
+        f"并发 {concurrency}，每域名 {_settings.batch_per_domain_concurrency}"
+    )
+
+    async def fetch_one(url: str) -> dict:
+        # 截止时间到达时调度器取消本任务：没有其他调用者在等待同一篇文章时，
+        # SingleFlight 会取消实际抓取并等待其退出（释放页面），调度器在返回前等待这一过程
+        return await fetch_article_content(url, include_images, block_mode, mode)
+
+    progress = ProgressReporter(on_progress, total=len(batch_urls))
+
+    async def report(item: BatchItem) -> None:
+        if item.status == "ok":
+            await progress.step(_article_progress(item.url, item.result, elapsed_ms=round(item.elapsed_ms, 1)))
+        else:
+            await progress.step({"url": item.url, "stage": item.status, "error": item.error})
+
+    scheduler = DomainScheduler(concurrency, _settings.batch_per_domain_concurrency)
+    items = await scheduler.run(batch_urls, fetch_one, deadline if deadline is not None else _settings.batch_deadline, on_done=report)
+
+    results = []
+    for item in items.values():
+        status = item.status
+        if status == "ok" and not (item.result or {}).get("content"):
+            status = "failed"
+        entry = {
+            "url": item.url,
+            "batch_status": status,
+            "queued_ms": round(item.queued_ms, 1),
+            "elapsed_ms": round(item.elapsed_ms, 1),
+            "article": item.result,
+        }
+        if item.error:
+            entry["error"] = item.error
+        results.append(entry)
+    for url in dropped:
+        results.append({"url": url, "batch_status": "skipped", "error": f"超过单批最多 {_settings.batch_max_urls} 个URL"})
+
+    succeeded = sum(1 for entry in results if entry["batch_status"] == "ok")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"   📚 批量获取完成: 成功 {succeeded}/{len(results)}，耗时 {elapsed_ms:.0f}ms")
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_ms": round(elapsed_ms, 1),
+        "results": results,
+    }
+
+
+async def _fetch_article_content(
+    url: str,
+    canonical_url: str,
+    include_images: bool,
+    block_mode: Optional[str],
+    mode: str,
+    bypass_cache: bool,
+    on_progress: Optional[ProgressCallback] = None,
+) -> ArticleResult:
+    """获取文章正文：缓存 → news_storage → HTTP 层 → 浏览器层"""
+    progress = ProgressReporter(on_progress)
+    http_page = None  # 重新验证时取得的新响应（内容已变化），HTTP 层直接复用
+    entry = None
+    if bypass_cache:
+        _article_cache.record("bypassed")
+    else:
+        entry = await _article_cache.get(canonical_url)
+
+    if entry is not None and entry.satisfies(include_images):
+        if _article_cache.is_fresh(entry):
+            _article_cache.record("fresh_hits")
+            return _cached_article_response(entry, include_images, "fresh")
+        await _rate_limiter.acquire(domain=urlparse(url).netloc)
+        if entry.has_validators:
+            # 过了新鲜期：条件请求重新验证，未修改时续期并返回缓存
+            not_modified, http_page = await _revalidate_article(url, entry)
+            if not_modified:
+                _article_cache.record("revalidated")
+                await _article_cache.touch(entry)
+                return _cached_article_response(entry, include_images, "revalidated")
+            _article_cache.record("changed")
+        else:
+            _article_cache.record("misses")
+    else:
+        if not bypass_cache:
+            stored = await _read_article_from_storage(url, canonical_url, include_images)
+            if stored is not None:
+                return stored
+            _article_cache.record("misses")
+        await _rate_limiter.acquire(domain=urlparse(url).netloc)
+
+    escalation_reason = None
+    if mode in ("auto", "http"):
+        result, escalation_reason = await _fetch_article_http(
+            url, include_images, force=(mode == "http"), http_page=http_page
+        )
+        if result is not None:
+            await progress.step(_article_progress(url, result))
+            return await _finish_article(canonical_url, include_images, result)
+        logger.info(f"   ⬆️ 升级到浏览器抓取: {escalation_reason}")
+        await progress.step({"url": url, "stage": "browser", "escalation_reason": escalation_reason})
+
+    result = await _fetch_article_browser(url, include_images, block_mode)
+    if escalation_reason:
+        result["escalation_reason"] = escalation_reason
+    await progress.step(_article_progress(url, result))
+    return await _finish_article(canonical_url, include_images, result)
+
+
+def _article_progress(url: str, article: dict, **extra) -> dict:
+    """文章完成时的进度消息（正文只保留开头）"""
+    content = article.get("content") or ""
+    return {
+        "url": url,
+        "stage": "done",
+        **extra,
+        "fetch_tier": article.get("fetch_tier"),
+        "title": article.get("title", ""),
+        "content_length": len(content),
+        "content_preview": content[:_PROGRESS_PREVIEW_CHARS],
+    }
+
+
+async def _finish_article(canonical_url: str, include_images: bool, result: dict) -> ArticleResult:
+    """写入文章缓存（只缓存成功提取到正文的结果）"""
+    validators = result.pop("validators", None) or {}
+    if result.get("content") and result.get("status", {}).get("status") != "error":
+        await _article_cache.put(
+            canonical_url,
+            result,
+            include_images,
+            etag=validators.get("etag"),
+            last_modified=validators.get("last_modified"),
+        )
+    return result
+
+
+def _cached_article_response(entry: ArticleEntry, include_images: bool, cache_status: str) -> ArticleResult:
+    """返回缓存的文章结果（附带缓存状态）"""
+    result = {
+        **entry.result,
+        "cached": True,
+        "cache_status": cache_status,
+        "cache_age": round(time.time() - entry.created_at, 1),
+    }
+    if not include_images:
+        result["images"] = []
+        result["image_count"] = 0
+    logger.info(f"💾 [文章缓存: {cache_status}] {entry.url}")
+    return result
+
 
+async def _revalidate_article(url: str, entry: ArticleEntry) -> tuple[bool, Optional[HttpPage]]:
+    """用条件请求重新验证过期的缓存条目
+
+    Returns:
+        (是否未修改, 新的响应)；内容已变化时返回新响应供 HTTP 层直接使用，请求失败时返回 (False, None)
+    """
+    headers = {"User-Agent": get_random_user_agent(), **entry.conditional_headers()}
     try:
-        user_agent = get_random_user_agent()
-        async with _browser_pool.get_page(user_agent=user_agent) as page:
+        http_page = await _http_client.fetch(url, headers=headers)
+    except Exception as e:
+        logger.debug(f"   条件请求失败: {e}")
+        return False, None
+    if http_page.status_code == 304:
+        return True, None
+    return False, http_page if http_page.status_code < 400 else None
+
+
+async def _read_article_from_storage(url: str, canonical_url: str, include_images: bool) -> Optional[ArticleResult]:
+    """缓存未命中时读取 news_storage 中已保存的文章正文"""
+    stored = await _article_cache.read_through(url, canonical_url)
+    if stored is None:
+        return None
+    _article_cache.record("storage_hits")
+
+    title, content = stored["title"], stored["content"]
+    images = [
+        {"index": i + 1, "url": image_url, "alt": "", "width": 0, "height": 0}
+        for i, image_url in enumerate(stored["image_urls"])
+    ]
+    status = {"status": "ok", "reason": "页面状态正常", "checks": ["已从 news_storage 读取"], "anti_bot_detected": False}
+    status.update(_assess_content_quality(content, title, len(content)))
+    metadata = {key: stored[key] for key in ("author", "publish_time") if stored[key]}
+    result = _build_article_result(url, title, content, images, status, "news_storage", metadata)
+
+    entry = await _article_cache.put(canonical_url, result, include_images=True, source="news_storage")
+    logger.info(f"💾 [文章缓存] 从 news_storage 读取: {url}")
+    return _cached_article_response(entry, include_images, "news_storage")
+
+
+async def _fetch_article_http(
+    url: str,
+    include_images: bool,
+    force: bool = False,
+    http_page: Optional[HttpPage] = None,
+) -> tuple[Optional[dict], str]:
+    """HTTP 层：直接抓取 HTML 并提取正文，不启动浏览器页面
+
+    Args:
+        url: 文章URL
+        include_images: 是否提取图片链接
+        force: 为 True 时（mode=http）无论结果如何都返回，不升级
+        http_page: 已取得的响应（缓存重新验证时内容已变化），为 None 时重新抓取
+
+    Returns:
+        (结果字典, 升级原因)；需要升级到浏览器时结果为 None
+    """
+    try:
+        if http_page is None:
+            http_page = await _http_client.fetch(url, headers={"User-Agent": get_random_user_agent()})
+        root = parse_document(http_page.text) if http_page.text.strip() else None
+    except Exception as e:
+        logger.warning(f"   ⚠️ HTTP 抓取失败: {e}")
+        if not force:
+            return None, f"HTTP 请求失败: {type(e).__name__}"
+        return _article_error_result(url, e, "http"), ""
+
+    status = _check_http_page_status(http_page, root)
+    if status.get("status") == "error":
+        # 404/410 在浏览器中同样不存在，直接返回；其他错误（拦截、需要渲染等）升级
+        if force or http_page.status_code in (404, 410):
+            logger.warning(f"   ⚠️ 页面异常: {status.get('reason')}")
+            return {
+                "url": url,
+                "status": status,
+                "title": "",
+                "content": "",
+                "images": [],
+                "suggestions": status.get("suggestions", []),
+                "fetch_tier": "http",
+            }, ""
+        return None, status.get("reason", "页面异常")
+
+    # 一次解析完成标题、元数据、图片和正文提取
+    extraction = await _run_extraction(http_page.text, http_page.final_url, include_images)
+    title = extraction.title
+    content = _clean_content(extraction.content) if extraction.content else ""
+
+    # HTTP 层始终评估内容质量，低于阈值则升级到浏览器
+    content_quality = _assess_content_quality(content, title, len(content))
+    status.update(content_quality)
+    if not force and (
+        _QUALITY_RANK.get(content_quality["quality"], 0)
+        < _QUALITY_RANK[_settings.article_http_min_quality]
+    ):
+        return None, f"HTTP 提取内容质量不足: {content_quality['quality']}"
+
+    images = extraction.images
+    if include_images:
+        logger.info(f"   🖼️ 提取到 {len(images)} 个图片链接")
+
+    logger.info(f"✅ 文章内容获取完成（HTTP），长度: {len(content)} 字符")
+    result = _build_article_result(url, title, content, images, status, "http", extraction.metadata)
+    result["validators"] = {"etag": http_page.etag, "last_modified": http_page.last_modified}
+    return result, ""
+
+
+async def _fetch_article_browser(url: str, include_images: bool, block_mode: Optional[str]) -> dict:
+    """浏览器层：渲染页面后提取正文"""
+    try:
+        # 文章页广告、统计、评论挂件等第三方请求会显著拖慢 load 事件，按模式过滤
+        block_policy = BlockPolicy.for_url(url, block_mode or _settings.article_block_mode)
+        async with _browser_pool.get_page(block_policy=block_policy) as page:
             response = await page.goto(url, timeout=30000)
 
-            # 始终检查页面状态
-            status = await _check_page_status(page, response, url)
+            # 一次页面检查获取状态、标题候选、页面 HTML 和图片属性，并据此检查页面状态
+            try:
+                snapshot = await inspect_page(page, ARTICLE_INSPECTION)
+                status = _check_page_status(snapshot, response)
+            except Exception as e:
+                logger.error(f"检查页面状态失败: {e}")
+                status = {
+                    "status": "error",
+                    "checks": [],
+                    "anti_bot_detected": False,
+                    "reason": f"状态检查失败: {str(e)}",
+                    "suggestions": ["无法验证页面状态", "尝试直接访问URL"],
+                }
 
             # 如果页面状态异常，直接返回状态信息
             if status.get("status") == "error":
                 logger.warning(f"   ⚠️ 页面异常: {status.get('reason')}")
-                return json.dumps(
-                    {
-                        "url": url,
-                        "status": status,
-                        "title": "",
-                        "content": "",
-                        "images": [],
-                        "suggestions": status.get("suggestions", []),
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                )
+                return {
+                    "url": url,
+                    "status": status,
+                    "title": "",
+                    "content": "",
+                    "images": [],
+                    "suggestions": status.get("suggestions", []),
+                    "fetch_tier": "browser",
+                }
 
             logger.info(f"   ✓ 页面状态: {status.get('status', 'unknown')}")
 
-            # 提取标题
-            title = await _extract_title(page)
+            # 提取标题（页面检查时已在浏览器内按选择器采集）
+            title = _extract_title(snapshot)
 
-            # 提取正文
-            content = await _extract_content(page)
+            # 一次解析完成元数据、图片和正文提取，正文失败时使用 JavaScript 备用方案
+            extraction = await _run_extraction(snapshot.html, url, include_images, with_title=False)
+            content = extraction.content
+            if not content:
+                logger.warning("   ⚠️ trafilatura 未提取到足够内容，使用备用方案")
+                content = await _extract_content_fallback(page)
 
             # 清理内容
             if content:
@@ -463,108 +1279,179 @@ async def fetch_article_content(url: str, include_images: bool = True) -> str:
             # 提取图片链接
             images = []
             if include_images:
-                images = await _extract_images(page, url)
+                images = extraction.images or _extract_images_fallback(snapshot, url)
                 logger.info(f"   🖼️ 提取到 {len(images)} 个图片链接")
 
             logger.info(f"✅ 文章内容获取完成，长度: {len(content)} 字符")
+            result = _build_article_result(url, title, content, images, status, "browser", extraction.metadata)
+            if response:
+                result["validators"] = {
+                    "etag": response.headers.get("etag"),
+                    "last_modified": response.headers.get("last-modified"),
+                }
+            return result
 
-            # 构建结果，始终包含状态信息
-            result = {
-                "url": url,
-                "title": title,
-                "content": content,
-                "content_length": len(content),
-                "images": images,
-                "image_count": len(images),
-                "status": status,
-            }
+    except Exception as e:
+        logger.error(f"❌ 获取文章内容失败: {e}")
+        return _article_error_result(url, e, "browser")
+
+
+def _build_article_result(
+    url: str,
+    title: str,
+    content: str,
+    images: list[dict],
+    status: dict,
+    fetch_tier: str,
+    metadata: Optional[dict] = None,
+) -> dict:
+    """构建文章结果，始终包含状态信息和抓取层级"""
+    result = {
+        "url": url,
+        "title": title,
+        "content": content,
+        "content_length": len(content),
+        "images": images,
+        "image_count": len(images),
+        "status": status,
+        "fetch_tier": fetch_tier,
+    }
+    if metadata:
+        result["metadata"] = metadata
 
-            # 根据状态给出建议
-            if status.get("status") in ["warning", "poor"]:
-                result["suggestions"] = _get_suggestions(status)
-            elif status.get("status") == "ok":
-                result["suggestions"] = ["✅ 页面状态正常"]
+    # 根据状态给出建议
+    if status.get("status") in ["warning", "poor"]:
+        result["suggestions"] = _get_suggestions(status)
+    elif status.get("status") == "ok":
+        result["suggestions"] = ["✅ 页面状态正常"]
 
-            return json.dumps(result, ensure_ascii=False, indent=2)
+    return result
 
-    except Exception as e:
-        logger.error(f"❌ 获取文章内容失败: {e}")
-        error_status = {
+
+def _article_error_result(url: str, error: Exception, fetch_tier: str) -> dict:
+    """构建请求失败时的文章结果"""
+    return {
+        "url": url,
+        "status": {
             "status": "error",
-            "reason": f"请求失败: {str(e)}",
-            "error_type": type(e).__name__,
-        }
-        return json.dumps(
-            {
-                "url": url,
-                "status": error_status,
-                "title": "",
-                "content": "",
-                "images": [],
-                "suggestions": ["检查URL是否正确", "尝试使用其他搜索引擎"],
-            },
-            ensure_ascii=False,
-            indent=2,
-        )
+            "reason": f"请求失败: {str(error)}",
+            "error_type": type(error).__name__,
+        },
+        "title": "",
+        "content": "",
+        "images": [],
+        "suggestions": ["检查URL是否正确", "尝试使用其他搜索引擎"],
+        "fetch_tier": fetch_tier,
+    }
 
 
-async def _extract_title(page) -> str:
-    """提取文章标题"""
-    title_selectors = [
-        "h1",
-        ".article-title",
-        ".news-title",
-        ".title",
-        "[class*='title']",
-        "#title",
-    ]
+def _check_http_page_status(http_page, root) -> dict:
+    """检查 HTTP 抓取的页面状态（规则与 _check_page_status 一致，另外检测是否需要 JavaScript 渲染）
 
-    for selector in title_selectors:
-        try:
-            title_elem = await page.query_selector(selector)
-            if title_elem:
-                title_text = await title_elem.text_content()
-                if title_text and len(title_text.strip()) > 5:
-                    logger.info(f"   📰 标题: {title_text[:50]}...")
-                    return title_text.strip()
-        except Exception:
-            continue
+    Args:
+        http_page: HTTP 抓取结果
+        root: lxml 文档根元素（响应体为空时为 None）
 
-    return ""
+    Returns:
+        状态信息字典
+    """
+    status_info = {
+        "status": "unknown",
+        "checks": [],
+        "anti_bot_detected": False,
+        "http_status": http_page.status_code,
+    }
 
+    if http_page.status_code >= 400:
+        status_info["status"] = "error"
+        status_info["reason"] = f"HTTP错误: {http_page.status_code}"
+        status_info["checks"].append(f"HTTP状态码异常: {http_page.status_code}")
+        if http_page.status_code in (404, 410):
+            status_info["suggestions"] = ["页面不存在", "检查URL是否正确", "尝试搜索相关内容"]
+        return status_info
+    status_info["checks"].append(f"HTTP状态码正常: {http_page.status_code}")
 
-async def _extract_content(page) -> str:
-    """提取文章正文（使用 trafilatura 成熟算法）"""
-    try:
-        # 获取页面HTML
-        html = await page.content()
-
-        # 使用 trafilatura 提取内容
-        import trafilatura
-
-        # 提取主要内容
-        content = trafilatura.extract(
-            html,
-            include_comments=False,
-            include_tables=True,
-            no_fallback=False,
-            favor_precision=False,
-            favor_recall=True,
-        )
+    content_type = http_page.content_type.lower()
+    if root is None or (content_type and "html" not in content_type):
+        status_info["status"] = "error"
+        status_info["reason"] = f"非 HTML 响应: {content_type or '空响应'}"
+        return status_info
 
-        if content and len(content.strip()) > 100:
-            logger.info(f"   ✅ trafilatura 提取成功，长度: {len(content)} 字符")
-            return content.strip()
-        else:
-            logger.warning("   ⚠️ trafilatura 提取内容过少，使用备用方案")
-            return await _extract_content_fallback(page)
+    title = page_title(root)
+    status_info["page_title"] = title
 
-    except ImportError:
-        logger.warning("   ⚠️ trafilatura 未安装，使用备用方案")
-        return await _extract_content_fallback(page)
-    except Exception as e:
-        logger.warning(f"   ⚠️ trafilatura 提取失败: {e}，使用备用方案")
-        return await _extract_content_fallback(page)
+    is_blocked, block_reason = _check_anti_bot_html(http_page.status_code, http_page.final_url, root)
+    if is_blocked:
+        status_info["status"] = "error"
+        status_info["reason"] = f"被反爬虫拦截: {block_reason}"
+        status_info["anti_bot_detected"] = True
+        status_info["checks"].append(block_reason)
+        return status_info
+
+    if any(keyword in title for keyword in ERROR_TITLE_KEYWORDS):
+        status_info["status"] = "error"
+        status_info["reason"] = "页面不存在或无法访问"
+        status_info["checks"].append("标题包含错误信息")
+        status_info["suggestions"] = ["页面不存在", "检查URL是否正确", "尝试搜索其他来源"]
+        return status_info
+
+    if _looks_js_only(root):
+        status_info["status"] = "error"
+        status_info["reason"] = "页面需要 JavaScript 渲染"
+        status_info["checks"].append("静态 HTML 中几乎没有可见文本")
+        return status_info
+
+    status_info["status"] = "ok"
+    status_info["reason"] = "页面状态正常"
+    status_info["checks"].append("页面加载正常")
+    return status_info
+
+
+def _looks_js_only(root) -> bool:
+    """判断静态 HTML 是否依赖 JavaScript 渲染正文（SPA 外壳、noscript 提示等）"""
+    body_text = element_text(first(root.xpath("//body")))
+    noscript_text = " ".join(node.text_content() for node in root.xpath("//noscript")).lower()
+    if any(phrase in noscript_text for phrase in _JS_REQUIRED_PHRASES) and len(body_text) < 500:
+        return True
+    return len(body_text) < 200 and bool(root.xpath("//script"))
+
+
+def _extract_title(snapshot: PageSnapshot) -> str:
+    """从页面检查结果的标题候选中提取文章标题（按 TITLE_SELECTORS 优先级）"""
+    for title_text in snapshot.title_candidates:
+        if title_text and len(title_text) > 5:
+            logger.info(f"   📰 标题: {title_text[:50]}...")
+            return title_text
+
+    return ""
+
+
+async def _run_extraction(
+    html: str, base_url: str, include_images: bool, with_title: bool = True
+) -> ExtractionResult:
+    """在进程池中执行提取流水线（每个页面只解析一次），并记录各阶段耗时
+
+    Args:
+        html: 页面 HTML
+        base_url: 页面URL（用于处理相对路径）
+        include_images: 是否执行图片提取阶段
+        with_title: 是否执行标题提取阶段（浏览器层已在页面检查中采集标题）
+    """
+    if not html:
+        return ExtractionResult()
+    stages = tuple(
+        name for name in DEFAULT_STAGES
+        if (include_images or name != "images") and (with_title or name != "title")
+    )
+    extraction = await _extraction_pool.run(extract_article, html, base_url, stages, default=None)
+    if extraction is None:
+        return ExtractionResult()
+    _extraction_pool.record_stages(extraction.timings_ms)
+    logger.debug(
+        "   ⏱️ 提取阶段耗时: "
+        + ", ".join(f"{name} {elapsed:.0f}ms" for name, elapsed in extraction.timings_ms.items())
+    )
+    return extraction
 
 
 async def _extract_content_fallback(page) -> str:
@@ -645,181 +1532,43 @@ def _clean_content(content: str) -> str:
     return content
 
 
-async def _extract_images(page, base_url: str) -> list[dict]:
-    """提取文章中的图片链接（使用专业工具）
-
-    优先级:
-    1. newspaper3k - 专门的新闻文章提取库
-    2. trafilatura - 成熟的内容提取库
-    3. JavaScript 备用方案
-
-    Args:
-        page: Playwright页面对象
-        base_url: 基础URL（用于处理相对路径）
-
-    Returns:
-        图片信息列表，每个图片包含 url, alt, width, height
-    """
-    html = await page.content()
-
-    # 方法1: 尝试使用 newspaper3k
-    try:
-        from newspaper import Article, Config
-
-        # 配置 newspaper3k
-        config = Config()
-        config.browser_user_agent = "Mozilla/5.0"
-        config.fetch_images = False  # 不下载图片，只提取URL
-        config.request_timeout = 10
-
-        article = Article(url=base_url, config=config)
-        article.set_html(html)
-        article.parse()
-
-        # newspaper3k 提取的图片列表
-        if article.images and len(article.images) > 0:
-            # 过滤掉 base64 图片、小图标等无关图片
-            valid_images = []
-            for url in article.images:
-                # 跳过 base64 编码的图片
-                if url.startswith("data:image"):
-                    continue
-                # 跳过明显的小图标
-                if any(keyword in url.lower() for keyword in ["icon", "logo", "pixel", "tracking", "avatar"]):
-                    continue
-                # 跳过太短的URL
-                if len(url) < 20:
-                    continue
-                valid_images.append(url)
-
-            if valid_images:
-                logger.info(f"   ✅ newspaper3k 提取到 {len(valid_images)} 个有效图片 (原始{len(article.images)}个)")
-                return [
-                    {"index": i + 1, "url": url, "alt": "", "width": 0, "height": 0}
-                    for i, url in enumerate(valid_images)
-                ]
-            else:
-                logger.info("   ⚠️ newspaper3k 提取的图片都被过滤掉了")
-
-        elif article.top_img:
-            # 检查主图是否有效
-            top_img = article.top_img
-            if (
-                not top_img.startswith("data:image")
-                and len(top_img) >= 20
-                and not any(keyword in top_img.lower() for keyword in ["icon", "logo", "pixel"])
-            ):
-                logger.info(f"   ✅ newspaper3k 提取到主图: {top_img}")
-                return [{"index": 1, "url": top_img, "alt": "", "width": 0, "height": 0}]
-
-        logger.info("   ⚠️ newspaper3k 未找到有效图片，尝试下一个方法")
-
-    except ImportError:
-        logger.info("   ⚠️ newspaper3k 未安装，尝试下一个方法")
-    except Exception as e:
-        logger.info(f"   ⚠️ newspaper3k 提取失败: {e}，尝试下一个方法")
-
-    # 方法2: 使用 trafilatura
-    try:
-        import trafilatura
-
-        # 使用 JSON 格式提取，包含图片信息
-        result = trafilatura.extract(
-            html,
-            url=base_url,
-            output_format="json",
-            include_images=True,
-            include_comments=False,
-            with_metadata=False,
-        )
-
-        if result:
-            import json
-
-            data = json.loads(result)
-            if "image" in data and data["image"]:
-                # 处理单个主图
-                image_url = data["image"]
-                logger.info(f"   ✅ trafilatura 提取到主图: {image_url}")
-                return [{"index": 1, "url": image_url, "alt": "", "width": 0, "height": 0}]
-
-        logger.info("   ⚠️ trafilatura 未找到图片，使用备用方案")
-
-    except Exception as e:
-        logger.info(f"   ⚠️ trafilatura 图片提取失败: {e}，使用备用方案")
-
-    # 方法3: 使用 JavaScript 备用方案
-    return await _extract_images_fallback(page, base_url)
-
-
-async def _extract_images_fallback(page, base_url: str) -> list[dict]:
-    """备用方案：使用 JavaScript 提取图片"""
-    try:
-        images = await page.evaluate(
-            """(baseUrl) => {
-            const images = [];
-            const imgElements = document.querySelectorAll('article img, .content img, .article-content img, main img, .news-content img, [class*="content"] img');
-
-            imgElements.forEach((img, idx) => {
-                const src = img.src || img.getAttribute('data-src');
-                if (src && src.length > 10) {  // 过滤掉过短的URL
-                    // 处理相对路径
-                    let fullUrl = src;
-                    if (src.startsWith('//')) {
-                        fullUrl = 'https:' + src;
-                    } else if (src.startsWith('/')) {
-                        try {
-                            const urlObj = new URL(baseUrl);
-                            fullUrl = urlObj.origin + src;
-                        } catch (e) {
-                            fullUrl = src;
-                        }
-                    } else if (!src.startsWith('http')) {
-                        try {
-                            fullUrl = new URL(src, baseUrl).href;
-                        } catch (e) {
-                            fullUrl = src;
-                        }
-                    }
-
-                    // 过滤掉跟踪像素和小图标
-                    if (fullUrl.includes('.') &&
-                        !fullUrl.includes('pixel') &&
-                        !fullUrl.includes('tracking') &&
-                        !fullUrl.includes('icon') &&
-                        img.width > 50 && img.height > 50) {
-                        images.push({
-                            index: idx + 1,
-                            url: fullUrl,
-                            alt: img.alt || '',
-                            title: img.title || '',
-                            width: img.naturalWidth || img.width || 0,
-                            height: img.naturalHeight || img.height || 0
-                        });
-                    }
-                }
-            });
-
-            return images;
-        }""",
-            base_url,
-        )
+def _extract_images_fallback(snapshot: PageSnapshot, base_url: str) -> list[dict]:
+    """备用方案：按渲染尺寸过滤页面检查采集的正文区域图片"""
+    images = []
+    for idx, img in enumerate(snapshot.images):
+        src = img.get("src", "")
+        if len(src) <= 10:  # 过滤掉过短的URL
+            continue
+        full_url = urljoin(base_url, src)
+
+        # 过滤掉跟踪像素和小图标
+        if (
+            "." not in full_url
+            or any(keyword in full_url for keyword in ("pixel", "tracking", "icon"))
+            or img.get("width", 0) <= 50
+            or img.get("height", 0) <= 50
+        ):
+            continue
 
-        logger.info(f"   🖼️ 备用方案找到 {len(images)} 个图片")
-        return images
+        images.append({
+            "index": idx + 1,
+            "url": full_url,
+            "alt": img.get("alt", ""),
+            "title": img.get("title", ""),
+            "width": img.get("naturalWidth") or img.get("width", 0),
+            "height": img.get("naturalHeight") or img.get("height", 0),
+        })
 
-    except Exception as e:
-        logger.warning(f"   ⚠️ 提取图片失败: {e}")
-        return []
+    logger.info(f"   🖼️ 备用方案找到 {len(images)} 个图片")
+    return images
 
 
-async def _check_page_status(page, response, url: str) -> dict:
+def _check_page_status(snapshot: PageSnapshot, response) -> dict:
     """检查页面状态（加强反爬虫检测）
 
     Args:
-        page: Playwright页面对象
-        response: 响应对象
-        url: 页面URL
+        snapshot: 页面检查结果
+        response: 导航响应对象（可能为 None）
 
     Returns:
         状态信息字典
@@ -830,318 +1579,157 @@ async def _check_page_status(page, response, url: str) -> dict:
         "anti_bot_detected": False,  # 反爬虫检测标记
     }
 
-    try:
-        # 1. 检查HTTP状态码
-        if response:
-            status_code = response.status
-            status_info["http_status"] = status_code
-
-            if status_code >= 400:
-                status_info["status"] = "error"
-                status_info["reason"] = f"HTTP错误: {status_code}"
-                status_info["checks"].append(f"HTTP状态码异常: {status_code}")
-
-                if status_code == 404:
-                    status_info["suggestions"] = ["页面不存在", "检查URL是否正确", "尝试搜索相关内容"]
-                elif status_code == 403:
-                    status_info["suggestions"] = ["访问被拒绝", "可能需要登录", "尝试使用其他网站"]
-                elif status_code >= 500:
-                    status_info["suggestions"] = ["服务器错误", "稍后重试", "尝试使用镜像网站"]
-
-                return status_info
-
-            status_info["checks"].append(f"HTTP状态码正常: {status_code}")
-
-        # 2. 检查页面标题（加强反爬虫检测）
-        page_title = await page.title()
-        status_info["page_title"] = page_title
-
-        # 反爬虫关键词列表（扩展）
-        anti_bot_keywords = [
-            "验证",
-            "安全",
-            "captcha",
-            "人机验证",
-            "机器人",
-            "robot",
-            "bot",
-            "验证码",
-            "滑动验证",
-            "点选验证",
-            "短信验证",
-            "阿里云",
-            "云盾",
-            "腾讯云",
-            "天御",
-            "访问频繁",
-            "请求过于频繁",
-            "操作过于频繁",
-            "系统检测",
-            "异常访问",
-            "风险检测",
-            "安全检测",
-            "cc攻击",
-            "防刷",
-            "反爬",
-        ]
+    # 1. 检查HTTP状态码（没有响应对象时使用 Navigation Timing 中的状态码）
+    status_code = response.status if response else snapshot.status
+    if status_code:
+        status_info["http_status"] = status_code
 
-        page_title_lower = page_title.lower()
-        for keyword in anti_bot_keywords:
-            if keyword.lower() in page_title_lower or keyword in page_title:
-                status_info["status"] = "error"
-                status_info["reason"] = f"被反爬虫拦截: 检测到关键词 '{keyword}'"
-                status_info["anti_bot_detected"] = True
-                status_info["anti_bot_type"] = "title_keyword"
-                status_info["checks"].append(f"标题包含反爬虫关键词: {keyword}")
-                status_info["suggestions"] = [
-                    "❌ 被反爬虫验证拦截",
-                    "🚫 检测到反爬虫关键词，建议暂停使用",
-                    "⏰ 等待较长时间后重试（建议30分钟以上）",
-                    "🔄 考虑更换IP或使用代理",
-                    "🔍 尝试使用其他搜索引擎",
-                    "📱 尝试使用移动端网站",
-                ]
-                logger.warning(f"🚨 检测到反爬虫拦截（标题）: {keyword}")
-                return status_info
-
-        # 检查是否是错误页面
-        error_keywords = ["404", "不存在", "无法访问", "not found", "页面不存在", "访问失败"]
-        if any(keyword in page_title for keyword in error_keywords):
+        if status_code >= 400:
             status_info["status"] = "error"
-            status_info["reason"] = "页面不存在或无法访问"
-            status_info["checks"].append("标题包含错误信息")
-            status_info["suggestions"] = [
-                "页面不存在",
-                "检查URL是否正确",
-                "尝试搜索其他来源",
-            ]
-            return status_info
+            status_info["reason"] = f"HTTP错误: {status_code}"
+            status_info["checks"].append(f"HTTP状态码异常: {status_code}")
 
-        status_info["checks"].append("页面标题正常")
-
-        # 3. 使用JavaScript检查页面内容（加强反爬虫检测）
-        page_check = await page.evaluate(
-            """() => {
-            const checks = {
-                hasBody: !!document.body,
-                bodyText: document.body ? document.body.innerText.substring(0, 500) : '',
-                hasArticle: !!document.querySelector('article'),
-                hasContent: !!document.querySelector('.content, .article-content, main, [class*="content"]'),
-                errorCode: null,
-                needsLogin: false,
-                isEmpty: false,
-                // 反爬虫检测
-                hasCaptcha: false,
-                captchaElements: [],
-                antiBotElements: [],
-                accessDenied: false,
-                ipBlocked: false,
-            };
-
-            // 检查验证码相关元素
-            const captchaSelectors = [
-                '#captcha',
-                '.captcha',
-                '[class*="captcha"]',
-                '[id*="captcha"]',
-                '.geetest',
-                '#geetest',
-                '[class*="geetest"]',
-                '.recaptcha',
-                '[class*="recaptcha"]',
-                '.verify',
-                '[class*="verify"]',
-                '.validate',
-                '[class*="validate"]',
-                'iframe[src*="captcha"]',
-                'iframe[src*="verify"]',
-            ];
-
-            captchaSelectors.forEach(selector => {
-                const elements = document.querySelectorAll(selector);
-                if (elements.length > 0) {
-                    checks.hasCaptcha = true;
-                    checks.captchaElements.push(selector);
-                }
-            });
-
-            // 检查反爬虫提示文本
-            const bodyText = document.body.innerText.toLowerCase();
-            const antiBotPhrases = [
-                '访问过于频繁',
-                '请求过于频繁',
-                '操作过于频繁',
-                '您的访问过于频繁',
-                '请稍后再试',
-                '系统检测到异常访问',
-                '疑似机器人',
-                '人机验证',
-                '安全验证',
-                '请完成验证',
-                '滑动验证',
-                '点选验证',
-                '阿里云盾',
-                '腾讯云天御',
-                '风险控制',
-                '安全检测',
-                'cc防御',
-                'waf防火墙',
-                '访问被拒绝',
-                'ip被封',
-                '禁止访问',
-                'access denied',
-                'forbidden',
-                'blocked',
-                'rate limit',
-                'too many requests',
-            ];
-
-            antiBotPhrases.forEach(phrase => {
-                if (bodyText.includes(phrase)) {
-                    checks.antiBotElements.push(phrase);
-                }
-            });
-
-            // 检查是否IP被封禁
-            const ipBlockedPhrases = [
-                'ip被封',
-                'ip已被封',
-                'ip禁止',
-                'ip限制',
-                '封禁ip',
-                '禁止ip',
-                'blocked ip',
-                'ip blocked',
-            ];
-
-            checks.ipBlocked = ipBlockedPhrases.some(phrase => bodyText.includes(phrase));
-
-            // 检查是否需要登录
-            const loginKeywords = ['登录', 'login', 'signin', '请先登录', '需要登录'];
-            checks.needsLogin = loginKeywords.some(keyword =>
-                document.body.innerText.includes(keyword)
-            );
-
-            // 检查页面是否为空
-            const textLength = document.body.innerText.trim().length;
-            checks.isEmpty = textLength < 100;
-            checks.textLength = textLength;
-
-            return checks;
-        }"""
-        )
+            if status_code == 404:
+                status_info["suggestions"] = ["页面不存在", "检查URL是否正确", "尝试搜索相关内容"]
+            elif status_code == 403:
+                status_info["suggestions"] = ["访问被拒绝", "可能需要登录", "尝试使用其他网站"]
+            elif status_code >= 500:
+                status_info["suggestions"] = ["服务器错误", "稍后重试", "尝试使用镜像网站"]
 
-        status_info["page_checks"] = {
-            "has_body": page_check["hasBody"],
-            "has_article": page_check["hasArticle"],
-            "has_content": page_check["hasContent"],
-            "text_length": page_check.get("textLength", 0),
-        }
-
-        # 检查验证码元素（重要！）
-        if page_check.get("hasCaptcha") or page_check.get("captchaElements"):
-            status_info["status"] = "error"
-            status_info["reason"] = "被反爬虫拦截: 检测到验证码"
-            status_info["anti_bot_detected"] = True
-            status_info["anti_bot_type"] = "captcha_element"
-            status_info["checks"].append(f"检测到验证码元素: {page_check.get('captchaElements', [])}")
-            status_info["suggestions"] = [
-                "❌ 被反爬虫验证码拦截",
-                "🚫 需要人工验证，浏览器已无法使用",
-                "⏰ 建议等待较长时间后重试（30分钟以上）",
-                "🔄 必须更换IP或使用代理",
-                "🔍 尝试使用其他搜索引擎",
-                "📱 尝试使用移动端网站",
-            ]
-            logger.warning(f"🚨 检测到反爬虫拦截（验证码）: {page_check.get('captchaElements', [])}")
             return status_info
 
-        # 检查反爬虫提示文本
-        anti_bot_elements = page_check.get("antiBotElements", [])
-        if anti_bot_elements:
+        status_info["checks"].append(f"HTTP状态码正常: {status_code}")
+
+    # 2. 检查页面标题（加强反爬虫检测）
+    page_title = snapshot.title
+    status_info["page_title"] = page_title
+
+    page_title_lower = page_title.lower()
+    for keyword in ARTICLE_ANTI_BOT_TITLE_KEYWORDS:
+        if keyword.lower() in page_title_lower or keyword in page_title:
             status_info["status"] = "error"
-            status_info["reason"] = f"被反爬虫拦截: {anti_bot_elements[0]}"
+            status_info["reason"] = f"被反爬虫拦截: 检测到关键词 '{keyword}'"
             status_info["anti_bot_detected"] = True
-            status_info["anti_bot_type"] = "content_text"
-            status_info["checks"].append(f"内容包含反爬虫文本: {anti_bot_elements}")
+            status_info["anti_bot_type"] = "title_keyword"
+            status_info["checks"].append(f"标题包含反爬虫关键词: {keyword}")
             status_info["suggestions"] = [
-                "❌ 被反爬虫拦截",
-                "🚫 检测到反爬虫提示，建议暂停使用",
+                "❌ 被反爬虫验证拦截",
+                "🚫 检测到反爬虫关键词，建议暂停使用",
                 "⏰ 等待较长时间后重试（建议30分钟以上）",
                 "🔄 考虑更换IP或使用代理",
                 "🔍 尝试使用其他搜索引擎",
+                "📱 尝试使用移动端网站",
             ]
-            logger.warning(f"🚨 检测到反爬虫拦截（文本）: {anti_bot_elements}")
-            return status_info
-
-        # 检查IP是否被封
-        if page_check.get("ipBlocked"):
-            status_info["status"] = "error"
-            status_info["reason"] = "IP被封禁"
-            status_info["anti_bot_detected"] = True
-            status_info["anti_bot_type"] = "ip_blocked"
-            status_info["checks"].append("检测到IP封禁提示")
-            status_info["suggestions"] = [
-                "❌ IP已被封禁",
-                "🚫 必须更换IP才能继续",
-                "⏰ 建议等待较长时间后重试（1小时以上）",
-                "🔄 使用代理或更换网络",
-                "🔍 尝试使用其他搜索引擎",
-            ]
-            logger.warning("🚨 检测到IP封禁")
+            logger.warning(f"🚨 检测到反爬虫拦截（标题）: {keyword}")
             return status_info
 
-        # 检查错误代码
-        if page_check.get("errorCode"):
-            status_info["status"] = "error"
-            status_info["reason"] = f"页面返回错误: {page_check['errorCode']}"
-            status_info["checks"].append(f"内容包含错误代码: {page_check['errorCode']}")
-            status_info["suggestions"] = [
-                "页面无法访问",
-                "尝试使用其他网站",
-                "尝试搜索相关内容",
-            ]
-            return status_info
+    # 检查是否是错误页面
+    if any(keyword in page_title for keyword in ERROR_TITLE_KEYWORDS):
+        status_info["status"] = "error"
+        status_info["reason"] = "页面不存在或无法访问"
+        status_info["checks"].append("标题包含错误信息")
+        status_info["suggestions"] = [
+            "页面不存在",
+            "检查URL是否正确",
+            "尝试搜索其他来源",
+        ]
+        return status_info
 
-        # 检查是否需要登录
-        if page_check.get("needsLogin"):
-            status_info["status"] = "warning"
-            status_info["reason"] = "页面可能需要登录"
-            status_info["checks"].append("检测到登录提示")
-            status_info["suggestions"] = [
-                "页面需要登录才能访问",
-                "尝试搜索公开的内容",
-                "寻找其他来源",
-            ]
-            return status_info
+    status_info["checks"].append("页面标题正常")
 
-        # 检查页面是否为空
-        if page_check.get("isEmpty"):
-            status_info["status"] = "warning"
-            status_info["reason"] = "页面内容过少"
-            status_info["checks"].append(f"页面文本长度: {page_check.get('textLength', 0)}")
-            status_info["suggestions"] = [
-                "页面内容过少",
-                "可能是加载中或内容被限制",
-                "尝试等待或使用其他来源",
-            ]
-            return status_info
+    # 3. 检查页面内容（加强反爬虫检测）
+    status_info["page_checks"] = {
+        "has_body": snapshot.has_body,
+        "has_article": snapshot.has_article,
+        "has_content": snapshot.has_content,
+        "text_length": snapshot.text_length,
+    }
 
-        # 所有检查通过
-        status_info["status"] = "ok"
-        status_info["reason"] = "页面状态正常"
-        status_info["checks"].append("页面加载正常")
-        status_info["anti_bot_detected"] = False
+    # 检查验证码元素（重要！）
+    if snapshot.captcha_elements:
+        status_info["status"] = "error"
+        status_info["reason"] = "被反爬虫拦截: 检测到验证码"
+        status_info["anti_bot_detected"] = True
+        status_info["anti_bot_type"] = "captcha_element"
+        status_info["checks"].append(f"检测到验证码元素: {snapshot.captcha_elements}")
+        status_info["suggestions"] = [
+            "❌ 被反爬虫验证码拦截",
+            "🚫 需要人工验证，浏览器已无法使用",
+            "⏰ 建议等待较长时间后重试（30分钟以上）",
+            "🔄 必须更换IP或使用代理",
+            "🔍 尝试使用其他搜索引擎",
+            "📱 尝试使用移动端网站",
+        ]
+        logger.warning(f"🚨 检测到反爬虫拦截（验证码）: {snapshot.captcha_elements}")
+        return status_info
 
+    # 检查反爬虫提示文本
+    anti_bot_elements = snapshot.anti_bot_phrases
+    if anti_bot_elements:
+        status_info["status"] = "error"
+        status_info["reason"] = f"被反爬虫拦截: {anti_bot_elements[0]}"
+        status_info["anti_bot_detected"] = True
+        status_info["anti_bot_type"] = "content_text"
+        status_info["checks"].append(f"内容包含反爬虫文本: {anti_bot_elements}")
+        status_info["suggestions"] = [
+            "❌ 被反爬虫拦截",
+            "🚫 检测到反爬虫提示，建议暂停使用",
+            "⏰ 等待较长时间后重试（建议30分钟以上）",
+            "🔄 考虑更换IP或使用代理",
+            "🔍 尝试使用其他搜索引擎",
+        ]
+        logger.warning(f"🚨 检测到反爬虫拦截（文本）: {anti_bot_elements}")
         return status_info
 
-    except Exception as e:
-        logger.error(f"检查页面状态失败: {e}")
+    # 检查IP是否被封
+    if snapshot.ip_blocked:
         status_info["status"] = "error"
-        status_info["reason"] = f"状态检查失败: {str(e)}"
-        status_info["suggestions"] = ["无法验证页面状态", "尝试直接访问URL"]
+        status_info["reason"] = "IP被封禁"
+        status_info["anti_bot_detected"] = True
+        status_info["anti_bot_type"] = "ip_blocked"
+        status_info["checks"].append("检测到IP封禁提示")
+        status_info["suggestions"] = [
+            "❌ IP已被封禁",
+            "🚫 必须更换IP才能继续",
+            "⏰ 建议等待较长时间后重试（1小时以上）",
+            "🔄 使用代理或更换网络",
+            "🔍 尝试使用其他搜索引擎",
+        ]
+        logger.warning("🚨 检测到IP封禁")
         return status_info
 
+    # 检查是否需要登录
+    if snapshot.needs_login:
+        status_info["status"] = "warning"
+        status_info["reason"] = "页面可能需要登录"
+        status_info["checks"].append("检测到登录提示")
+        status_info["suggestions"] = [
+            "页面需要登录才能访问",
+            "尝试搜索公开的内容",
+            "寻找其他来源",
+        ]
+        return status_info
+
+    # 检查页面是否为空
+    if snapshot.text_length < 100:
+        status_info["status"] = "warning"
+        status_info["reason"] = "页面内容过少"
+        status_info["checks"].append(f"页面文本长度: {snapshot.text_length}")
+        status_info["suggestions"] = [
+            "页面内容过少",
+            "可能是加载中或内容被限制",
+            "尝试等待或使用其他来源",
+        ]
+        return status_info
+
+    # 所有检查通过
+    status_info["status"] = "ok"
+    status_info["reason"] = "页面状态正常"
+    status_info["checks"].append("页面加载正常")
+    status_info["anti_bot_detected"] = False
+
+    return status_info
+
 
 def _assess_content_quality(content: str, title: str, content_length: int) -> dict:
     """评估内容质量
@@ -1318,17 +1906,16 @@ def _get_suggestions(status: dict) -> list[str]:
     return suggestions
 
 
-async def baidu_hot_search() -> str:
+async def baidu_hot_search() -> HotSearchResponse:
     """获取百度热搜榜"""
     logger.info("🔥 [百度热搜榜] 获取热搜榜单")
 
-    await _rate_limiter.acquire()
+    hot_url = "https://top.baidu.com/board?tab=realtime"
+    await _rate_limiter.acquire(domain=urlparse(hot_url).netloc)
 
     try:
-        hot_url = "https://top.baidu.com/board?tab=realtime"
 
-        user_agent = get_random_user_agent()
-        async with _browser_pool.get_page(user_agent=user_agent) as page:
+        async with _browser_pool.get_page() as page:
             await page.goto(hot_url, timeout=30000)
 
             hot_items = await page.evaluate(
@@ -1366,15 +1953,75 @@ async def baidu_hot_search() -> str:
 
         logger.info(f"✅ 热搜榜获取完成: {len(hot_items)} 条")
 
-        return json.dumps(
-            {"total": len(hot_items), "hot_items": hot_items},
-            ensure_ascii=False,
-            indent=2,
-        )
+        return {"total": len(hot_items), "hot_items": hot_items}
 
     except Exception as e:
         logger.error(f"❌ 获取百度热搜失败: {e}")
-        return json.dumps(
-            {"total": 0, "hot_items": [], "error": str(e)},
-            ensure_ascii=False,
-        )
+        return {"total": 0, "hot_items": [], "error": str(e)}
+
+
+async def warm_start() -> None:
+    """后台预热：启动浏览器和前几个引擎的 Context、正文提取进程池，可选预连接搜索引擎
+
+    由服务启动时（lifespan）在后台调用，各阶段并发执行，耗时和错误记录到启动统计中。
+    预热期间到达的请求不会等待预热完成：浏览器启动等操作有锁保护，请求与预热共享同一次启动。
+    """
+    _startup_stats.warm_started_at = time.perf_counter()
+    logger.info("🔥 开始后台预热...")
+
+    async def _stage(name: str, coro) -> None:
+        start = time.perf_counter()
+        error = None
+        try:
+            detail = await coro
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            detail = None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _startup_stats.record_stage(name, elapsed_ms, error)
+        if error:
+            logger.warning(f"⚠️ 预热阶段 {name} 失败 [{elapsed_ms:.0f}ms]: {error}")
+        else:
+            suffix = f", {detail}" if detail is not None else ""
+            logger.info(f"   ✅ 预热阶段 {name} 完成 [{elapsed_ms:.0f}ms{suffix}]")
+
+    engines = _engine_factory.get_engines_by_priority()
+    stages = [
+        _stage("browser", _browser_pool.warm_up(engines[: _settings.warm_start_contexts])),
+        _stage("extraction_pool", _extraction_pool.start()),
+    ]
+    if _settings.warm_start_preconnect:
+        urls = []
+        for engine in engines:
+            urls.extend(url for url in (engine.config.search_url, engine.config.news_url) if url)
+        stages.append(_stage("preconnect", _http_client.preconnect(urls)))
+
+    await asyncio.gather(*stages)
+    _startup_stats.warm_done_at = time.perf_counter()
+    total_ms = (_startup_stats.warm_done_at - _startup_stats.warm_started_at) * 1000
+    logger.info(f"🔥 后台预热完成 [{total_ms:.0f}ms]")
+
+
+def get_service_stats() -> dict:
+    """汇总服务运行统计（启动预热、浏览器池、HTTP、正文提取、缓存、请求合并、对冲、引擎排序与禁用记录、限流、输出大小）"""
+    return {
+        "startup": _startup_stats.to_dict(),
+        "browser_pool": _browser_pool.get_stats(),
+        "readiness": get_readiness_stats().get_stats(),
+        "http": get_http_stats().to_dict(),
+        "extraction_pool": _extraction_pool.get_stats(),
+        "search_cache": _search_cache.get_stats(),
+        "article_cache": _article_cache.get_stats(),
+        "coalescing": {
+            "search": _search_flights.get_stats(),
+            "article": _article_flights.get_stats(),
+        },
+        "hedging": {
+            **_hedge_stats.to_dict(),
+            "engine_latency": _engine_latency.get_stats(),
+        },
+        "engine_ranking": _engine_factory.get_ranking_stats(),
+        "engine_registry": _engine_registry.get_stats(),
+        "rate_limiter": _rate_limiter.get_stats(),
+        "payload": get_payload_stats().get_stats(),
+    }
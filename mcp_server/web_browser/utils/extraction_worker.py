@@ -0,0 +1,74 @@
+"""正文提取 worker 进程入口 - ``python -m mcp_server.web_browser.utils.extraction_worker``
+
+由 ``core.extraction_pool`` 以独立子进程启动，不经过 multiprocessing 的 spawn 流程，
+因此不会在子进程里重新导入服务主模块（FastMCP、工具单例、引擎注册表等）。
+
+通信协议（stdin / stdout，4 字节大端长度前缀 + pickle）：
+
+- 启动后预加载依赖，发送一个空帧表示就绪
+- 请求：``(fn, args)``；响应：``(True, (开始时间戳, 结果, 执行耗时秒))`` 或 ``(False, 错误描述)``
+- stdin 关闭（父进程退出或回收 worker）时退出
+
+协议使用启动时复制出的 stdout 描述符，原 stdout 重定向到 stderr，
+解析库的 print 输出不会破坏协议。
+"""
+
+import os
+import pickle
+import struct
+import sys
+
+from .html_extract import run_timed, warm_up
+
+HEADER = struct.Struct("!I")
+
+
+def encode_frame(obj) -> bytes:
+    """序列化为带长度前缀的帧（obj 为 None 时为空帧）"""
+    data = b"" if obj is None else pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return HEADER.pack(len(data)) + data
+
+
+def _read_exactly(stream, size: int) -> bytes:
+    """读取指定字节数，遇到 EOF 时返回已读部分"""
+    chunks = []
+    while size > 0:
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def main() -> None:
+    """worker 主循环：逐个执行请求并返回结果"""
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    inp = sys.stdin.buffer
+
+    warm_up()
+    out.write(encode_frame(None))
+    out.flush()
+
+    while True:
+        header = _read_exactly(inp, HEADER.size)
+        if len(header) < HEADER.size:
+            return
+        (size,) = HEADER.unpack(header)
+        fn, args = pickle.loads(_read_exactly(inp, size))
+        try:
+            response = (True, run_timed(fn, *args))
+        except Exception as e:
+            response = (False, f"{type(e).__name__}: {e}")
+        try:
+            frame = encode_frame(response)
+        except Exception as e:  # 结果无法序列化
+            frame = encode_frame((False, f"结果无法序列化: {e}"))
+        out.write(frame)
+        out.flush()
+
+
+if __name__ == "__main__":
+    main()
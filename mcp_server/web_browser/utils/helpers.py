@@ -2,6 +2,7 @@
 
 import random
 from dataclasses import asdict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from ..config.settings import get_settings
 
@@ -12,6 +13,25 @@ def get_random_user_agent() -> str:
     return random.choice(settings.user_agents)
 
 
+# 不影响页面内容的跟踪参数（规范化 URL 时移除）
+_TRACKING_PARAMS = {"spm", "share_token", "wfr", "tt_from", "fbclid", "gclid", "from_source"}
+
+
+def canonicalize_url(url: str) -> str:
+    """规范化 URL（用于缓存与去重）：小写协议和域名、去掉默认端口、片段和跟踪参数"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme == "http" and netloc.endswith(":80")) or (scheme == "https" and netloc.endswith(":443")):
+        netloc = netloc.rsplit(":", 1)[0]
+    query = urlencode([
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    ])
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
 def search_result_to_dict(result) -> dict:
     """将 SearchResult 转换为字典"""
     if hasattr(result, 'to_dict'):
@@ -0,0 +1,223 @@
+"""文章 HTML 提取流水线 - 纯 CPU 计算，可在子进程中执行
+
+每个页面只解析一次 lxml 文档树，标题、元数据、图片、正文等提取阶段依次作用于
+同一棵树，并分别记录耗时。这里的函数只接收 HTML 字符串、返回可序列化的结果，
+不依赖浏览器和配置，由 ``core.extraction_pool`` 放到进程池中执行，避免阻塞事件循环。
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+from urllib.parse import urljoin
+
+from loguru import logger
+
+from .html_parser import first, has_class, parse_document
+
+# 文章标题 XPath（按优先级，与浏览器端 TITLE_SELECTORS 等价）
+TITLE_XPATHS = (
+    "//h1",
+    f"//*[{has_class('article-title')}]",
+    f"//*[{has_class('news-title')}]",
+    f"//*[{has_class('title')}]",
+    "//*[contains(@class, 'title')]",
+    "//*[@id='title']",
+)
+
+# 正文区域图片（与浏览器端 CONTENT_IMAGE_SELECTOR 等价）
+CONTENT_IMAGE_XPATH = (
+    f"//article//img | //*[{has_class('content')}]//img | //*[{has_class('article-content')}]//img"
+    f" | //main//img | //*[{has_class('news-content')}]//img | //*[contains(@class, 'content')]//img"
+)
+
+# 图片 URL 中出现即视为图标/跟踪像素的关键词
+_IMAGE_SKIP_KEYWORDS = ("icon", "logo", "pixel", "tracking", "avatar")
+
+# 元数据中保留的字段
+_METADATA_FIELDS = ("title", "author", "date", "sitename", "description", "image")
+
+
+@dataclass
+class ExtractionResult:
+    """一次文章提取的结果（可跨进程传递）"""
+    title: str = ""
+    content: str = ""
+    metadata: Dict[str, str] = field(default_factory=dict)
+    images: List[dict] = field(default_factory=list)
+    timings_ms: Dict[str, float] = field(default_factory=dict)  # 各阶段耗时（含 parse）
+
+
+# 提取阶段：(文档树, 基础URL, 结果) -> None，直接写入结果
+ExtractionStage = Callable[[object, str, ExtractionResult], None]
+
+
+def warm_up() -> None:
+    """预加载重量级依赖（进程池 worker 的初始化函数）"""
+    try:
+        import trafilatura  # noqa: F401
+    except ImportError:
+        pass
+
+
+def _int_attr(value: Optional[str]) -> int:
+    """解析 width/height 属性（如 "640"、"640px"），无法解析时返回 0"""
+    match = re.match(r"\s*(\d+)", value or "")
+    return int(match.group(1)) if match else 0
+
+
+def _title_stage(root, base_url: str, result: ExtractionResult) -> None:
+    """按优先级选择器提取文章标题"""
+    for xpath in TITLE_XPATHS:
+        node = first(root.xpath(xpath))
+        if node is not None:
+            title_text = node.text_content().strip()
+            if len(title_text) > 5:
+                logger.info(f"   📰 标题: {title_text[:50]}...")
+                result.title = title_text
+                return
+
+
+def _metadata_stage(root, base_url: str, result: ExtractionResult) -> None:
+    """使用 trafilatura 提取元数据（作者、日期、站点名、主图等）"""
+    try:
+        from trafilatura import extract_metadata
+    except ImportError:
+        return
+
+    metadata = extract_metadata(root, default_url=base_url or None)
+    if metadata is None:
+        return
+    # trafilatura >= 1.5 返回 Document 对象，旧版本返回字典
+    values = metadata.as_dict() if hasattr(metadata, "as_dict") else dict(metadata)
+    result.metadata = {key: str(values[key]) for key in _METADATA_FIELDS if values.get(key)}
+
+
+def _images_stage(root, base_url: str, result: ExtractionResult) -> None:
+    """提取正文区域图片，没有时使用元数据中的主图（og:image）
+
+    静态 HTML 没有渲染尺寸，只在 width/height 属性存在时过滤小图。
+    """
+    images = []
+    seen = set()
+    for img in root.xpath(CONTENT_IMAGE_XPATH):
+        src = (img.get("src") or img.get("data-src") or "").strip()
+        if not src or src.startswith("data:"):
+            continue
+        full_url = urljoin(base_url, src)
+        if (
+            full_url in seen
+            or len(full_url) < 20
+            or any(keyword in full_url.lower() for keyword in _IMAGE_SKIP_KEYWORDS)
+        ):
+            continue
+
+        width = _int_attr(img.get("width"))
+        height = _int_attr(img.get("height"))
+        if (width and width <= 50) or (height and height <= 50):
+            continue
+
+        seen.add(full_url)
+        images.append({
+            "index": len(images) + 1,
+            "url": full_url,
+            "alt": img.get("alt", ""),
+            "title": img.get("title", ""),
+            "width": width,
+            "height": height,
+        })
+
+    if not images and result.metadata.get("image"):
+        images.append({"index": 1, "url": result.metadata["image"], "alt": "", "width": 0, "height": 0})
+        logger.info(f"   ✅ 使用元数据主图: {result.metadata['image']}")
+    elif images:
+        logger.info(f"   ✅ 正文区域提取到 {len(images)} 个有效图片")
+    result.images = images
+
+
+def _content_stage(root, base_url: str, result: ExtractionResult) -> None:
+    """使用 trafilatura 提取正文（会修改文档树，必须最后执行）"""
+    try:
+        import trafilatura
+    except ImportError:
+        logger.warning("   ⚠️ trafilatura 未安装")
+        return
+
+    content = trafilatura.extract(
+        root,
+        url=base_url or None,
+        include_comments=False,
+        include_tables=True,
+        no_fallback=False,
+        favor_precision=False,
+        favor_recall=True,
+    )
+
+    if content and len(content.strip()) > 100:
+        logger.info(f"   ✅ trafilatura 提取成功，长度: {len(content)} 字符")
+        result.content = content.strip()
+    else:
+        logger.warning("   ⚠️ trafilatura 提取内容过少")
+
+
+# 可用的提取阶段（worker 进程中按名称查找，调用方只传递名称）
+EXTRACTION_STAGES: Dict[str, ExtractionStage] = {
+    "title": _title_stage,
+    "metadata": _metadata_stage,
+    "images": _images_stage,
+    "content": _content_stage,
+}
+
+# 会修改文档树的阶段，总是放在最后执行
+_TREE_MUTATING_STAGES = ("content",)
+
+DEFAULT_STAGES = ("title", "metadata", "images", "content")
+
+
+def extract_article(
+    html: str,
+    base_url: str = "",
+    stages: Sequence[str] = DEFAULT_STAGES,
+) -> ExtractionResult:
+    """解析一次 HTML，依次执行各提取阶段
+
+    Args:
+        html: 页面 HTML
+        base_url: 页面URL（用于处理相对路径）
+        stages: 要执行的阶段名称（见 EXTRACTION_STAGES）；会修改文档树的阶段总是最后执行
+
+    Returns:
+        ExtractionResult: 提取结果；单个阶段失败只记录日志，不影响其他阶段
+    """
+    result = ExtractionResult()
+    start = time.perf_counter()
+    try:
+        root = parse_document(html)
+    except Exception as e:
+        logger.warning(f"   ⚠️ HTML 解析失败: {e}")
+        return result
+    result.timings_ms["parse"] = (time.perf_counter() - start) * 1000
+
+    ordered = [name for name in stages if name not in _TREE_MUTATING_STAGES]
+    ordered += [name for name in _TREE_MUTATING_STAGES if name in stages]
+    for name in ordered:
+        stage = EXTRACTION_STAGES.get(name)
+        if stage is None:
+            logger.warning(f"   ⚠️ 未知的提取阶段: {name}")
+            continue
+        start = time.perf_counter()
+        try:
+            stage(root, base_url, result)
+        except Exception as e:
+            logger.warning(f"   ⚠️ 提取阶段 {name} 失败: {e}")
+        result.timings_ms[name] = (time.perf_counter() - start) * 1000
+
+    return result
+
+
+def run_timed(fn, *args):
+    """在 worker 中执行函数并返回 (开始时间戳, 结果, 执行耗时秒)，用于统计排队与执行时间"""
+    started_at = time.time()
+    start = time.perf_counter()
+    result = fn(*args)
+    return started_at, result, time.perf_counter() - start
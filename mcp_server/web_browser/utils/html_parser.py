@@ -0,0 +1,55 @@
+"""HTML 解析辅助函数 - 基于 lxml 的静态页面解析
+
+供 HTTP 快速路径使用：语义与浏览器端 ``querySelector`` / ``innerText`` 保持一致，
+便于引擎的浏览器解析脚本与 lxml 解析逻辑一一对应。
+"""
+
+import re
+from typing import List, Optional
+
+from lxml import html as lxml_html
+
+# 不计入可见文本的元素（对应 innerText 的行为）
+_SKIP_TEXT_TAGS = {"script", "style", "noscript", "template"}
+
+# XML 声明（XHTML 页面常见）：lxml 不接受带 encoding 声明的 str，文本已解码，直接去掉
+_XML_DECLARATION_RE = re.compile(r"^[\s\ufeff]*<\?xml[^>]*\?>", re.IGNORECASE)
+
+
+def parse_document(text: str):
+    """解析 HTML 文档，返回根元素（已解码的文本，开头的 XML 声明会被忽略）"""
+    return lxml_html.document_fromstring(_XML_DECLARATION_RE.sub("", text, count=1))
+
+
+def has_class(name: str) -> str:
+    """生成匹配 class 中包含指定类名的 XPath 条件（等价于 CSS 的 .name）"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def first(nodes: List) -> Optional[object]:
+    """取 XPath 结果的第一个节点"""
+    return nodes[0] if nodes else None
+
+
+def element_text(element) -> str:
+    """获取元素的可见文本（忽略脚本/样式，合并空白，近似 innerText.trim()）"""
+    if element is None:
+        return ""
+    chunks: List[str] = []
+
+    def walk(node) -> None:
+        if isinstance(node.tag, str) and node.tag not in _SKIP_TEXT_TAGS:
+            if node.text:
+                chunks.append(node.text)
+            for child in node:
+                walk(child)
+                if child.tail:
+                    chunks.append(child.tail)
+
+    walk(element)
+    return " ".join("".join(chunks).split())
+
+
+def page_title(root) -> str:
+    """获取文档标题"""
+    return element_text(first(root.xpath("//title")))
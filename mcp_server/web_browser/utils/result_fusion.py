@@ -0,0 +1,111 @@
+"""多引擎结果融合 - 倒数排名融合（RRF）与去重
+
+并发查询多个引擎后，把各引擎的结果列表合并为一个列表：
+
+- 去重：规范化 URL 相同，或规范化标题相同（百度等引擎返回跳转链接，URL 无法直接比较）
+- 排序：倒数排名融合，得分为各引擎排名的 ``1 / (k + rank)`` 之和，
+  多个引擎都靠前返回的结果排在前面
+- 每条结果记录返回它的引擎及在各引擎中的排名
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .helpers import canonicalize_url
+
+# 标题中站点后缀的分隔符（如 "标题 - 新浪新闻"、"标题_网易新闻"）
+_TITLE_SUFFIX_SEPARATORS = re.compile(r"\s[-–—|]\s|_|\|")
+
+# 去掉标点、空白和引擎截断标题时加的省略号
+_TITLE_NOISE = re.compile(r"[\W_]+|\.\.\.|…")
+
+# 规范化后短于该长度的标题不参与去重（避免"首页"、"新闻"等通用标题误合并）
+MIN_TITLE_KEY_LENGTH = 8
+
+
+def normalize_title(title: str) -> str:
+    """规范化标题（用于去重）：去掉站点后缀、标点和空白，全角/半角统一，大小写折叠"""
+    text = unicodedata.normalize("NFKC", title or "").casefold()
+    head = _TITLE_SUFFIX_SEPARATORS.split(text, maxsplit=1)[0]
+    # 分隔符前的部分过短时说明分隔符是标题本身的一部分
+    if len(_TITLE_NOISE.sub("", head)) >= MIN_TITLE_KEY_LENGTH:
+        text = head
+    return _TITLE_NOISE.sub("", text)
+
+
+@dataclass
+class FusedHit:
+    """融合后的一条结果"""
+    result: dict  # 代表结果（排名最靠前的那条）
+    score: float = 0.0  # RRF 得分
+    best_rank: int = 0  # 各引擎中的最好排名（从 1 开始）
+    ranks: Dict[str, int] = field(default_factory=dict)  # {engine_id: rank}
+
+    def to_dict(self) -> dict:
+        """转换为字典（原结果字段 + engines / engine_ranks / rrf_score）"""
+        return {
+            **self.result,
+            "engines": list(self.ranks),
+            "engine_ranks": dict(self.ranks),
+            "rrf_score": round(self.score, 6),
+        }
+
+
+def fuse_results(
+    ranked_lists: Sequence[Tuple[str, List[dict]]],
+    k: int = 60,
+    limit: Optional[int] = None,
+) -> List[FusedHit]:
+    """用倒数排名融合合并多个引擎的结果
+
+    Args:
+        ranked_lists: [(engine_id, 该引擎按排名排列的结果列表)]，结果为 search_result_to_dict 的字典
+        k: RRF 平滑常数（越大，排名差异的影响越小）
+        limit: 返回的最大结果数（None 表示全部）
+
+    Returns:
+        按得分降序排列的融合结果；得分相同时按最好排名、再按返回的引擎数排序
+    """
+    hits: List[FusedHit] = []
+    by_url: Dict[str, int] = {}
+    by_title: Dict[str, int] = {}
+
+    for engine_id, results in ranked_lists:
+        for rank, result in enumerate(results, 1):
+            url = result.get("url") or ""
+            url_key = canonicalize_url(url) if url else ""
+            title_key = normalize_title(result.get("title") or "")
+            if len(title_key) < MIN_TITLE_KEY_LENGTH:
+                title_key = ""
+
+            index = by_url.get(url_key) if url_key else None
+            if index is None and title_key:
+                index = by_title.get(title_key)
+
+            if index is None:
+                index = len(hits)
+                hits.append(FusedHit(result=dict(result), best_rank=rank))
+            hit = hits[index]
+            if url_key:
+                by_url.setdefault(url_key, index)
+            if title_key:
+                by_title.setdefault(title_key, index)
+
+            # 同一引擎重复返回的结果只计最好排名
+            if engine_id in hit.ranks:
+                continue
+            hit.ranks[engine_id] = rank
+            hit.score += 1.0 / (k + rank)
+            if rank < hit.best_rank:
+                # 排名更靠前的结果作为代表，保留原代表中非空的补充字段
+                hit.result = {**hit.result, **{key: value for key, value in result.items() if value}}
+                hit.best_rank = rank
+            else:
+                for key, value in result.items():
+                    if value and not hit.result.get(key):
+                        hit.result[key] = value
+
+    hits.sort(key=lambda hit: (-hit.score, hit.best_rank, -len(hit.ranks)))
+    return hits[:limit] if limit is not None else hits
@@ -20,8 +20,7 @@ async def check_fetch_images():
     print(f"测试提取图片: {test_url}")
     print("="*60 + "\n")
 
-    result_str = await fetch_article_content(test_url, include_images=True)
-    result = json.loads(result_str)
+    result = await fetch_article_content(test_url, include_images=True)
 
     print(f"标题: {result.get('title', '')[:100]}...")
     print(f"内容长度: {result.get('content_length', 0)} 字符")
@@ -50,7 +49,7 @@ async def check_database_save():
     print("  - URL: https://test.example.com/test-image-002")
     print(f"  - 网络图片URL参数: {test_image_urls}")
 
-    result_str = await save_news_tool(
+    result = await save_news_tool(
         title="测试新闻标题",
         url="https://test.example.com/test-image-002",
         summary="测试摘要",
@@ -59,13 +58,11 @@ async def check_database_save():
         image_urls=test_image_urls
     )
 
-    result = json.loads(result_str)
     print(f"\n保存结果: {json.dumps(result, indent=2, ensure_ascii=False)}")
 
     # 验证保存后的数据
     from mcp_server.news_storage.tools.storage_tools import get_news_by_url_tool
-    saved_news_str = await get_news_by_url_tool("https://test.example.com/test-image-002")
-    saved_news = json.loads(saved_news_str)
+    saved_news = await get_news_by_url_tool("https://test.example.com/test-image-002")
 
     if saved_news.get("found"):
         news_data = saved_news["data"]
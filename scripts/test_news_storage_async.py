@@ -3,7 +3,6 @@
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
 
@@ -169,28 +168,26 @@ async def test_storage_tools():
     logger.info("\n🔧 测试存储工具函数...")
 
     # 测试保存新闻工具
-    result = json.loads(
-        await save_news_tool(
-            title="工具函数测试新闻",
-            url="https://example.com/tool-test",
-            summary="这是通过工具函数保存的新闻",
-            source="测试源",
-            keywords='["测试", "工具"]',
-            tags='["测试"]',
-        )
+    result = await save_news_tool(
+        title="工具函数测试新闻",
+        url="https://example.com/tool-test",
+        summary="这是通过工具函数保存的新闻",
+        source="测试源",
+        keywords='["测试", "工具"]',
+        tags='["测试"]',
     )
     logger.info(f"✅ 保存工具结果: {result}")
 
     # 测试获取新闻工具
-    result = json.loads(await get_news_by_url_tool("https://example.com/tool-test"))
+    result = await get_news_by_url_tool("https://example.com/tool-test")
     logger.info(f"✅ 获取工具结果: found={result.get('found')}")
 
     # 测试搜索工具
-    result = json.loads(await search_news_tool(search="测试 工具", limit=10))
+    result = await search_news_tool(search="测试 工具", limit=10)
     logger.info(f"✅ 搜索工具结果: count={result.get('count')}")
 
     # 测试最近新闻工具
-    result = json.loads(await get_recent_news_tool(limit=3))
+    result = await get_recent_news_tool(limit=3)
     logger.info(f"✅ 最近新闻工具结果: count={result.get('count')}")
 
 
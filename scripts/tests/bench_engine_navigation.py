@@ -0,0 +1,106 @@
+"""
+单次导航协议基准测试
+
+对比每个搜索引擎在两种导航方式下的耗时，并输出就绪等待的 p50/p95：
+- legacy: 旧流程，框架先访问一次结果页，引擎再访问一次（两次导航）
+- single: 新流程，框架只导航一次，引擎只负责等待就绪和解析
+
+用法:
+    python scripts/tests/bench_engine_navigation.py [关键词] [重复次数] [引擎ID...]
+"""
+
+import sys
+import io
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+# 修复 Windows 控制台编码问题
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+from mcp_server.web_browser.config.settings import get_settings
+from mcp_server.web_browser.core.browser_pool import get_browser_pool, close_global_browser_pool
+from mcp_server.web_browser.core.readiness import get_readiness_stats
+from mcp_server.web_browser.engines.factory import EngineFactory
+
+
+async def run_once(pool, engine, query: str, double_navigation: bool) -> Dict:
+    """执行一次搜索并计时"""
+    url = engine.get_search_url(query, 10, "news")
+    start = time.perf_counter()
+    async with pool.get_page(engine=engine) as page:
+        await engine.navigate(page, url)
+        if double_navigation:
+            # 模拟旧流程中引擎自己的第二次 goto
+            await engine.navigate(page, url)
+        await engine.wait_until_ready(page, 10, "news")
+        results = await engine.parse(page, query, 10, "news")
+    return {"elapsed": time.perf_counter() - start, "total": len(results)}
+
+
+async def bench_engine(pool, engine, query: str, repeat: int) -> Dict:
+    """对单个引擎进行两种模式的交替测试"""
+    timings: Dict[str, List[float]] = {"legacy": [], "single": []}
+    for i in range(repeat):
+        for mode in ("legacy", "single"):
+            try:
+                result = await run_once(pool, engine, query, double_navigation=(mode == "legacy"))
+                timings[mode].append(result["elapsed"])
+                print(f"   [{mode:6}] 第{i + 1}次: {result['elapsed']:.2f}s, {result['total']} 条结果")
+            except Exception as e:
+                print(f"   [{mode:6}] 第{i + 1}次失败: {e}")
+
+    summary = {"engine": engine.engine_id}
+    for mode, values in timings.items():
+        summary[mode] = statistics.median(values) if values else None
+    if summary["legacy"] and summary["single"]:
+        summary["saved"] = summary["legacy"] - summary["single"]
+        summary["saved_pct"] = summary["saved"] / summary["legacy"] * 100
+    return summary
+
+
+async def main():
+    query = sys.argv[1] if len(sys.argv) > 1 else "人工智能"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    engine_ids = sys.argv[3:] or get_settings().enabled_engines
+
+    pool = get_browser_pool()
+    factory = EngineFactory(enabled_engines=engine_ids)
+
+    summaries = []
+    try:
+        for engine_id in engine_ids:
+            engine = factory.get_engine(engine_id)
+            if not engine:
+                continue
+            print(f"\n{'=' * 60}\n{engine.config.name} ({engine_id})\n{'=' * 60}")
+            summaries.append(await bench_engine(pool, engine, query, repeat))
+    finally:
+        await close_global_browser_pool()
+
+    print(f"\n{'=' * 60}\n中位数耗时对比\n{'=' * 60}")
+    print(f"{'引擎':<10}{'legacy(s)':>12}{'single(s)':>12}{'节省(s)':>10}{'节省%':>8}")
+    for s in summaries:
+        if s.get("saved") is None:
+            print(f"{s['engine']:<10}{'-':>12}{'-':>12}{'-':>10}{'-':>8}")
+            continue
+        print(
+            f"{s['engine']:<10}{s['legacy']:>12.2f}{s['single']:>12.2f}"
+            f"{s['saved']:>10.2f}{s['saved_pct']:>7.1f}%"
+        )
+
+    print(f"\n{'=' * 60}\n就绪等待统计（毫秒，saved 为相对旧固定等待节省的时间）\n{'=' * 60}")
+    for engine_id, stats in get_readiness_stats().get_stats().items():
+        wait = stats["wait_ms"]
+        line = f"{engine_id:<10} wait p50={wait['p50']} p95={wait['p95']} timeouts={stats['timeouts']}"
+        if "saved_ms" in stats:
+            saved = stats["saved_ms"]
+            line += f"  saved p50={saved['p50']} p95={saved['p95']}"
+        print(line)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -30,9 +30,7 @@ async def test_single_download():
     # 使用一个公开的测试图片
     test_url = "https://httpbin.org/image/png"
 
-    result = await download_file(test_url, save_path="./test_downloads")
-
-    result_dict = json.loads(result)
+    result_dict = await download_file(test_url, save_path="./test_downloads")
     print(f"\n结果: {json.dumps(result_dict, indent=2, ensure_ascii=False)}")
 
     if result_dict.get("success"):
@@ -54,9 +52,7 @@ async def test_batch_download():
         "https://httpbin.org/image/svg",
     ]
 
-    result = await download_files(test_urls, save_path="./test_downloads")
-
-    result_dict = json.loads(result)
+    result_dict = await download_files(test_urls, save_path="./test_downloads")
     print(f"\n结果: {json.dumps(result_dict, indent=2, ensure_ascii=False)}")
 
     print(f"\n总计: {result_dict['total']}")
@@ -82,11 +78,9 @@ async def test_extract_from_html():
     </html>
     """
 
-    result = await download_images_from_html(
+    result_dict = await download_images_from_html(
         test_html, save_path="./test_downloads/images"
     )
-
-    result_dict = json.loads(result)
     print(f"\n结果: {json.dumps(result_dict, indent=2, ensure_ascii=False)}")
 
     print(f"\n找到图片: {result_dict['total']}")
@@ -103,11 +97,9 @@ async def test_extract_from_url():
     # 使用一个简单的测试网页
     test_url = "https://httpbin.org/html"
 
-    result = await download_images_from_url(
+    result_dict = await download_images_from_url(
         test_url, save_path="./test_downloads/from_url"
     )
-
-    result_dict = json.loads(result)
     print(f"\n结果: {json.dumps(result_dict, indent=2, ensure_ascii=False)}")
 
     print(f"\n找到图片: {result_dict.get('total', 0)}")
@@ -50,10 +50,7 @@ async def test_fetch_article_with_images(urls, save_result=True):
         try:
             # 调用 fetch_article_content 获取文章内容和图片链接
             print("  正在获取文章内容...")
-            result_json = await fetch_article_content(url, include_images=True)
-
-            # 解析结果
-            result = json.loads(result_json)
+            result = await fetch_article_content(url, include_images=True)
 
             # 提取信息
             article_title = result.get('title', '无标题')
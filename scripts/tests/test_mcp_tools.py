@@ -4,7 +4,6 @@
 """
 import sys
 import io
-import json
 import asyncio
 
 # 修复 Windows 控制台编码问题
@@ -25,8 +24,7 @@ async def test_search():
     print("测试1: 百度新闻搜索 - '人工智能最新进展'")
     print("=" * 60)
 
-    result_json = await baidu_news_search("人工智能最新进展", 5)
-    result = json.loads(result_json)
+    result = await baidu_news_search("人工智能最新进展", 5)
     print(f"\n搜索结果: {len(result.get('results', []))} 条新闻\n")
 
     for i, news in enumerate(result.get('results', [])[:3], 1):
@@ -44,8 +42,7 @@ async def test_fetch_content(url):
     print("测试2: 获取文章完整内容")
     print("=" * 60)
 
-    result_json = await fetch_article_content(url)
-    result = json.loads(result_json)
+    result = await fetch_article_content(url)
     print(f"\n标题: {result.get('title')}")
     print(f"内容长度: {result.get('content_length')} 字符")
     print(f"\n内容预览:\n{result.get('content', '')[:300]}...")
@@ -58,8 +55,7 @@ async def test_hot_search():
     print("测试3: 百度热搜榜")
     print("=" * 60)
 
-    result_json = await baidu_hot_search()
-    result = json.loads(result_json)
+    result = await baidu_hot_search()
     print(f"\n热搜总数: {result.get('total')}")
 
     print("\n前10名热点:")
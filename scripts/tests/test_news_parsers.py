@@ -7,7 +7,6 @@
 import sys
 import io
 import asyncio
-import json
 from pathlib import Path
 
 # 添加项目根目录到 Python 路径
@@ -77,10 +76,7 @@ async def test_news_search(engine_name: str, query: str, num_results: int = 10):
 
         # 调用 MCP 工具
         print(f"📡 调用 {engine_name}_news_search 工具...")
-        result_json = await search_func(query, num_results)
-
-        # 解析结果
-        result_data = json.loads(result_json)
+        result_data = await search_func(query, num_results)
 
         # 检查是否有错误
         if result_data.get("error"):
@@ -135,10 +131,7 @@ async def test_multi_engine_search(query: str, num_results: int = 10):
 
     try:
         print(f"📡 调用 multi_search 工具...")
-        result_json = await multi_search(query, "auto", num_results, "news")
-
-        # 解析结果
-        result_data = json.loads(result_json)
+        result_data = await multi_search(query, "auto", num_results, "news")
 
         # 检查是否有错误
         if result_data.get("error"):
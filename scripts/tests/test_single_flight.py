@@ -0,0 +1,90 @@
+"""
+测试请求合并（SingleFlight）的取消行为
+
+1. 部分等待者被取消：共享任务继续执行，其余等待者拿到结果
+2. 所有等待者都被取消：共享任务随之取消，并在取消返回前完成清理
+"""
+
+import sys
+import io
+import asyncio
+
+# 修复 Windows 控制台编码问题
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+from mcp_server.web_browser.core.single_flight import SingleFlight
+
+
+async def _partial_cancel():
+    flights = SingleFlight("test")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.2)
+        return "result"
+
+    waiters = [asyncio.create_task(flights.run("key", work)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    waiters[0].cancel()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == ["result", "result"]
+    assert len(calls) == 1
+    stats = flights.get_stats()
+    assert stats["executed"] == 1 and stats["coalesced"] == 2
+    assert stats["cancelled"] == 0 and stats["in_flight"] == 0
+
+
+async def _all_cancelled():
+    flights = SingleFlight("test")
+    events = []
+
+    async def work():
+        events.append("start")
+        try:
+            await asyncio.sleep(10)
+            events.append("finished")
+        finally:
+            await asyncio.sleep(0.05)  # 模拟释放页面
+            events.append("released")
+
+    waiters = [asyncio.create_task(flights.run("key", work)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    waiters[0].cancel()
+    await asyncio.sleep(0.05)
+    assert flights.get_stats()["in_flight"] == 1  # 仍有等待者，任务继续
+
+    waiters[1].cancel()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    # 最后一个等待者的取消返回时，共享任务已退出并完成清理
+    assert events == ["start", "released"]
+    stats = flights.get_stats()
+    assert stats["cancelled"] == 1 and stats["in_flight"] == 0
+
+    # 之后的相同请求重新执行
+    async def again():
+        return "fresh"
+
+    assert await flights.run("key", again) == "fresh"
+
+
+def test_partial_cancel_keeps_shared_task():
+    """部分等待者被取消，其余等待者仍拿到结果"""
+    asyncio.run(_partial_cancel())
+
+
+def test_all_cancelled_cancels_shared_task():
+    """所有等待者被取消，共享任务随之取消"""
+    asyncio.run(_all_cancelled())
+
+
+if __name__ == "__main__":
+    test_partial_cancel_keeps_shared_task()
+    print("✅ 部分等待者取消：其余等待者拿到结果")
+    test_all_cancelled_cancels_shared_task()
+    print("✅ 所有等待者取消：共享任务被取消并完成清理")
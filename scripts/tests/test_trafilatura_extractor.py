@@ -94,8 +94,7 @@ async def test_single_article(test_case: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         # 提取文章内容
-        result_json = await fetch_article_content(url, include_images=True)
-        data = json.loads(result_json)
+        data = await fetch_article_content(url, include_images=True)
 
         # 提取信息
         title = data.get("title", "")